@@ -0,0 +1,93 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_gemini import synthetic_words
+from models.candidate_trie import CandidateTrie, iter_store_sorted
+from models.user_info import UserInfo
+from models.wordlist_processor import WordlistProcessor
+
+
+def build_candidates(base_count: int) -> list:
+    # Gerçekçi dağılım: aynı temel kelimenin yüzlerce leet/ek varyasyonu ortak önek paylaşır
+    processor = WordlistProcessor(leet_combinations=True)
+    user_info = UserInfo(name='Ahmet', surname='Yilmaz', birth_year='1990', lucky_numbers='7,13')
+    with contextlib.redirect_stdout(io.StringIO()):
+        return list(processor.iter_variations(synthetic_words(base_count, seed=3), user_info,
+                                              full_expansion=True))
+
+
+def measure(name: str, factory, candidates: list, probes: list):
+    # Süre ve bellek ayrı ölçülür; tracemalloc ekleme süresini bozar
+    started = time.perf_counter()
+    store = factory()
+    for word in candidates:
+        store.add(word)
+    insert_seconds = time.perf_counter() - started
+    del store
+
+    tracemalloc.start()
+    store = factory()
+    for word in candidates:
+        store.add(word)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if isinstance(store, set):
+        # Set sadece referans tutar; kelime nesneleri de onunla birlikte bellekte kalır
+        memory += sum(sys.getsizeof(word) for word in store)
+
+    started = time.perf_counter()
+    hits = sum(1 for word in probes if word in store)
+    lookup_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    count = sum(1 for _ in iter_store_sorted(store))
+    sort_seconds = time.perf_counter() - started
+
+    megabytes_per_million = memory / count * 1_000_000 / 1024 / 1024
+    print(f"{name:<12} {memory / count:8.1f} B/kelime  {megabytes_per_million:8.1f} MB/milyon aday  "
+          f"ekleme {len(candidates) / insert_seconds:11,.0f}/sn  "
+          f"sorgu {len(probes) / lookup_seconds:11,.0f}/sn  "
+          f"sıralı gezinti {sort_seconds:5.2f} sn  ({hits:,} eşleşme)")
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tekrar eleme deposu: set ve trie bellek/hız karşılaştırması")
+    parser.add_argument('--base-words', type=int, default=3000, help="Genişletilecek temel kelime sayısı")
+    parser.add_argument('--probes', type=int, default=200_000, help="Sorgu sayısı")
+    parser.add_argument('--bucket-bytes', type=int, nargs='+', default=[1024, 4096],
+                        help="Denenecek trie kova boyutları")
+    args = parser.parse_args()
+
+    candidates = build_candidates(args.base_words)
+    unique = len(set(candidates))
+    half = args.probes // 2
+    probes = candidates[:half] + [word + '~' for word in candidates[half:args.probes]]
+    print(f"{len(candidates):,} aday ({unique:,} benzersiz)\n")
+
+    measure('set', set, candidates, probes)
+    for bucket_bytes in args.bucket_bytes:
+        trie = measure(f'trie {bucket_bytes}', lambda: CandidateTrie(bucket_bytes), candidates, probes)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'candidates.trie')
+        started = time.perf_counter()
+        trie.save(path)
+        save_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        loaded = CandidateTrie.load(path)
+        load_seconds = time.perf_counter() - started
+        print(f"\nkaydetme {save_seconds:.2f} sn, yükleme {load_seconds:.2f} sn "
+              f"({os.path.getsize(path) / 1024 / 1024:.1f} MB, {len(loaded):,} kelime)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_gemini import FakeGenerativeModel, synthetic_words
+from models.gemini_model import GeminiWordlistGenerator
+from models.user_info import UserInfo
+from models.wordlist_processor import WordlistProcessor
+
+DEFAULT_SIZES = [100, 10_000, 1_000_000]
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results', 'latest.json')
+
+PROFILE = UserInfo(
+    name='Ahmet', surname='Yilmaz', nickname='ahmety', birth_year='1990',
+    email='ahmet.yilmaz@example.com', phone='0532 123 45 67', city='Istanbul',
+    lucky_numbers='7, 53', pet_names='Maviş, Karabaş'
+)
+
+
+def run_stage(func, measure_memory: bool) -> dict:
+    # Süre ve bellek ayrı çalıştırmalarda ölçülür; tracemalloc süreyi bozmasın
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - started
+
+        peak_bytes = None
+        if measure_memory:
+            del result
+            tracemalloc.start()
+            result = func()
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    return {'seconds': round(seconds, 6), 'peak_bytes': peak_bytes}, result
+
+
+def bench_size(size: int, latency: float, measure_memory: bool, temp_dir: str) -> dict:
+    base_words = synthetic_words(size)
+    generator = GeminiWordlistGenerator(
+        'benchmark', 'fake-model', model=FakeGenerativeModel(latency=latency)
+    )
+    processor = WordlistProcessor()
+    results = {}
+
+    stats, ai_words = run_stage(lambda: generator.generate_base_words(PROFILE), measure_memory)
+    results['generate_base_words'] = dict(stats, items_out=len(ai_words))
+
+    stats, variations = run_stage(
+        lambda: WordlistProcessor().create_variations(base_words, PROFILE), measure_memory
+    )
+    results['create_variations'] = dict(stats, items_in=size, items_out=len(variations))
+
+    stats, leet_words = run_stage(
+        lambda: [processor._to_leet_speak(word) for word in base_words], measure_memory
+    )
+    results['to_leet_speak'] = dict(stats, items_in=size, items_out=len(leet_words))
+
+    stats, enhanced = run_stage(lambda: generator.enhance_wordlist(base_words), measure_memory)
+    results['enhance_wordlist'] = dict(stats, items_out=len(enhanced))
+
+    all_words = base_words + variations + enhanced
+    stats, final_wordlist = run_stage(lambda: processor.clean_and_filter(all_words), measure_memory)
+    results['clean_and_filter'] = dict(stats, items_in=len(all_words), items_out=len(final_wordlist))
+
+    output_file = os.path.join(temp_dir, f'bench_{size}.txt')
+    stats, saved = run_stage(lambda: processor.save_wordlist(final_wordlist, output_file), measure_memory)
+    results['save_wordlist'] = dict(stats, items_out=saved, bytes=os.path.getsize(output_file))
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            previous = baseline.get('results', {}).get(size, {}).get(stage)
+            if not previous or not previous.get('seconds'):
+                continue
+            ratio = current['seconds'] / previous['seconds']
+            flag = '  ⚠️  YAVAŞLAMA' if ratio > threshold else ''
+            print(f"{size:>10} {stage:<22} {previous['seconds']:10.4f} → {current['seconds']:10.4f} sn"
+                  f"  ({ratio:5.2f}x){flag}")
+            if ratio > threshold:
+                regressions.append((size, stage, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wordlist üretim hattı performans ölçümü (çevrimdışı)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Sentetik temel kelime kümesi boyutları")
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="Sahte Gemini modelinin her çağrıdaki gecikmesi (sn)")
+    parser.add_argument('--skip-memory', action='store_true', help="Tepe bellek ölçümünü atla")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Sonuç JSON dosyası")
+    parser.add_argument('--baseline', help="Karşılaştırılacak önceki sonuç JSON dosyası")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Bu oranın üstündeki yavaşlamalar gerileme sayılır")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            print(f"⏱️  {size:,} kelime ölçülüyor...")
+            results[str(size)] = bench_size(size, args.latency, not args.skip_memory, temp_dir)
+            for stage, stats in results[str(size)].items():
+                peak = f"{stats['peak_bytes'] / 1024 / 1024:9.1f} MB" if stats['peak_bytes'] is not None else ''
+                print(f"   {stage:<22} {stats['seconds']:10.4f} sn {peak}")
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'latency': args.latency,
+        },
+        'results': results,
+    }
+
+    directory = os.path.dirname(os.path.abspath(args.output))
+    os.makedirs(directory, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"\n💾 Sonuçlar kaydedildi: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n📊 Temel ölçüm ile karşılaştırma ({args.baseline}):")
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_gemini import synthetic_words
+from models.external_sort import write_lines
+from models.reference_index import ReferenceIndex
+
+
+def measure(name: str, index: ReferenceIndex, probes: list):
+    started = time.perf_counter()
+    hits = sum(1 for word in probes if word in index)
+    seconds = time.perf_counter() - started
+    print(f"{name:<26} {len(probes) / seconds:12,.0f} sorgu/sn  ({hits:,} eşleşme)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Referans dizini oluşturma ve sorgu verimi")
+    parser.add_argument('--count', type=int, default=1_000_000, help="Dizindeki kelime sayısı")
+    parser.add_argument('--probes', type=int, default=200_000, help="Sorgu sayısı")
+    parser.add_argument('--hit-ratio', type=float, default=0.1, help="Dizinde bulunan sorgu oranı")
+    args = parser.parse_args()
+
+    words = synthetic_words(args.count, seed=7)
+    known = int(args.probes * args.hit_ratio)
+    probes = words[:known] + [word + '~' for word in synthetic_words(args.probes - known, seed=8)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = os.path.join(temp_dir, 'source.txt')
+        write_lines(words, source)
+        for bits in (0, 10):
+            path = os.path.join(temp_dir, f'reference_{bits}.idx')
+            started = time.perf_counter()
+            index = ReferenceIndex.build([source], path, bloom_bits_per_item=bits)
+            print(f"oluşturma (Bloom {bits:>2} bit)    {time.perf_counter() - started:8.2f} sn  "
+                  f"({index.size / 1024 / 1024:.1f} MB)")
+            measure(f"sorgu (Bloom {bits:>2} bit)", index, probes)
+            index.close()
+
+
+if __name__ == '__main__':
+    main()
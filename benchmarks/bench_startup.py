@@ -0,0 +1,62 @@
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = [
+    ('python (boş)', ['-c', 'pass']),
+    ('import wordlist_generator', ['-c', 'import wordlist_generator']),
+    ('wordlist_generator --help', ['wordlist_generator.py', '--help']),
+]
+SDK_COMMAND = ('import google.generativeai', ['-c', 'import google.generativeai'])
+
+
+def measure(args: list, repeat: int) -> list:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=ROOT, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def slowest_imports(module: str, limit: int) -> list:
+    # -X importtime çıktısından kümülatif süresi en yüksek modüller
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Başlangıç süresi ölçümü (ayrı süreçlerde)")
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--top', type=int, default=10, help="En yavaş içe aktarmaların sayısı")
+    args = parser.parse_args()
+
+    commands = list(COMMANDS)
+    if importlib.util.find_spec('google') and importlib.util.find_spec('google.generativeai'):
+        commands.append(SDK_COMMAND)
+
+    for name, command in commands:
+        timings = measure(command, args.repeat)
+        print(f"{name:<28} medyan: {statistics.median(timings) * 1000:8.1f} ms   "
+              f"en iyi: {min(timings) * 1000:8.1f} ms")
+
+    print(f"\nEn yavaş içe aktarmalar (wordlist_generator, kümülatif):")
+    for microseconds, module in slowest_imports('wordlist_generator', args.top):
+        print(f"{microseconds / 1000:8.1f} ms  {module}")
+
+
+if __name__ == '__main__':
+    main()
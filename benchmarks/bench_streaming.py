@@ -0,0 +1,77 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_gemini import FakeGenerativeModel
+from models.gemini_model import GeminiWordlistGenerator
+from models.user_info import UserInfo
+from models.wordlist_processor import WordlistProcessor
+
+PROFILE = UserInfo(name='Ahmet', surname='Yilmaz', birth_year='1990', lucky_numbers='7, 53')
+
+
+def consume(words, processor: WordlistProcessor) -> tuple:
+    # (ilk aday süresi, toplam süre, aday sayısı); süreler çağıranın başlangıcına göredir
+    first = None
+    count = 0
+    for _ in processor.iter_clean(words):
+        if first is None:
+            first = time.perf_counter()
+        count += 1
+    return first, time.perf_counter(), count
+
+
+def bench_buffered(generator: GeminiWordlistGenerator, processor: WordlistProcessor) -> tuple:
+    started = time.perf_counter()
+    base_words = generator.generate_base_words(PROFILE)
+    # Akış varyantıyla aynı kelime başı tekrar eleme; sadece yanıtın beklenmesi farklıdır
+    variations = processor.iter_variations(
+        base_words, PROFILE, full_expansion=True, include_base_words=True
+    )
+    first, finished, count = consume(variations, processor)
+    return first - started, finished - started, count
+
+
+def bench_streaming(generator: GeminiWordlistGenerator, processor: WordlistProcessor) -> tuple:
+    started = time.perf_counter()
+    variations = processor.iter_variations(
+        generator.iter_base_words(PROFILE), PROFILE, full_expansion=True, include_base_words=True
+    )
+    first, finished, count = consume(variations, processor)
+    return first - started, finished - started, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Akışlı AI yanıtı ile tam yanıt bekleme karşılaştırması")
+    parser.add_argument('--latency', type=float, default=3.0,
+                        help="Sahte Gemini yanıtının toplam süresi (sn)")
+    parser.add_argument('--words', type=int, default=500, help="Yanıttaki kelime sayısı")
+    parser.add_argument('--leet-combinations', action='store_true',
+                        help="Yerel işi ağırlaştırmak için tüm leet kombinasyonlarını aç")
+    args = parser.parse_args()
+
+    processor = WordlistProcessor(leet_combinations=args.leet_combinations)
+    results = []
+    for name, bench in (('tam yanıt', bench_buffered), ('akış', bench_streaming)):
+        generator = GeminiWordlistGenerator(
+            'benchmark', 'fake-model',
+            model=FakeGenerativeModel(latency=args.latency, words_per_response=args.words)
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            results.append((name, *bench(generator, processor)))
+
+    # Süreler ancak iki varyant aynı adayları üretiyorsa karşılaştırılabilir
+    counts = {name: count for name, _, _, count in results}
+    if len(set(counts.values())) != 1:
+        raise SystemExit(f"Aday sayıları farklı, karşılaştırma geçersiz: {counts}")
+    for name, first, total, count in results:
+        print(f"{name:<10} ilk aday: {first:7.3f} sn   toplam: {total:7.3f} sn   ({count:,} aday)")
+
+
+if __name__ == '__main__':
+    main()
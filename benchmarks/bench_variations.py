@@ -0,0 +1,51 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_gemini import synthetic_words
+from models.user_info import UserInfo
+from models.wordlist_processor import WordlistProcessor
+
+PROFILE = UserInfo(name='Ahmet', surname='Yilmaz', birth_year='1990', lucky_numbers='7, 53')
+
+
+def expand(processor: WordlistProcessor, base_words: list, workers: int) -> tuple:
+    # (geçen süre, çıktı); süreç havuzunun başlatılması ölçüme dahildir
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        variations = processor.create_variations(base_words, PROFILE, workers=workers,
+                                                 full_expansion=True)
+    return time.perf_counter() - started, variations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paralel varyasyon üretiminin tek süreçli yola göre hızlanması")
+    parser.add_argument('--base-words', type=int, default=3000, help="Genişletilecek temel kelime sayısı")
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4, 8], help="Denenecek süreç sayıları")
+    parser.add_argument('--leet-combinations', action='store_true',
+                        help="Yerel işi ağırlaştırmak için tüm leet kombinasyonlarını aç")
+    parser.add_argument('--dedup-store', choices=['set', 'trie'], default='set')
+    args = parser.parse_args()
+
+    processor = WordlistProcessor(leet_combinations=args.leet_combinations, dedup_store=args.dedup_store)
+    base_words = synthetic_words(args.base_words, seed=3)
+
+    serial_seconds, serial = expand(processor, base_words, 1)
+    print(f"{os.cpu_count()} çekirdek, {len(serial):,} varyasyon\n")
+    print(f"{'süreç':>6} {'süre':>9} {'hızlanma':>9} {'CPU kullanımı':>14}  çıktı")
+    print(f"{1:>6} {serial_seconds:8.2f}s {1:8.2f}x "
+          f"{processor.last_expansion_stats['cpu_utilisation']:13.2f}   referans")
+    for workers in args.workers:
+        seconds, variations = expand(processor, base_words, workers)
+        stats = processor.last_expansion_stats
+        print(f"{workers:>6} {seconds:8.2f}s {serial_seconds / seconds:8.2f}x "
+              f"{stats['cpu_utilisation']:13.2f}   {'aynı' if variations == serial else 'FARKLI'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import hashlib
+import random
+import time
+
+SYLLABLES = ['ah', 'met', 'yil', 'maz', 'ay', 'se', 'can', 'de', 'niz', 'ka', 'ya', 'mu', 'rat',
+             'el', 'if', 'ze', 'ynep', 'ba', 'ran', 'os', 'man', 'ist', 'an', 'bul', 'iz', 'mir']
+
+
+def synthetic_words(count: int, seed: int = 42) -> list:
+    # İsim benzeri heceler + yıl/sayı ekleriyle tekrarlanabilir kelime kümesi
+    rng = random.Random(seed)
+    words = []
+    for _ in range(count):
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        roll = rng.random()
+        if roll < 0.3:
+            word += str(rng.randint(1950, 2025))
+        elif roll < 0.5:
+            word += str(rng.randint(1, 99))
+        words.append(word)
+    return words
+
+
+class FakeResponse:
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeStreamResponse:
+    # Gerçek akışlı yanıt gibi: parçalar satır sınırına denk gelmez, gecikme parçalara yayılır
+
+    def __init__(self, text: str, latency: float, chunk_chars: int):
+        self.text = text
+        self.latency = latency
+        self.chunk_chars = chunk_chars
+
+    def __iter__(self):
+        chunks = [self.text[i:i + self.chunk_chars] for i in range(0, len(self.text), self.chunk_chars)]
+        for chunk in chunks:
+            if self.latency:
+                time.sleep(self.latency / len(chunks))
+            yield FakeResponse(chunk)
+
+
+class FakeGenerativeModel:
+
+    def __init__(self, latency: float = 0.0, words_per_response: int = 60, chunk_chars: int = 48):
+        self.latency = latency
+        self.words_per_response = words_per_response
+        self.chunk_chars = chunk_chars
+        self.calls = 0
+
+    def generate_content(self, prompt: str, stream: bool = False, **kwargs):
+        self.calls += 1
+        # Aynı prompt her zaman aynı yanıtı verir
+        seed = int(hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:8], 16)
+        text = '\n'.join(synthetic_words(self.words_per_response, seed))
+        if stream:
+            return FakeStreamResponse(text, self.latency, self.chunk_chars)
+        if self.latency:
+            time.sleep(self.latency)
+        return FakeResponse(text)
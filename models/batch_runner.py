@@ -0,0 +1,127 @@
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
+from colorama import Fore
+from models.external_sort import ExternalSorter
+from models.gemini_model import GeminiWordlistGenerator
+from models.user_info import UserInfo
+from models.wordlist_processor import WordlistProcessor
+from models.wordlist_writer import output_path
+
+
+def build_profile_wordlist(processor: WordlistProcessor, base_words: List[str],
+                           enhanced_words: List[str], user_info: UserInfo) -> List[str]:
+    # CPU havuzunda çalışır; işlemci süreçe kopyalanarak gelir, profiller arası durum paylaşılmaz
+    variations = processor.create_variations(base_words, user_info)
+    return processor.clean_and_filter(processor.iter_candidates(base_words, variations, enhanced_words))
+
+
+class BatchRunner:
+    
+    def __init__(self, generator: GeminiWordlistGenerator, output_dir: str,
+                 ai_concurrency: int = 4, cpu_workers: int = 1, profile_workers: int = 4,
+                 merged_output: Optional[str] = None, sort_memory_mb: float = 256,
+                 processor: Optional[WordlistProcessor] = None,
+                 generate_base_words: Optional[Callable[[UserInfo], List[str]]] = None,
+                 enhance_wordlist: Optional[Callable[[List[str]], List[str]]] = None,
+                 compression: str = 'none', shards: int = 1, shard_mode: str = 'hash'):
+        self.generator = generator
+        # AI adımları etkileşimli akışla aynı yapılandırmayı (paralel geliştirme, uyarlamalı
+        # istemler) kullanabilsin diye çağrılabilir olarak verilebilir
+        self.generate_base_words = generate_base_words or generator.generate_base_words
+        self.enhance_wordlist = enhance_wordlist or generator.enhance_wordlist
+        self.compression = compression
+        self.shards = shards
+        self.shard_mode = shard_mode
+        self.output_dir = output_dir
+        self.cpu_workers = max(1, cpu_workers)
+        self.profile_workers = max(1, profile_workers)
+        self.merged_output = merged_output
+        self.sort_memory_mb = sort_memory_mb
+        self.processor = processor or WordlistProcessor()
+        # Tüm profiller aynı AI çağrı bütçesini paylaşır
+        self._ai_budget = threading.Semaphore(max(1, ai_concurrency))
+    
+    def run(self, profiles: List[Tuple[str, UserInfo]]) -> dict:
+        os.makedirs(self.output_dir, exist_ok=True)
+        print(f"{Fore.YELLOW}📦 {len(profiles)} profil işleniyor "
+              f"(profil: {self.profile_workers}, CPU: {self.cpu_workers})...")
+        
+        # Birleşik liste sınırlı bellekle dış sıralama ile oluşturulur
+        merged = ExternalSorter(self.sort_memory_mb, store=self.processor.dedup_store) \
+            if self.merged_output else None
+        summary = {'profiles': len(profiles), 'succeeded': 0, 'failed': 0, 'words': 0}
+        names = self._assign_names([profile_id for profile_id, _ in profiles])
+        
+        with ProcessPoolExecutor(max_workers=self.cpu_workers) as cpu_pool, \
+                ThreadPoolExecutor(max_workers=self.profile_workers) as profile_pool:
+            futures = {
+                profile_pool.submit(self._process_profile, name, user_info, cpu_pool): profile_id
+                for (profile_id, user_info), name in zip(profiles, names)
+            }
+            for future in as_completed(futures):
+                profile_id = futures[future]
+                try:
+                    filename, wordlist = future.result()
+                except Exception as e:
+                    summary['failed'] += 1
+                    print(f"{Fore.RED}✗ {profile_id}: {e}")
+                    continue
+                
+                summary['succeeded'] += 1
+                summary['words'] += len(wordlist)
+                print(f"{Fore.GREEN}✓ {profile_id}: {len(wordlist)} kelime → {filename}")
+                if merged is not None:
+                    merged.add(wordlist)
+        
+        if merged is not None:
+            # Toplam önceden bilinmediği için aralık parçalama yerine hash kullanılır
+            summary['merged_words'] = self.processor.save_wordlist_stream(
+                merged.iter_sorted(), self.merged_output, compression=self.compression,
+                shards=self.shards, shard_mode='hash'
+            )
+        
+        return summary
+    
+    def _process_profile(self, name: str, user_info: UserInfo,
+                         cpu_pool: ProcessPoolExecutor) -> Tuple[str, List[str]]:
+        with self._ai_budget:
+            base_words = self.generate_base_words(user_info)
+        with self._ai_budget:
+            enhanced_words = self.enhance_wordlist(base_words)
+        
+        wordlist = cpu_pool.submit(
+            build_profile_wordlist, self.processor, base_words, enhanced_words, user_info
+        ).result()
+        
+        filename = os.path.join(self.output_dir, f"{name}.txt")
+        saved = self.processor.save_wordlist(wordlist, filename, compression=self.compression,
+                                             shards=self.shards, shard_mode=self.shard_mode)
+        if saved == 0 and wordlist:
+            raise IOError(f"Dosya yazılamadı: {filename}")
+        if self.shards > 1:
+            return f"{os.path.splitext(filename)[0]}.manifest.json", wordlist
+        return output_path(filename, self.compression), wordlist
+    
+    def _assign_names(self, profile_ids: List[str]) -> List[str]:
+        # Aynı id'li (veya temizlenince aynı ada düşen) profiller birbirinin dosyasının üzerine
+        # yazmasın diye sonraki kopyalar -2, -3 ... ekiyle yeniden adlandırılır
+        names = []
+        used = set()
+        for profile_id in profile_ids:
+            base = self._safe_name(profile_id)
+            name = base
+            suffix = 2
+            while name.lower() in used:
+                name = f"{base}-{suffix}"
+                suffix += 1
+            if name != base:
+                print(f"{Fore.YELLOW}⚠️  Tekrarlanan profil id'si '{profile_id}': çıktı {name}.txt olarak yazılacak")
+            used.add(name.lower())
+            names.append(name)
+        return names
+    
+    def _safe_name(self, profile_id: str) -> str:
+        return re.sub(r'[^A-Za-z0-9._-]+', '_', profile_id).strip('._') or 'profile'
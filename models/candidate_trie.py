@@ -0,0 +1,204 @@
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, Set, Union
+
+DEDUP_STORES = ('set', 'trie')
+TRIE_MAGIC = b'WLTR'
+# Başlık: sihirli değer, kova sınırı, kelime sayısı, kova sayısı, iç düğüm kelimesi sayısı
+TRIE_HEADER = struct.Struct('<4sIQII')
+TRIE_ENTRY = struct.Struct('<II')
+# Kova başına yaklaşık sabit yük: önek bytes nesnesi, bytearray başlığı ve dict girdisi
+BUCKET_OVERHEAD = 160
+
+class CandidateTrie:
+    # Tekrar eleme için kompakt aday deposu (burst trie / HAT-trie ailesi).
+    # Üst kısım önek düğümlerinden oluşan küçük bir trie'dir; yapraklar, o öneki paylaşan
+    # kelimelerin kalan kısımlarını "\n" ile ayrılmış olarak tutan bytearray kovalarıdır:
+    #   b"\n" + b"1990\n" + b"123\n" + ...
+    # Üyelik testi kovada C hızında alt dizi aramasıdır. Kova bucket_bytes sınırını aşınca
+    # bir sonraki bayta göre alt kovalara bölünür. Aynı temel kelimenin yüzlerce eki tek
+    # önek altında toplandığından kelime başına bellek, Python str + set girdisine göre
+    # birkaç kat azdır. Sıralı gezinti UTF-8 bayt sırasıyla yapılır (= kod noktası sırası,
+    # sorted() ile aynı). Kelimeler "\n" içeremez.
+    
+    def __init__(self, bucket_bytes: int = 4096):
+        self.bucket_bytes = bucket_bytes
+        self._buckets: Dict[bytes, bytearray] = {b'': bytearray(b'\n')}
+        # İç düğüm -> çocuk baytları; iç düğümün kendisi bir kelimeyse _terminals içindedir
+        self._internal: Dict[bytes, Set[bytes]] = {}
+        self._terminals: Set[bytes] = set()
+        self._size = 0
+        self._payload = 1
+        self._max_depth = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def nbytes(self) -> int:
+        # Yaklaşık bellek kullanımı (O(1)); ExternalSorter taşma kararı için yeterli doğrulukta
+        return self._payload + len(self._buckets) * BUCKET_OVERHEAD + \
+            len(self._internal) * BUCKET_OVERHEAD + len(self._terminals) * 64
+    
+    def _locate(self, key: bytes) -> int:
+        # Anahtarın düştüğü kovanın önek uzunluğu; anahtarın tamamı iç düğümse -1
+        # İç düğümler önek-kapalıdır (bir iç düğümün tüm önekleri de iç düğümdür), bu yüzden
+        # derinlik ikili aramayla bulunur: low her zaman iç düğüm, high hiçbir zaman
+        internal = self._internal
+        if key in internal:
+            return -1
+        if b'' not in internal:
+            return 0
+        low, high = 0, min(len(key), self._max_depth + 1)
+        while high - low > 1:
+            middle = (low + high) // 2
+            if key[:middle] in internal:
+                low = middle
+            else:
+                high = middle
+        return high
+    
+    def add(self, word: str) -> bool:
+        # Kelime yeni eklendiyse True döner
+        key = word.encode('utf-8')
+        depth = self._locate(key)
+        if depth < 0:
+            if key in self._terminals:
+                return False
+            self._terminals.add(key)
+            self._size += 1
+            return True
+        
+        prefix = key[:depth]
+        bucket = self._buckets.get(prefix)
+        if bucket is None:
+            bucket = self._buckets[prefix] = bytearray(b'\n')
+            self._internal[key[:depth - 1]].add(key[depth - 1:depth])
+            self._payload += 1
+        entry = key[depth:] + b'\n'
+        if b'\n' + entry in bucket:
+            return False
+        bucket += entry
+        self._size += 1
+        self._payload += len(entry)
+        if len(bucket) > self.bucket_bytes:
+            self._burst(prefix)
+        return True
+    
+    def update(self, words: Iterable[str]) -> int:
+        # Eklenen yeni kelime sayısı
+        add = self.add
+        return sum(1 for word in words if add(word))
+    
+    def __contains__(self, word: str) -> bool:
+        key = word.encode('utf-8')
+        depth = self._locate(key)
+        if depth < 0:
+            return key in self._terminals
+        bucket = self._buckets.get(key[:depth])
+        return bucket is not None and b'\n' + key[depth:] + b'\n' in bucket
+    
+    def _burst(self, prefix: bytes):
+        # Kova, kalan kısımların ilk baytına göre alt kovalara bölünür; tek kelimelik
+        # (uzun) kovalar bölünmez. Bölünen alt kova hâlâ büyükse o da bölünür
+        pending = [prefix]
+        while pending:
+            prefix = pending.pop()
+            bucket = self._buckets[prefix]
+            if len(bucket) <= self.bucket_bytes or bucket.count(b'\n') <= 2:
+                continue
+            del self._buckets[prefix]
+            self._payload -= len(bucket)
+            children = {}
+            for entry in bytes(bucket[1:-1]).split(b'\n'):
+                if entry:
+                    children.setdefault(entry[:1], [b'']).append(entry[1:])
+                else:
+                    self._terminals.add(prefix)
+            self._internal[prefix] = set(children)
+            self._max_depth = max(self._max_depth, len(prefix))
+            for label, entries in children.items():
+                child = bytearray(b'\n'.join(entries) + b'\n')
+                self._buckets[prefix + label] = child
+                self._payload += len(child)
+                pending.append(prefix + label)
+    
+    def __iter__(self) -> Iterator[str]:
+        return self._iter_prefix(b'')
+    
+    def _iter_prefix(self, prefix: bytes) -> Iterator[str]:
+        children = self._internal.get(prefix)
+        if children is None:
+            bucket = self._buckets.get(prefix)
+            if bucket is not None and len(bucket) > 1:
+                for entry in sorted(bytes(bucket[1:-1]).split(b'\n')):
+                    yield (prefix + entry).decode('utf-8')
+            return
+        if prefix in self._terminals:
+            yield prefix.decode('utf-8')
+        for label in sorted(children):
+            yield from self._iter_prefix(prefix + label)
+    
+    def save(self, path: str):
+        # İkili biçim: başlık, (önek, kova) çiftleri, iç düğüm kelimeleri. İç düğümler kova
+        # öneklerinden yeniden kurulur; yüklemede kelimeler tek tek eklenmez
+        with open(path, 'wb') as f:
+            f.write(TRIE_HEADER.pack(TRIE_MAGIC, self.bucket_bytes, self._size,
+                                     len(self._buckets), len(self._terminals)))
+            for prefix, bucket in self._buckets.items():
+                f.write(TRIE_ENTRY.pack(len(prefix), len(bucket)))
+                f.write(prefix)
+                f.write(bucket)
+            for terminal in self._terminals:
+                f.write(TRIE_ENTRY.pack(len(terminal), 0))
+                f.write(terminal)
+    
+    @classmethod
+    def load(cls, path: str) -> 'CandidateTrie':
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, bucket_bytes, size, bucket_count, terminal_count = TRIE_HEADER.unpack_from(data)
+        if magic != TRIE_MAGIC:
+            raise ValueError(f"{path} geçerli bir aday deposu değil")
+        
+        trie = cls(bucket_bytes)
+        trie._buckets = {}
+        trie._payload = 0
+        offset = TRIE_HEADER.size
+        for _ in range(bucket_count):
+            prefix_length, bucket_length = TRIE_ENTRY.unpack_from(data, offset)
+            offset += TRIE_ENTRY.size
+            prefix = data[offset:offset + prefix_length]
+            offset += prefix_length
+            trie._buckets[prefix] = bytearray(data[offset:offset + bucket_length])
+            offset += bucket_length
+            trie._payload += bucket_length
+            for depth in range(len(prefix)):
+                trie._internal.setdefault(prefix[:depth], set()).add(prefix[depth:depth + 1])
+            trie._max_depth = max(trie._max_depth, len(prefix) - 1)
+        for _ in range(terminal_count):
+            length, _ = TRIE_ENTRY.unpack_from(data, offset)
+            offset += TRIE_ENTRY.size
+            trie._terminals.add(data[offset:offset + length])
+            offset += length
+        trie._size = size
+        return trie
+    
+    def memory_usage(self) -> int:
+        # Gerçek bellek (sys.getsizeof toplamı); ölçüm ve benchmark için, nbytes'tan yavaştır
+        total = sys.getsizeof(self._buckets) + sys.getsizeof(self._internal) + \
+            sys.getsizeof(self._terminals)
+        total += sum(sys.getsizeof(prefix) + sys.getsizeof(bucket)
+                     for prefix, bucket in self._buckets.items())
+        total += sum(sys.getsizeof(prefix) + sys.getsizeof(children)
+                     for prefix, children in self._internal.items())
+        total += sum(sys.getsizeof(terminal) for terminal in self._terminals)
+        return total
+
+def new_candidate_store(kind: str = 'set') -> Union[set, CandidateTrie]:
+    # Tekrar eleme deposu: set hızlıdır, trie kelime başına birkaç kat daha az bellek kullanır
+    return CandidateTrie() if kind == 'trie' else set()
+
+def iter_store_sorted(store: Union[set, CandidateTrie]) -> Iterator[str]:
+    # Trie zaten sıralı gezilir; set için sorted() gerekir
+    return iter(store) if isinstance(store, CandidateTrie) else iter(sorted(store))
@@ -0,0 +1,103 @@
+import hashlib
+import heapq
+import json
+import os
+from dataclasses import asdict, fields
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+from models.external_sort import ExternalSorter, iter_file_lines, write_lines
+from models.user_info import UserInfo
+
+def fingerprint(*parts) -> str:
+    # Aşama girdilerinin kararlı özeti; girdi değişirse aşama (ve ona bağlı aşamalar) yeniden hesaplanır
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+def iter_sorted_difference(new_lines: Iterator[str], old_lines: Iterator[str]) -> Iterator[str]:
+    # İki sıralı akışın farkı (yeni - eski); dosyalar belleğe alınmadan birleştirilerek karşılaştırılır.
+    # Aynı kelimede eski kopya (0) yeniden (1) önce gelir
+    previous_old = None
+    merged = heapq.merge(((word, 0) for word in old_lines), ((word, 1) for word in new_lines))
+    for word, is_new in merged:
+        if not is_new:
+            previous_old = word
+        elif word != previous_old:
+            yield word
+
+class CheckpointStore:
+    # Dizin yapısı: state.json (aşama -> parmak izi, dosya, sayı), <aşama>.txt kelime listeleri,
+    # user_info.json ve son çıktının sıralı anlık görüntüsü (snapshot.txt, delta için)
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.state_path = os.path.join(directory, 'state.json')
+        self.snapshot_path = os.path.join(directory, 'snapshot.txt')
+        os.makedirs(directory, exist_ok=True)
+        self.state = {}
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+    
+    def has(self, stage: str, stage_fingerprint: str) -> bool:
+        entry = self.state.get(stage)
+        return bool(entry) and entry['fingerprint'] == stage_fingerprint and \
+            os.path.exists(os.path.join(self.directory, entry['file']))
+    
+    def load_words(self, stage: str, stage_fingerprint: str) -> Optional[List[str]]:
+        if not self.has(stage, stage_fingerprint):
+            return None
+        return list(iter_file_lines(os.path.join(self.directory, self.state[stage]['file'])))
+    
+    def save_words(self, stage: str, stage_fingerprint: str, words: List[str]):
+        filename = f"{stage}.txt"
+        path = os.path.join(self.directory, filename)
+        # Önce geçici dosyaya yazılır; yarıda kesilen yazma eski kontrol noktasını bozmaz
+        write_lines(words, path + '.tmp')
+        os.replace(path + '.tmp', path)
+        self.state[stage] = {
+            'fingerprint': stage_fingerprint,
+            'file': filename,
+            'count': len(words),
+            'completed': datetime.now().isoformat(timespec='seconds'),
+        }
+        self._save_state()
+    
+    def load_user_info(self) -> Optional[UserInfo]:
+        path = os.path.join(self.directory, 'user_info.json')
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        known = {field.name for field in fields(UserInfo)}
+        return UserInfo(**{key: value for key, value in data.items() if key in known})
+    
+    def save_user_info(self, user_info: UserInfo):
+        path = os.path.join(self.directory, 'user_info.json')
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(asdict(user_info), f, indent=2, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+        self.state['user_info'] = {
+            'fingerprint': fingerprint(asdict(user_info)),
+            'completed': datetime.now().isoformat(timespec='seconds'),
+        }
+        self._save_state()
+    
+    def write_delta(self, output_file: str, delta_file: str, memory_limit_mb: float = 256,
+                    temp_dir: Optional[str] = None) -> Tuple[int, int, bool]:
+        # Yeni çıktı sıralanıp önceki çalışmanın anlık görüntüsüyle karşılaştırılır; sadece
+        # yeni adaylar delta dosyasına yazılır. (toplam, yeni, önceki_var_mı) döner
+        sorter = ExternalSorter(memory_limit_mb, temp_dir)
+        sorter.add(iter_file_lines(output_file))
+        new_snapshot = self.snapshot_path + '.tmp'
+        total = write_lines(sorter.iter_sorted(), new_snapshot)
+        
+        had_previous = os.path.exists(self.snapshot_path)
+        old_lines = iter_file_lines(self.snapshot_path) if had_previous else iter(())
+        added = write_lines(iter_sorted_difference(iter_file_lines(new_snapshot), old_lines), delta_file)
+        os.replace(new_snapshot, self.snapshot_path)
+        return total, added, had_previous
+    
+    def _save_state(self):
+        with open(self.state_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, ensure_ascii=False)
+        os.replace(self.state_path + '.tmp', self.state_path)
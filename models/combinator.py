@@ -0,0 +1,123 @@
+from math import gcd
+from typing import Dict, Iterator, List, Tuple
+from models.profile_tokens import field_tokens, number_tokens
+from models.sharding import shard_range
+from models.user_info import UserInfo
+
+# Token havuzları ve hangi UserInfo alanlarından beslendikleri
+POOL_FIELDS = {
+    'person': ('name', 'surname', 'nickname', 'family_names', 'friend_names', 'pet_names'),
+    'topic': ('city', 'country', 'hobbies', 'favorite_color', 'favorite_animal',
+              'favorite_food', 'job', 'company', 'school', 'keywords'),
+}
+# Önemli tarihlerin sayı havuzuna giren biçimleri
+NUMBER_DATE_FORMATS = ('year', 'yy', 'ddmm', 'ddmmyyyy', 'ddmmyy')
+# Birleştirilecek havuz çiftleri (sol, sağ); her çift ayrı bir örnekleme katmanıdır
+COMBINATION_PAIRS = (
+    ('person', 'number'),
+    ('number', 'person'),
+    ('topic', 'number'),
+    ('person', 'person'),
+    ('person', 'topic'),
+    ('topic', 'person'),
+)
+DEFAULT_SEPARATORS = ('', '.', '_', '-')
+CASINGS = ('lower', 'capitalize', 'upper')
+# Örnekleme permütasyonu için çarpan (katman boyutuyla aralarında asal olana kadar artırılır)
+SAMPLING_MULTIPLIER = 2654435761
+
+def build_pools(user_info: UserInfo) -> Dict[str, Tuple[str, ...]]:
+    # Alan değerleri yerel moddaki gibi ayrıştırılır: Türkçe karakterler dönüştürülür, aksi
+    # halde adayların çoğu filtrede elenir ve bütçeyi boşa harcar
+    pools = {pool: tuple(field_tokens(user_info, field_names))
+             for pool, field_names in POOL_FIELDS.items()}
+    pools['number'] = tuple(number_tokens(user_info, NUMBER_DATE_FORMATS))
+    return pools
+
+def _apply_casing(word: str, casing: str) -> str:
+    if casing == 'capitalize':
+        return word.capitalize()
+    if casing == 'upper':
+        return word.upper()
+    return word
+
+class Combinator:
+    
+    def __init__(self, separators: Tuple[str, ...] = DEFAULT_SEPARATORS,
+                 casings: Tuple[str, ...] = CASINGS, budget: int = 50000):
+        self.separators = tuple(dict.fromkeys(separators)) or ('',)
+        self.casings = tuple(casings) or ('lower',)
+        self.budget = budget
+    
+    def strata(self, user_info: UserInfo) -> List[Tuple[Tuple[str, ...], Tuple[str, ...], int]]:
+        # (sol tokenlar, sağ tokenlar, katman boyutu); boş havuzlu çiftler atlanır
+        pools = build_pools(user_info)
+        strata = []
+        for left_pool, right_pool in COMBINATION_PAIRS:
+            left, right = pools[left_pool], pools[right_pool]
+            size = len(left) * len(self.separators) * len(right) * len(self.casings)
+            if size:
+                strata.append((left, right, size))
+        return strata
+    
+    def keyspace(self, user_info: UserInfo) -> int:
+        # Aynı havuzdan gelen özdeş çiftler dahil, tekrar elemeden önceki kesin aday sayısı
+        return sum(size for _, _, size in self.strata(user_info))
+    
+    def allocate(self, sizes: List[int]) -> List[int]:
+        # Katmanlı bütçe dağıtımı: bütçe katmanlara eşit bölünür, payından küçük katmanlar
+        # tamamen açılır ve artan bütçe kalan katmanlara yeniden dağıtılır
+        if not self.budget or sum(sizes) <= self.budget:
+            return list(sizes)
+        quotas = [0] * len(sizes)
+        remaining = self.budget
+        pending = sorted(range(len(sizes)), key=lambda index: sizes[index])
+        while pending:
+            share = remaining // len(pending)
+            index = pending[0]
+            if sizes[index] <= share:
+                quotas[index] = sizes[index]
+                remaining -= sizes[index]
+                pending.pop(0)
+                continue
+            for position, index in enumerate(pending):
+                quotas[index] = share + (1 if position < remaining - share * len(pending) else 0)
+            break
+        return quotas
+    
+    def iter_candidates(self, user_info: UserInfo, shard: Tuple[int, int] = (0, 1)) -> Iterator[str]:
+        # Katmanların seçilen konumları uç uca tek bir aralık oluşturur; dağıtık parçalamada
+        # her düğüm sadece kendi konum aralığını çözer
+        strata = self.strata(user_info)
+        quotas = self.allocate([size for _, _, size in strata])
+        start, stop = shard_range(sum(quotas), shard)
+        offset = 0
+        for (left, right, size), quota in zip(strata, quotas):
+            positions = range(max(start - offset, 0), min(stop - offset, quota))
+            offset += quota
+            if not positions:
+                continue
+            if quota >= size:
+                indices = positions
+            else:
+                # Katman içinde deterministik örnekleme: i -> i * m mod boyut bir permütasyondur,
+                # bu yüzden seçilen indeksler tekrarsızdır ve tüm basamaklara (sol, ayraç, sağ,
+                # harf biçimi) yayılır. Tüm çarpım hiç açılmaz; süre ve bellek bütçeyle orantılıdır
+                multiplier = SAMPLING_MULTIPLIER % size or 1
+                while gcd(multiplier, size) != 1:
+                    multiplier += 1
+                indices = (position * multiplier % size for position in positions)
+            for index in indices:
+                candidate = self._decode(left, right, index)
+                if candidate:
+                    yield candidate
+    
+    def _decode(self, left: Tuple[str, ...], right: Tuple[str, ...], index: int) -> str:
+        # Karışık tabanlı indeks -> (sol, ayraç, sağ, harf biçimi)
+        index, casing = divmod(index, len(self.casings))
+        index, right_index = divmod(index, len(right))
+        left_index, separator = divmod(index, len(self.separators))
+        if left[left_index] == right[right_index]:
+            return ''
+        word = f"{left[left_index]}{self.separators[separator]}{right[right_index]}"
+        return _apply_casing(word, self.casings[casing])
@@ -0,0 +1,165 @@
+import heapq
+import os
+import sys
+import tempfile
+from typing import Iterable, Iterator, Optional, Tuple
+from models.candidate_trie import CandidateTrie, iter_store_sorted, new_candidate_store
+
+
+def write_lines(lines: Iterable[str], filename: str, buffer_lines: int = 10000) -> int:
+    count = 0
+    with open(filename, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+        batch = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) >= buffer_lines:
+                f.write('\n'.join(batch) + '\n')
+                count += len(batch)
+                batch.clear()
+        if batch:
+            f.write('\n'.join(batch) + '\n')
+            count += len(batch)
+    return count
+
+
+def iter_file_lines(filename: str) -> Iterator[str]:
+    with open(filename, 'r', encoding='utf-8', buffering=1024 * 1024) as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if line:
+                yield line
+
+
+def iter_unique_sorted(lines: Iterable[str]) -> Iterator[str]:
+    # Sıralı girdideki ardışık tekrarları eler
+    previous = None
+    for line in lines:
+        if line != previous:
+            yield line
+            previous = line
+
+
+class ExternalSorter:
+    
+    # Sıralı parçalar birleştirilirken aynı anda açık tutulan en fazla dosya sayısı
+    MAX_OPEN_RUNS = 128
+    
+    def __init__(self, memory_limit_mb: float = 256, temp_dir: Optional[str] = None,
+                 store: str = 'set'):
+        self.memory_limit = int(memory_limit_mb * 1024 * 1024)
+        self.temp_dir = temp_dir
+        # 'trie' deposu aynı RAM bütçesine birkaç kat fazla kelime sığdırır, daha az parça yazılır
+        self.store = store
+        self.runs = []
+        self._buffer = new_candidate_store(store)
+        self._buffer_bytes = 0
+    
+    def add(self, words: Iterable[str]):
+        if isinstance(self._buffer, CandidateTrie):
+            for word in words:
+                if self._buffer.add(word) and self._buffer.nbytes >= self.memory_limit:
+                    self._spill()
+            return
+        for word in words:
+            if word in self._buffer:
+                continue
+            self._buffer.add(word)
+            # Kelime nesnesi + set girdisi için yaklaşık bellek
+            self._buffer_bytes += sys.getsizeof(word) + 32
+            if self._buffer_bytes >= self.memory_limit:
+                self._spill()
+    
+    def iter_sorted(self) -> Iterator[str]:
+        # Tüm parçalar k-yollu birleştirilir; geçici dosyalar iş bitince silinir
+        if not self.runs:
+            words = iter_store_sorted(self._buffer)
+            self._reset_buffer()
+            yield from words
+            return
+        
+        if self._buffer:
+            self._spill()
+        
+        try:
+            while len(self.runs) > self.MAX_OPEN_RUNS:
+                self._merge_pass()
+            yield from iter_unique_sorted(heapq.merge(*[iter_file_lines(run) for run in self.runs]))
+        finally:
+            self._cleanup()
+    
+    def sort_unique(self, words: Iterable[str], output: str) -> int:
+        self.add(words)
+        return write_lines(self.iter_sorted(), output)
+    
+    def merge_into(self, existing: str, new_words: Iterable[str],
+                   output: Optional[str] = None) -> Tuple[int, int]:
+        # Mevcut sıralı wordlist belleğe alınmadan yeni adaylarla birleştirilir.
+        # output verilmezse mevcut dosyanın yerine yazılır. (toplam, eklenen) döner.
+        output = output or existing
+        self.add(new_words)
+        
+        directory = os.path.dirname(os.path.abspath(output))
+        fd, temp_output = tempfile.mkstemp(prefix='.merge_', suffix='.txt', dir=directory)
+        os.close(fd)
+        
+        stats = {'total': 0, 'added': 0}
+        
+        def merged_lines() -> Iterator[str]:
+            existing_lines = self._iter_checked_sorted(existing) if os.path.exists(existing) else iter(())
+            new_lines = ((word, 1) for word in self.iter_sorted())
+            old_lines = ((word, 0) for word in existing_lines)
+            previous = None
+            # Aynı kelime iki kaynakta varsa önce mevcut olan gelir, yeni kopya atlanır
+            for word, is_new in heapq.merge(old_lines, new_lines):
+                if word == previous:
+                    continue
+                previous = word
+                stats['total'] += 1
+                stats['added'] += is_new
+                yield word
+        
+        try:
+            write_lines(merged_lines(), temp_output)
+            os.replace(temp_output, output)
+        finally:
+            if os.path.exists(temp_output):
+                os.remove(temp_output)
+        
+        return stats['total'], stats['added']
+    
+    def _iter_checked_sorted(self, filename: str) -> Iterator[str]:
+        previous = None
+        for line in iter_file_lines(filename):
+            if previous is not None and line < previous:
+                raise ValueError(f"{filename} sıralı değil, birleştirme yapılamaz")
+            previous = line
+            yield line
+    
+    def _spill(self):
+        fd, path = tempfile.mkstemp(prefix='wordlist_run_', suffix='.txt', dir=self.temp_dir)
+        os.close(fd)
+        write_lines(iter_store_sorted(self._buffer), path)
+        self.runs.append(path)
+        self._reset_buffer()
+    
+    def _merge_pass(self):
+        merged_runs = []
+        for start in range(0, len(self.runs), self.MAX_OPEN_RUNS):
+            group = self.runs[start:start + self.MAX_OPEN_RUNS]
+            fd, path = tempfile.mkstemp(prefix='wordlist_run_', suffix='.txt', dir=self.temp_dir)
+            os.close(fd)
+            write_lines(iter_unique_sorted(heapq.merge(*[iter_file_lines(run) for run in group])), path)
+            for run in group:
+                os.remove(run)
+            merged_runs.append(path)
+        self.runs = merged_runs
+    
+    def _reset_buffer(self):
+        self._buffer = new_candidate_store(self.store)
+        self._buffer_bytes = 0
+    
+    def _cleanup(self):
+        for run in self.runs:
+            if os.path.exists(run):
+                os.remove(run)
+        self.runs = []
@@ -1,19 +1,60 @@
 
 
-import google.generativeai as genai
-from typing import List
+import queue
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from colorama import Fore
 from models.user_info import UserInfo
+from models.response_cache import CacheMissError, ResponseCache
+
+# Akış üreticisinin bittiğini bildiren işaret
+_STREAM_DONE = object()
+RATE_LIMIT_MARKERS = ('429', 'resource exhausted', 'resourceexhausted', 'rate limit', 'quota')
+# Modelin sıkça eklediği madde/numara işaretleri ("1. ahmet", "- ahmet123")
+LIST_MARKER = re.compile(r'^\s*(?:[-*•]|\d+[.)])\s+')
+# Kaba token tahmini: yanıtta token sayısı yoksa (önbellek isabeti) ve prompt boyutlandırmada
+CHARS_PER_TOKEN = 4
+TOKENS_PER_WORD_LINE = 4
 
 class GeminiWordlistGenerator:
     
-    def __init__(self, api_key: str, model_name: str = 'gemini-2.5-flash'):
+    def __init__(self, api_key: str, model_name: str = 'gemini-2.5-flash', model=None,
+                 cache: Optional[ResponseCache] = None, generation_config: Optional[dict] = None):
         self.api_key = api_key
         self.model_name = model_name
-        self.model = None
-        self.setup_gemini()
+        self.model = model
+        self.cache = cache
+        self.generation_config = generation_config or {}
+        self.last_enhance_stats = {}
+        self.last_stream_stats = {}
+        # Uyarlamalı istemlerde aşama başına çağrı verimi (yeni/geçerli kelime, token)
+        self.last_adaptive_stats = {}
+        # Çağrı sayaçları (eşzamanlı isteklerde kilitle güncellenir)
+        self.ai_stats = {
+            'calls': 0, 'cache_hits': 0, 'errors': 0, 'retries': 0, 'latency_seconds': 0.0,
+            'prompt_tokens': 0, 'output_tokens': 0,
+        }
+        self._stats_lock = threading.Lock()
+        # SDK (google.generativeai + grpc) ağırdır; ilk gerçek AI çağrısına kadar içe
+        # aktarılmaz. Dışarıdan model verilirse (ör. testler için sahte model) veya tüm
+        # istekler önbellekten karşılanırsa hiç yüklenmez
+        self._setup_lock = threading.Lock()
+    
+    def _ensure_model(self):
+        if self.model is None:
+            with self._setup_lock:
+                if self.model is None:
+                    self.setup_gemini()
     
     def setup_gemini(self):
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            raise Exception("google-generativeai paketi yüklü değil: pip install google-generativeai")
         try:
             genai.configure(api_key=self.api_key)
             print(f"{Fore.CYAN}🔧 Kullanılacak model: {self.model_name}")
@@ -25,9 +66,384 @@ class GeminiWordlistGenerator:
     def generate_base_words(self, user_info: UserInfo) -> List[str]:
         print(f"{Fore.YELLOW}🤖 AI ile temel kelimeler oluşturuluyor...")
         
+        prompt = self._build_base_prompt(user_info)
+        
+        try:
+            words = self._parse_words(self._generate_text(prompt))
+            print(f"{Fore.GREEN}✓ {len(words)} temel kelime oluşturuldu")
+            return words
+        except CacheMissError:
+            raise
+        except Exception as e:
+            print(f"{Fore.RED}✗ AI kelime oluşturma hatası: {e}")
+            return []
+    
+    def iter_base_words(self, user_info: UserInfo) -> Iterator[str]:
+        # Akışlı yanıt: her tamamlanan satır geldiği anda verilir. Ağ okuması arka plan
+        # iş parçacığında sürer, böylece tüketici taraf (varyasyon, filtre, yazma) beklerken
+        # yanıtın geri kalanı inmeye devam eder
+        print(f"{Fore.YELLOW}🤖 AI ile temel kelimeler oluşturuluyor (akış)...")
+        
+        prompt = self._build_base_prompt(user_info)
+        lines = queue.Queue()
+        stop = threading.Event()
+        started = time.perf_counter()
+        self.last_stream_stats = {'lines': 0, 'first_line_seconds': None, 'total_seconds': None}
+        
+        def produce():
+            try:
+                pending = ''
+                for chunk in self._stream_text(prompt):
+                    if stop.is_set():
+                        return
+                    pending += chunk
+                    *complete, pending = pending.split('\n')
+                    for line in complete:
+                        lines.put(line)
+                lines.put(pending)
+                lines.put(_STREAM_DONE)
+            except BaseException as e:
+                lines.put(e)
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = lines.get()
+                if item is _STREAM_DONE:
+                    break
+                if isinstance(item, BaseException):
+                    if isinstance(item, CacheMissError):
+                        raise item
+                    print(f"{Fore.RED}✗ AI kelime oluşturma hatası: {item}")
+                    self.last_stream_stats['error'] = str(item)
+                    break
+                word = LIST_MARKER.sub('', item).strip()
+                if word:
+                    if self.last_stream_stats['first_line_seconds'] is None:
+                        self.last_stream_stats['first_line_seconds'] = time.perf_counter() - started
+                    self.last_stream_stats['lines'] += 1
+                    yield word
+        finally:
+            stop.set()
+            self.last_stream_stats['total_seconds'] = time.perf_counter() - started
+        
+        print(f"{Fore.GREEN}✓ {self.last_stream_stats['lines']} temel kelime oluşturuldu "
+              f"(ilk satır: {self.last_stream_stats['first_line_seconds'] or 0:.2f} sn)")
+    
+    def generate_base_words_adaptive(self, user_info: UserInfo, is_valid: Callable[[str], bool],
+                                     max_calls: int = 4, min_new_words: int = 10) -> List[str]:
+        # İlk çağrı normal temel istemdir; sonraki çağrılar elimizdeki kelimelerin özetini
+        # gönderip sadece yeni kelime ister. Bir çağrının getirdiği yeni ve geçerli kelime
+        # sayısı eşiğin altına düşünce model çağrılmaz
+        print(f"{Fore.YELLOW}🤖 AI ile temel kelimeler oluşturuluyor (uyarlamalı, en fazla {max_calls} çağrı)...")
         info_text = self._prepare_user_info(user_info)
+        word_count = self._target_word_count(50)
+        
+        def build_prompt(call: int, known: Dict[str, str]) -> str:
+            if call == 0:
+                return self._build_base_prompt(user_info, word_count)
+            return self._build_followup_prompt(info_text, known, word_count)
+        
+        words = self._adaptive_rounds('base_words', build_prompt, is_valid, {}, max_calls, min_new_words)
+        print(f"{Fore.GREEN}✓ {len(words)} temel kelime oluşturuldu")
+        return words
+    
+    def enhance_wordlist_adaptive(self, base_words: List[str], is_valid: Callable[[str], bool],
+                                  max_calls: int = 4, min_new_words: int = 10,
+                                  chunk_size: int = 15) -> List[str]:
+        # Her çağrıda temel kelimelerin sıradaki parçası örnek olarak verilir; mevcut
+        # kelimeler (temel kelimeler dahil) özet olarak eklenir ve tekrar istenmez
+        if not base_words:
+            return []
+        print(f"{Fore.YELLOW}🚀 AI ile wordlist geliştiriliyor (uyarlamalı, en fazla {max_calls} çağrı)...")
+        chunks = [base_words[i:i + chunk_size] for i in range(0, len(base_words), chunk_size)]
+        word_count = self._target_word_count(25)
+        
+        def build_prompt(call: int, known: Dict[str, str]) -> str:
+            return self._build_enhance_prompt(chunks[call % len(chunks)], word_count) + \
+                self._build_known_section(known)
+        
+        known = {word.lower(): word for word in base_words}
+        words = self._adaptive_rounds('enhanced_words', build_prompt, is_valid, known, max_calls,
+                                      min_new_words)
+        print(f"{Fore.GREEN}✓ AI ile {len(words)} ek kelime oluşturuldu")
+        return words
+    
+    def _adaptive_rounds(self, stage: str, build_prompt, is_valid: Callable[[str], bool],
+                         known: Dict[str, str], max_calls: int, min_new_words: int) -> List[str]:
+        # known: küçük harfli kelime -> kelime. Büyük/küçük harf farkı yeni sayılmaz,
+        # bu çeşitleri varyasyon aşaması zaten üretir
+        new_words = []
+        calls = []
+        for call in range(max(1, max_calls)):
+            prompt = build_prompt(call, known)
+            output_tokens_before = self.ai_stats['output_tokens']
+            try:
+                text = self._generate_text(prompt)
+            except CacheMissError:
+                raise
+            except Exception as e:
+                print(f"{Fore.RED}✗ AI çağrı hatası: {e}")
+                break
+            
+            lines = self._parse_words(text)
+            valid = [word for word in lines if is_valid(word)]
+            added = []
+            for word in valid:
+                key = word.lower()
+                if key not in known:
+                    known[key] = word
+                    added.append(word)
+            new_words.extend(added)
+            
+            output_tokens = self.ai_stats['output_tokens'] - output_tokens_before
+            estimated = output_tokens == 0
+            if estimated:
+                output_tokens = max(1, len(text) // CHARS_PER_TOKEN)
+            calls.append({
+                'lines': len(lines),
+                'valid': len(valid),
+                'new': len(added),
+                'prompt_chars': len(prompt),
+                'output_tokens': output_tokens,
+                'tokens_estimated': estimated,
+                'new_per_1k_tokens': len(added) * 1000 / output_tokens,
+            })
+            print(f"{Fore.CYAN}   ↳ çağrı {call + 1}: {len(lines)} satır, {len(valid)} geçerli, "
+                  f"{len(added)} yeni ({calls[-1]['new_per_1k_tokens']:.0f} yeni/1k token"
+                  f"{', tahmini' if estimated else ''})")
+            if len(added) < min_new_words:
+                if call + 1 < max_calls:
+                    print(f"{Fore.YELLOW}   ↳ marjinal verim eşiğin altında ({len(added)} < {min_new_words}), "
+                          f"çağrılar durduruldu")
+                break
+        
+        total_tokens = sum(item['output_tokens'] for item in calls)
+        self.last_adaptive_stats[stage] = {
+            'calls': len(calls),
+            'new_words': len(new_words),
+            'output_tokens': total_tokens,
+            'new_per_call': len(new_words) / len(calls) if calls else 0.0,
+            'new_per_1k_tokens': len(new_words) * 1000 / total_tokens if total_tokens else 0.0,
+            'per_call': calls,
+        }
+        return new_words
+    
+    def _target_word_count(self, default: int) -> int:
+        # İstenen kelime sayısı yanıt token sınırına sığacak şekilde ayarlanır
+        max_tokens = self.generation_config.get('max_output_tokens')
+        if not max_tokens:
+            return default
+        return max(10, min(500, int(max_tokens) // TOKENS_PER_WORD_LINE))
+    
+    def _summarize_known(self, known: Dict[str, str]) -> str:
+        # "Elimizde olanlar" özeti: kelimeler harf köklerine indirgenir (ahmet1990, Ahmet! -> ahmet)
+        # ve en sık kökler, yanıt token sınırının yarısını geçmeyecek kadar listelenir
+        stems = {}
+        for key in known:
+            stem = re.sub(r'[^a-z]', '', key)
+            if len(stem) >= 3:
+                stems[stem] = stems.get(stem, 0) + 1
+        budget = int(self.generation_config.get('max_output_tokens') or 2048) // 2 * CHARS_PER_TOKEN
+        parts = []
+        used = 0
+        for stem, count in sorted(stems.items(), key=lambda item: (-item[1], item[0])):
+            part = f"{stem}({count})" if count > 1 else stem
+            if used + len(part) + 2 > budget:
+                break
+            parts.append(part)
+            used += len(part) + 2
+        omitted = len(stems) - len(parts)
+        return ', '.join(parts) + (f" ... (+{omitted} kök)" if omitted else '')
+    
+    def _build_known_section(self, known: Dict[str, str]) -> str:
+        if not known:
+            return ''
+        return f"""
+Elimizde zaten olan kelime kökleri (parantezde varyant sayısı). Bunları ve bunlara sayı/özel
+karakter eklenmiş hallerini tekrar yazma, bu ekleri biz üretiyoruz:
+{self._summarize_known(known)}
+"""
+    
+    def enhance_wordlist(self, base_words: List[str]) -> List[str]:
+        if not base_words:
+            return []
+        
+        print(f"{Fore.YELLOW}🚀 AI ile wordlist geliştiriliyor...")
+        
+        sample_words = base_words[:15]
+        prompt = self._build_enhance_prompt(sample_words)
+        
+        try:
+            enhanced_words = self._parse_words(self._generate_text(prompt))
+            print(f"{Fore.GREEN}✓ AI ile {len(enhanced_words)} ek kelime oluşturuldu")
+            return enhanced_words
+        except CacheMissError:
+            raise
+        except Exception as e:
+            print(f"{Fore.RED}✗ AI geliştirme hatası: {e}")
+            return []
+    
+    def enhance_wordlist_concurrent(self, base_words: List[str], chunk_size: int = 15,
+                                    concurrency: int = 4, max_retries: int = 5,
+                                    base_delay: float = 1.0) -> List[str]:
+        if not base_words:
+            return []
         
-        prompt = f"""
+        chunks = [base_words[i:i + chunk_size] for i in range(0, len(base_words), chunk_size)]
+        print(f"{Fore.YELLOW}🚀 AI ile wordlist geliştiriliyor "
+              f"({len(chunks)} parça, eşzamanlılık: {concurrency})...")
+        
+        enhanced = {}
+        retries = 0
+        failed_chunks = 0
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = [
+                executor.submit(
+                    self._generate_with_retry, self._build_enhance_prompt(chunk),
+                    max_retries, base_delay
+                )
+                for chunk in chunks
+            ]
+            # Sonuçlar geldikçe birleştirilir
+            for future in as_completed(futures):
+                try:
+                    text, attempts = future.result()
+                    retries += attempts
+                    enhanced.update(dict.fromkeys(self._parse_words(text)))
+                except CacheMissError:
+                    raise
+                except Exception as e:
+                    failed_chunks += 1
+                    print(f"{Fore.RED}✗ AI geliştirme hatası: {e}")
+        
+        self.last_enhance_stats = {
+            'chunks': len(chunks),
+            'failed_chunks': failed_chunks,
+            'retries': retries,
+        }
+        
+        result = list(enhanced)
+        print(f"{Fore.GREEN}✓ AI ile {len(result)} ek kelime oluşturuldu")
+        return result
+    
+    def _generate_with_retry(self, prompt: str, max_retries: int = 5,
+                             base_delay: float = 1.0, max_delay: float = 60.0) -> Tuple[str, int]:
+        attempt = 0
+        while True:
+            try:
+                return self._generate_text(prompt), attempt
+            except Exception as e:
+                if attempt >= max_retries or not self._is_rate_limit_error(e):
+                    raise
+                # Üstel geri çekilme + tam jitter
+                delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+                attempt += 1
+                self._count('retries')
+                time.sleep(delay)
+    
+    def _generate_text(self, prompt: str) -> str:
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(self.model_name, prompt, self.generation_config)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._count('cache_hits')
+                return cached
+        
+        self._ensure_model()
+        started = time.perf_counter()
+        try:
+            if self.generation_config:
+                response = self.model.generate_content(prompt, generation_config=self.generation_config)
+            else:
+                response = self.model.generate_content(prompt)
+            text = response.text
+        except Exception:
+            self._count('errors')
+            raise
+        finally:
+            self._count('calls')
+            self._count('latency_seconds', time.perf_counter() - started)
+        
+        usage = getattr(response, 'usage_metadata', None)
+        if usage is not None:
+            self._count('prompt_tokens', getattr(usage, 'prompt_token_count', 0) or 0)
+            self._count('output_tokens', getattr(usage, 'candidates_token_count', 0) or 0)
+        
+        if key is not None:
+            self.cache.put(key, text)
+        return text
+    
+    def _stream_text(self, prompt: str) -> Iterator[str]:
+        # Önbellekte varsa tek parça döner; yoksa model yanıtı parça parça okunur ve
+        # yanıt tamamlandığında önbelleğe yazılır
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(self.model_name, prompt, self.generation_config)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._count('cache_hits')
+                yield cached
+                return
+        
+        self._ensure_model()
+        started = time.perf_counter()
+        chunks = []
+        try:
+            if self.generation_config:
+                response = self.model.generate_content(
+                    prompt, generation_config=self.generation_config, stream=True
+                )
+            else:
+                response = self.model.generate_content(prompt, stream=True)
+            for chunk in response:
+                text = chunk.text
+                chunks.append(text)
+                yield text
+        except Exception:
+            self._count('errors')
+            raise
+        finally:
+            self._count('calls')
+            self._count('latency_seconds', time.perf_counter() - started)
+        
+        usage = getattr(response, 'usage_metadata', None)
+        if usage is not None:
+            self._count('prompt_tokens', getattr(usage, 'prompt_token_count', 0) or 0)
+            self._count('output_tokens', getattr(usage, 'candidates_token_count', 0) or 0)
+        
+        if key is not None:
+            self.cache.put(key, ''.join(chunks))
+    
+    def _count(self, key: str, amount=1):
+        with self._stats_lock:
+            self.ai_stats[key] += amount
+    
+    def _is_rate_limit_error(self, error: Exception) -> bool:
+        text = f"{type(error).__name__} {error}".lower()
+        return any(marker in text for marker in RATE_LIMIT_MARKERS)
+    
+    def _build_followup_prompt(self, info_text: str, known: Dict[str, str], word_count: int) -> str:
+        return f"""
+Aşağıdaki kişisel bilgilere dayanarak şifre oluşturmada kullanılabilecek YENİ kelimeler üret:
+
+{info_text}
+{self._build_known_section(known)}
+Şu kuralları takip et:
+1. Her kelimeyi yeni satırda yaz
+2. Sadece kelimeleri listele, açıklama veya numaralandırma yapma
+3. Türkçe karakterleri İngilizce karakterlere dönüştür
+4. En az {word_count} yeni kelime öner
+5. Henüz kapsanmayan yönlere odaklan: takma adlar, yakın çevre, tuttuğu takımlar, sevdiği
+   diziler/oyunlar/müzisyenler, mahalle ve semt isimleri, kültürel referanslar
+"""
+    
+    def _build_base_prompt(self, user_info: UserInfo, word_count: int = 50) -> str:
+        info_text = self._prepare_user_info(user_info)
+        
+        return f"""
 Aşağıdaki kişisel bilgilere dayanarak şifre oluşturmada kullanılabilecek kelimeler üret:
 
 {info_text}
@@ -36,7 +452,7 @@ Aşağıdaki kişisel bilgilere dayanarak şifre oluşturmada kullanılabilecek
 1. Her kelimeyi yeni satırda yaz
 2. Sadece kelimeleri listele, açıklama yapma
 3. Türkçe karakterleri İngilizce karakterlere dönüştür
-4. En az 50 kelime öner
+4. En az {word_count} kelime öner
 5. Şu kategorilerden kelimeler dahil et:
    - İsim, soyisim kombinasyonları
    - Doğum yılı ve tarihleri
@@ -57,25 +473,9 @@ maviş2005
 1990
 yazilim
 """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            words = [word.strip() for word in response.text.split('\n') if word.strip()]
-            print(f"{Fore.GREEN}✓ {len(words)} temel kelime oluşturuldu")
-            return words
-        except Exception as e:
-            print(f"{Fore.RED}✗ AI kelime oluşturma hatası: {e}")
-            return []
     
-    def enhance_wordlist(self, base_words: List[str]) -> List[str]:
-        if not base_words:
-            return []
-            
-        print(f"{Fore.YELLOW}🚀 AI ile wordlist geliştiriliyor...")
-        
-        sample_words = base_words[:15]
-        
-        prompt = f"""
+    def _build_enhance_prompt(self, sample_words: List[str], word_count: int = 25) -> str:
+        return f"""
 Bu kelime listesindeki kalıpları analiz et ve benzer şifre kombinasyonları öner:
 
 {chr(10).join(sample_words)}
@@ -84,7 +484,7 @@ Bu kelime listesindeki kalıpları analiz et ve benzer şifre kombinasyonları 
 1. Benzer kalıpları takip eden yeni kombinasyonlar öner
 2. Yaygın şifre kalıpları ekle (kelime+sayı, sayı+kelime)
 3. Sadece kelimeleri listele
-4. En az 25 yeni kelime öner
+4. En az {word_count} yeni kelime öner
 5. Türkçe karakterleri kullanma
 
 Örnekler:
@@ -92,15 +492,10 @@ Bu kelime listesindeki kalıpları analiz et ve benzer şifre kombinasyonları 
 - Eğer "istanbul" varsa: "istanbul34", "34istanbul"
 - Eğer meslek adı varsa: meslek adı + yaygın sayılar
 """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            enhanced_words = [word.strip() for word in response.text.split('\n') if word.strip()]
-            print(f"{Fore.GREEN}✓ AI ile {len(enhanced_words)} ek kelime oluşturuldu")
-            return enhanced_words
-        except Exception as e:
-            print(f"{Fore.RED}✗ AI geliştirme hatası: {e}")
-            return []
+    
+    def _parse_words(self, text: str) -> List[str]:
+        words = (LIST_MARKER.sub('', line).strip() for line in text.split('\n'))
+        return [word for word in words if word]
     
     def _prepare_user_info(self, user_info: UserInfo) -> str:
         info_lines = []
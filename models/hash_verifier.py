@@ -0,0 +1,183 @@
+import hashlib
+import re
+import struct
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+HASH_TYPES = ('md5', 'sha1', 'sha256', 'ntlm')
+HASH_HEX_LENGTHS = {'md5': 32, 'sha1': 40, 'sha256': 64, 'ntlm': 32}
+HEX_PATTERN = re.compile(r'^[0-9a-fA-F]+$')
+
+def _md4(data: bytes) -> bytes:
+    # OpenSSL 3 MD4'ü varsayılan olarak kapatır; NTLM için saf Python yedeği (RFC 1320)
+    def rotate(value, shift):
+        value &= 0xFFFFFFFF
+        return ((value << shift) | (value >> (32 - shift))) & 0xFFFFFFFF
+    
+    length = len(data) * 8
+    data += b'\x80' + b'\x00' * ((55 - len(data)) % 64) + struct.pack('<Q', length)
+    a, b, c, d = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476
+    for offset in range(0, len(data), 64):
+        x = struct.unpack('<16I', data[offset:offset + 64])
+        aa, bb, cc, dd = a, b, c, d
+        for i in (0, 4, 8, 12):
+            a = rotate(a + ((b & c) | (~b & d)) + x[i], 3)
+            d = rotate(d + ((a & b) | (~a & c)) + x[i + 1], 7)
+            c = rotate(c + ((d & a) | (~d & b)) + x[i + 2], 11)
+            b = rotate(b + ((c & d) | (~c & a)) + x[i + 3], 19)
+        for i in (0, 1, 2, 3):
+            a = rotate(a + ((b & c) | (b & d) | (c & d)) + x[i] + 0x5A827999, 3)
+            d = rotate(d + ((a & b) | (a & c) | (b & c)) + x[i + 4] + 0x5A827999, 5)
+            c = rotate(c + ((d & a) | (d & b) | (a & b)) + x[i + 8] + 0x5A827999, 9)
+            b = rotate(b + ((c & d) | (c & a) | (d & a)) + x[i + 12] + 0x5A827999, 13)
+        for i in (0, 2, 1, 3):
+            a = rotate(a + (b ^ c ^ d) + x[i] + 0x6ED9EBA1, 3)
+            d = rotate(d + (a ^ b ^ c) + x[i + 8] + 0x6ED9EBA1, 9)
+            c = rotate(c + (d ^ a ^ b) + x[i + 4] + 0x6ED9EBA1, 11)
+            b = rotate(b + (c ^ d ^ a) + x[i + 12] + 0x6ED9EBA1, 15)
+        a, b, c, d = [(v + w) & 0xFFFFFFFF for v, w in zip((a, b, c, d), (aa, bb, cc, dd))]
+    return struct.pack('<4I', a, b, c, d)
+
+def _ntlm_hex(word: str) -> str:
+    data = word.encode('utf-16-le')
+    try:
+        return hashlib.new('md4', data).hexdigest()
+    except ValueError:
+        return _md4(data).hex()
+
+def hash_word(word: str, hash_type: str) -> str:
+    if hash_type == 'ntlm':
+        return _ntlm_hex(word)
+    return hashlib.new(hash_type, word.encode('utf-8')).hexdigest()
+
+def load_hashes(path: str, hash_type: str = 'auto') -> Dict[str, Set[str]]:
+    # Satır başına bir hash; "kullanıcı:hash" ve pwdump (kullanıcı:rid:lm:ntlm:::) satırlarında
+    # uygun uzunluktaki son onaltılık alan alınır. auto: uzunluğa göre (32 karakter hem MD5
+    # hem NTLM olarak denenir)
+    types = HASH_TYPES if hash_type == 'auto' else (hash_type,)
+    lengths = {HASH_HEX_LENGTHS[name] for name in types}
+    targets = {name: set() for name in types}
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            fields = [field for field in line.strip().split(':')
+                      if len(field) in lengths and HEX_PATTERN.match(field)]
+            if not fields:
+                continue
+            digest = fields[-1].lower()
+            for name in types:
+                if len(digest) == HASH_HEX_LENGTHS[name]:
+                    targets[name].add(digest)
+    return {name: digests for name, digests in targets.items() if digests}
+
+_EXHAUSTED = object()
+
+# Süreç havuzundaki her işçiye hedefler bir kez (başlatıcıyla) gönderilir, her partide değil
+_worker_targets: Dict[str, Set[str]] = {}
+
+def _init_worker(targets: Dict[str, Set[str]]):
+    global _worker_targets
+    _worker_targets = targets
+
+def _check_batch(batch: List[str]) -> Tuple[int, List[Tuple[str, str, str]]]:
+    return len(batch), check_words(batch, _worker_targets)
+
+def check_words(words: List[str], targets: Dict[str, Set[str]]) -> List[Tuple[str, str, str]]:
+    # (tür, hash, kelime) eşleşmeleri; arama önceden hesaplanmış kümelerde O(1)
+    cracked = []
+    for hash_type, digests in targets.items():
+        if hash_type == 'ntlm':
+            hasher = _ntlm_hex
+        else:
+            constructor = getattr(hashlib, hash_type)
+            hasher = lambda word, constructor=constructor: constructor(word.encode('utf-8')).hexdigest()
+        for word in words:
+            digest = hasher(word)
+            if digest in digests:
+                cracked.append((hash_type, digest, word))
+    return cracked
+
+class HashVerifier:
+    
+    def __init__(self, targets: Dict[str, Set[str]], workers: int = 1, batch_size: int = 20000,
+                 stop_when_done: bool = True):
+        self.targets = {name: set(digests) for name, digests in targets.items()}
+        # Aynı hash birden fazla türde denenebilir (MD5/NTLM); kırılınca hepsinden düşer
+        self.total = len(set().union(*self.targets.values()))
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.stop_when_done = stop_when_done
+        self.cracked: Dict[str, str] = {}
+        self.stats = {}
+    
+    def run(self, candidates: Iterable[str],
+            on_crack: Optional[Callable[[str, str, str], None]] = None) -> dict:
+        # Adaylar partiler halinde hash'lenir; dosyaya hiç yazılmaz. Bellekte en fazla
+        # işçi sayısının iki katı kadar parti bekler
+        started = time.perf_counter()
+        tested = 0
+        stopped_early = False
+        iterator = iter(candidates)
+        batches = iter(lambda: list(islice(iterator, self.batch_size)), [])
+        
+        if self.workers == 1:
+            for batch in batches:
+                tested += len(batch)
+                if self._record(check_words(batch, self._remaining()), on_crack):
+                    stopped_early = self._has_more(iterator)
+                    break
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.targets,)) as executor:
+                pending = set()
+                finished = False
+                for batch in batches:
+                    pending.add(executor.submit(_check_batch, batch))
+                    if len(pending) >= self.workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            count, matches = future.result()
+                            tested += count
+                            finished = self._record(matches, on_crack) or finished
+                        if finished:
+                            break
+                for future in pending:
+                    if finished and future.cancel():
+                        stopped_early = True
+                        continue
+                    count, matches = future.result()
+                    tested += count
+                    self._record(matches, on_crack)
+                if finished and not stopped_early:
+                    stopped_early = self._has_more(iterator)
+        
+        elapsed = time.perf_counter() - started
+        self.stats = {
+            'tested': tested,
+            'cracked': len(self.cracked),
+            'total': self.total,
+            'seconds': elapsed,
+            'rate': tested / elapsed if elapsed > 0 else 0.0,
+            'stopped_early': stopped_early,
+        }
+        return self.stats
+    
+    @staticmethod
+    def _has_more(iterator) -> bool:
+        # Erken durma sadece test edilmemiş aday kaldıysa gerçekleşmiştir
+        return next(iterator, _EXHAUSTED) is not _EXHAUSTED
+    
+    def _remaining(self) -> Dict[str, Set[str]]:
+        return {name: digests - self.cracked.keys() for name, digests in self.targets.items()}
+    
+    def _record(self, matches: List[Tuple[str, str, str]], on_crack) -> bool:
+        # Yeni kırılanları kaydeder; hepsi kırıldıysa ve erken durma açıksa True döner
+        for hash_type, digest, word in matches:
+            if digest not in self.cracked:
+                self.cracked[digest] = word
+                if on_crack is not None:
+                    on_crack(hash_type, digest, word)
+        return self.stop_when_done and len(self.cracked) >= self.total
@@ -0,0 +1,73 @@
+from itertools import combinations, islice, product
+from typing import Dict, Iterable, Iterator, Optional
+
+# Her harf için olası karşılıklar; ilk karakter tam dönüşümde kullanılır
+DEFAULT_LEET_MAP = {
+    'a': '@4', 'e': '3', 'i': '1!', 'o': '0', 's': '$5', 't': '7', 'g': '69', 'l': '1'
+}
+
+def parse_leet_map(text: str) -> Dict[str, str]:
+    # "a:@4,e:3,s:$5" biçimindeki .env değerini sözlüğe çevirir
+    leet_map = {}
+    for item in text.split(','):
+        if ':' in item:
+            char, substitutes = item.split(':', 1)
+            char = char.strip().lower()
+            substitutes = substitutes.strip()
+            if len(char) == 1 and substitutes:
+                leet_map[char] = substitutes
+    return leet_map
+
+class LeetEngine:
+    
+    def __init__(self, leet_map: Optional[Dict[str, str]] = None, max_per_word: int = 256):
+        self.leet_map = dict(leet_map or DEFAULT_LEET_MAP)
+        self.max_per_word = max_per_word
+        # Önceden hesaplanan tablolar: tam dönüşüm için str.translate tablosu ve
+        # kısmi kombinasyonlar için harf başına karşılık demetleri. Harfin kendisi karşılık
+        # olarak verilmişse çıkarılır; aksi halde aynı varyant tekrar üretilir ve sayılır
+        self.substitutes = {}
+        for char, subs in self.leet_map.items():
+            unique = tuple(sub for sub in dict.fromkeys(subs) if sub != char)
+            if unique:
+                self.substitutes[char] = unique
+        self.full_table = str.maketrans({char: subs[0] for char, subs in self.substitutes.items()})
+    
+    def to_full_leet(self, word: str) -> str:
+        return word.translate(self.full_table)
+    
+    def keyspace(self, word: str) -> int:
+        # Orijinal kelime hariç tüm kısmi dönüşümlerin sayısı
+        total = 1
+        for char in word:
+            subs = self.substitutes.get(char)
+            if subs:
+                total *= len(subs) + 1
+        return total - 1
+    
+    def estimate_keyspace(self, words: Iterable[str], cap: Optional[int] = None) -> int:
+        return sum(self.variant_count(word, cap) for word in words)
+    
+    def variant_count(self, word: str, limit: Optional[int] = None) -> int:
+        # iter_variants'ın aynı sınırla üreteceği varyant sayısı
+        limit = self.max_per_word if limit is None else limit
+        keyspace = self.keyspace(word)
+        return min(keyspace, limit) if limit else keyspace
+    
+    def iter_variants(self, word: str, limit: Optional[int] = None) -> Iterator[str]:
+        limit = self.max_per_word if limit is None else limit
+        variants = self._iter_all_variants(word)
+        return islice(variants, limit) if limit else variants
+    
+    def _iter_all_variants(self, word: str) -> Iterator[str]:
+        # Az dönüşümlüden çok dönüşümlüye doğru üretilir (p@ssword, passw0rd, ... p@$$w0rd);
+        # sınır uygulandığında en gerçekçi varyantlar korunur
+        positions = [i for i, char in enumerate(word) if char in self.substitutes]
+        chars = list(word)
+        for count in range(1, len(positions) + 1):
+            for selected in combinations(positions, count):
+                for replacement in product(*(self.substitutes[word[i]] for i in selected)):
+                    variant = chars[:]
+                    for position, sub in zip(selected, replacement):
+                        variant[position] = sub
+                    yield ''.join(variant)
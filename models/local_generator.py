@@ -0,0 +1,78 @@
+import re
+from typing import Iterator, List
+from colorama import Fore
+from models.profile_tokens import field_tokens, number_tokens, tokenize_field, transliterate
+from models.user_info import UserInfo
+
+# Temel kelime sırası önemlidir: varyasyon aşaması ilk kelimelere daha çok ek uygular
+PRIMARY_FIELDS = ('name', 'surname', 'nickname')
+PERSON_FIELDS = ('family_names', 'pet_names', 'friend_names')
+TOPIC_FIELDS = ('city', 'country', 'job', 'company', 'school', 'hobbies', 'favorite_color',
+                'favorite_animal', 'favorite_food', 'keywords')
+
+class LocalWordlistGenerator:
+    # GeminiWordlistGenerator ile aynı arayüz; ağ ve SDK olmadan, UserInfo alanlarından
+    # deterministik temel kelime üretir
+    
+    def __init__(self):
+        self.model_name = 'local'
+        self.last_enhance_stats = {}
+        self.last_stream_stats = {}
+        self.ai_stats = {
+            'calls': 0, 'cache_hits': 0, 'errors': 0, 'retries': 0, 'latency_seconds': 0.0,
+            'prompt_tokens': 0, 'output_tokens': 0,
+        }
+    
+    def generate_base_words(self, user_info: UserInfo) -> List[str]:
+        print(f"{Fore.YELLOW}🧩 Temel kelimeler profil alanlarından oluşturuluyor (yerel mod)...")
+        words = list(dict.fromkeys(self._iter_base_words(user_info)))
+        print(f"{Fore.GREEN}✓ {len(words)} temel kelime oluşturuldu")
+        return words
+    
+    def iter_base_words(self, user_info: UserInfo) -> Iterator[str]:
+        yield from self.generate_base_words(user_info)
+    
+    def enhance_wordlist(self, base_words: List[str]) -> List[str]:
+        # Kalıp tabanlı genişletme zaten varyasyon/kural aşamalarında yapılıyor
+        print(f"{Fore.CYAN}ℹ️  Yerel modda AI geliştirme adımı atlandı")
+        return []
+    
+    def enhance_wordlist_concurrent(self, base_words: List[str], **kwargs) -> List[str]:
+        return self.enhance_wordlist(base_words)
+    
+    def _iter_base_words(self, user_info: UserInfo) -> Iterator[str]:
+        primary = field_tokens(user_info, PRIMARY_FIELDS)
+        people = field_tokens(user_info, PERSON_FIELDS)
+        topics = field_tokens(user_info, TOPIC_FIELDS)
+        numbers = number_tokens(user_info)
+        
+        # İsim, soyisim kombinasyonları
+        yield from primary
+        name = tokenize_field(user_info.name)[:1] if user_info.name else []
+        surname = tokenize_field(user_info.surname)[:1] if user_info.surname else []
+        if name and surname:
+            yield name[0] + surname[0]
+            yield surname[0] + name[0]
+            yield name[0][0] + surname[0]
+        
+        # Aile, evcil hayvan, şehir, meslek, hobi vb.
+        yield from people
+        yield from topics
+        
+        # E-mail kullanıcı adı ve parçaları
+        if user_info.email and '@' in user_info.email:
+            local_part = transliterate(user_info.email.split('@')[0])
+            yield re.sub(r'[^a-z0-9]', '', local_part)
+            yield from (part for part in re.split(r'[^a-z]+', local_part) if len(part) >= 2)
+        
+        # Tarihler, şanslı sayılar ve telefon numarası
+        yield from numbers
+        if user_info.phone:
+            digits = re.sub(r'\D', '', user_info.phone)
+            if len(digits) >= 4:
+                yield digits[-4:]
+        
+        # Kelime + sayı kalıpları (ahmet1990, yilmaz53, istanbul0503 ...)
+        for token in primary + people + topics:
+            for number in numbers:
+                yield token + number
@@ -0,0 +1,101 @@
+import cProfile
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # macOS bayt, Linux kilobayt döndürür
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class RunMetrics:
+    
+    def __init__(self, output_path: Optional[str] = None, profile: bool = False,
+                 profile_dir: str = 'profiles'):
+        self.output_path = output_path
+        self.profile = profile
+        self.profile_dir = profile_dir
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.stages = []
+        self._profiling = False
+        self._started = time.perf_counter()
+    
+    @contextmanager
+    def stage(self, name: str, ai_source=None) -> Iterator[dict]:
+        # Çağıran taraf kaydı items_in / items_out ve ek alanlarla doldurabilir
+        record = {'run_id': self.run_id, 'stage': name}
+        ai_before = dict(ai_source.ai_stats) if ai_source is not None else None
+        # İç içe aşamalarda sadece dıştaki profillenir (aynı anda tek profilleyici çalışabilir)
+        profiler = cProfile.Profile() if self.profile and not self._profiling else None
+        
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        if profiler:
+            self._profiling = True
+            profiler.enable()
+        try:
+            yield record
+            record['status'] = 'ok'
+        except BaseException as e:
+            record['status'] = type(e).__name__
+            raise
+        finally:
+            if profiler:
+                profiler.disable()
+                self._profiling = False
+                os.makedirs(self.profile_dir, exist_ok=True)
+                profile_file = os.path.join(self.profile_dir, f"{self.run_id}_{name}.prof")
+                profiler.dump_stats(profile_file)
+                record['profile'] = profile_file
+            
+            record['wall_seconds'] = round(time.perf_counter() - wall_started, 6)
+            record['cpu_seconds'] = round(time.process_time() - cpu_started, 6)
+            record['peak_rss_kb'] = peak_rss_kb()
+            
+            # Sadece aday düşüren aşamalar için (genişleten aşamalarda anlamsız)
+            if record.get('items_in') and record.get('items_out', 0) <= record['items_in']:
+                record['dedup_ratio'] = round(1 - record.get('items_out', 0) / record['items_in'], 6)
+            if ai_before is not None:
+                for key, value in ai_source.ai_stats.items():
+                    delta = value - ai_before.get(key, 0)
+                    record[f'ai_{key}'] = round(delta, 6) if isinstance(delta, float) else delta
+            
+            self.stages.append(record)
+            self._emit(record)
+    
+    def _emit(self, record: dict):
+        if not self.output_path:
+            return
+        directory = os.path.dirname(self.output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.output_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    
+    def summary(self) -> dict:
+        return {
+            'run_id': self.run_id,
+            'stage': 'summary',
+            'wall_seconds': round(time.perf_counter() - self._started, 6),
+            'peak_rss_kb': peak_rss_kb(),
+            'stages': len(self.stages),
+        }
+    
+    def finish(self) -> dict:
+        summary = self.summary()
+        self._emit(summary)
+        return summary
@@ -0,0 +1,50 @@
+import re
+from typing import Iterable, List, Tuple
+from models.rule_engine import date_tokens, parse_date
+from models.user_info import UserInfo
+
+# Gemini istemine verilen "Türkçe karakterleri İngilizce karakterlere dönüştür" kuralının yerel karşılığı
+TURKISH_TRANSLITERATION = str.maketrans('çğıöşüâîûÇĞİÖŞÜÂÎÛ', 'cgiosuaiucgiosuaiu')
+# Önemli tarihlerden üretilen sayı biçimleri (date_tokens anahtarlarıyla aynı adlar)
+DATE_FORMATS = {
+    'year': lambda day, month, year: year,
+    'yy': lambda day, month, year: year[-2:],
+    'ddmm': lambda day, month, year: day + month,
+    'ddmmyy': lambda day, month, year: day + month + year[-2:],
+    'ddmmyyyy': lambda day, month, year: day + month + year,
+}
+
+def transliterate(text: str) -> str:
+    return text.translate(TURKISH_TRANSLITERATION).lower()
+
+def tokenize_field(value: str) -> List[str]:
+    # Virgülle ayrılmış değerler; çok kelimeli değerler hem bitişik hem parça parça alınır
+    tokens = []
+    for item in value.split(','):
+        parts = re.findall(r'[a-z0-9]+', transliterate(item))
+        if len(parts) > 1:
+            tokens.append(''.join(parts))
+        tokens.extend(parts)
+    return [token for token in tokens if len(token) >= 2]
+
+def field_tokens(user_info: UserInfo, field_names: Iterable[str]) -> List[str]:
+    tokens = []
+    for field_name in field_names:
+        value = getattr(user_info, field_name)
+        if value:
+            tokens.extend(tokenize_field(value))
+    return list(dict.fromkeys(tokens))
+
+def number_tokens(user_info: UserInfo, date_formats: Tuple[str, ...] = ('year', 'ddmm')) -> List[str]:
+    # Doğum tarihi ve şanslı sayılar; önemli tarihler date_formats biçimlerinde eklenir
+    numbers = []
+    for values in date_tokens(user_info).values():
+        numbers.extend(values)
+    if user_info.memorable_dates:
+        for value in user_info.memorable_dates.split(','):
+            parsed = parse_date(value)
+            if parsed:
+                numbers.extend(DATE_FORMATS[name](*parsed) for name in date_formats)
+            elif value.strip().isdigit():
+                numbers.append(value.strip())
+    return list(dict.fromkeys(numbers))
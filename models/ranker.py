@@ -0,0 +1,113 @@
+import heapq
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional
+from models.external_sort import ExternalSorter, iter_file_lines
+from models.user_info import UserInfo
+
+START = '\x02'
+END = '\x03'
+# Sıralama anahtarının sabit genişlikte ve pozitif kalması için kaydırma değeri
+SCORE_OFFSET = 1_000_000
+
+class MarkovRanker:
+    
+    def __init__(self, order: int = 3, smoothing: float = 0.01,
+                 base_word_boost: float = 8.0, token_boost: float = 4.0):
+        self.order = order
+        self.smoothing = smoothing
+        self.base_word_boost = base_word_boost
+        self.token_boost = token_boost
+        self.counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.totals: Dict[str, int] = defaultdict(int)
+        self.alphabet = {END}
+        self.base_words = set()
+        self._token_pattern = None
+        self.reference = None
+        self.reference_boost = 0.0
+    
+    def train(self, words: Iterable[str]) -> int:
+        trained = 0
+        for word in words:
+            padded = START * self.order + word + END
+            for i in range(self.order, len(padded)):
+                context = padded[i - self.order:i]
+                self.counts[context][padded[i]] += 1
+                self.totals[context] += 1
+            self.alphabet.update(word)
+            trained += 1
+        return trained
+    
+    def train_file(self, filename: str) -> int:
+        return self.train(iter_file_lines(filename))
+    
+    def set_boosts(self, base_words: Iterable[str], user_info: Optional[UserInfo] = None):
+        # AI temel kelimeleri birebir, UserInfo alanlarından çıkan parçalar içerik olarak ödüllendirilir
+        self.base_words = {word.lower() for word in base_words if word}
+        tokens = set()
+        if user_info is not None:
+            for value in user_info.__dict__.values():
+                if value:
+                    tokens.update(
+                        token for token in re.split(r'[\s,;@./_-]+', value.lower()) if len(token) >= 3
+                    )
+        if tokens:
+            alternatives = sorted((re.escape(token) for token in tokens), key=len, reverse=True)
+            self._token_pattern = re.compile('|'.join(alternatives))
+        else:
+            self._token_pattern = None
+    
+    def set_reference(self, reference, boost: float = 12.0):
+        # Referans dizininde (ör. sızıntı listesi) bulunan adaylar gerçek şifre sayılıp ödüllendirilir
+        self.reference = reference
+        self.reference_boost = boost
+    
+    def score(self, word: str) -> float:
+        vocabulary = len(self.alphabet)
+        padded = START * self.order + word + END
+        log_prob = 0.0
+        for i in range(self.order, len(padded)):
+            context = padded[i - self.order:i]
+            count = self.counts[context].get(padded[i], 0) if context in self.counts else 0
+            log_prob += math.log(
+                (count + self.smoothing) / (self.totals.get(context, 0) + self.smoothing * vocabulary)
+            )
+        
+        lowered = word.lower()
+        if lowered in self.base_words:
+            log_prob += self.base_word_boost
+        if self._token_pattern is not None and self._token_pattern.search(lowered):
+            log_prob += self.token_boost
+        if self.reference is not None and word in self.reference:
+            log_prob += self.reference_boost
+        return log_prob
+    
+    def top_k(self, words: Iterable[str], k: int) -> List[str]:
+        # Sınırlı yığın: bellekte en fazla k aday tutulur
+        heap = []
+        seen = set()
+        for word in words:
+            item = (self.score(word), word)
+            if len(heap) < k:
+                if word not in seen:
+                    heapq.heappush(heap, item)
+                    seen.add(word)
+            elif item > heap[0] and word not in seen:
+                removed = heapq.heapreplace(heap, item)
+                seen.discard(removed[1])
+                seen.add(word)
+        return [word for _, word in sorted(heap, key=lambda item: (-item[0], item[1]))]
+    
+    def rank(self, words: Iterable[str], top_k: int = 0, memory_limit_mb: float = 256,
+             temp_dir: Optional[str] = None) -> Iterator[str]:
+        if top_k > 0:
+            yield from self.top_k(words, top_k)
+            return
+        
+        # Tam sıralama dış sıralama üzerinden yapılır; skor, azalan sırayı veren
+        # sabit genişlikte bir anahtara çevrilir ve tüm liste belleğe alınmaz
+        sorter = ExternalSorter(memory_limit_mb, temp_dir)
+        sorter.add(f"{SCORE_OFFSET - self.score(word):016.6f}\t{word}" for word in words)
+        for line in sorter.iter_sorted():
+            yield line.split('\t', 1)[1]
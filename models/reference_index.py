@@ -0,0 +1,182 @@
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+from models.external_sort import ExternalSorter, iter_file_lines, write_lines
+
+REFERENCE_MODES = ('exclude', 'prioritize')
+BLOOM_MAGIC = b'WLBF'
+# Başlık: sihirli değer, hash sayısı, bit sayısı
+BLOOM_HEADER = struct.Struct('<4sIQ')
+
+def iter_source_lines(filename: str) -> Iterator[str]:
+    # Sızıntı listelerinde bozuk UTF-8 ve CRLF satır sonları sık görülür
+    with open(filename, 'r', encoding='utf-8', errors='replace', buffering=1024 * 1024) as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            if line:
+                yield line
+
+def _bloom_positions(word: bytes, hash_count: int, bit_count: int) -> Iterator[int]:
+    # Çift hash: tek blake2b özetinden k konum türetilir
+    digest = hashlib.blake2b(word, digest_size=16).digest()
+    first = int.from_bytes(digest[:8], 'little')
+    second = int.from_bytes(digest[8:], 'little') | 1
+    for i in range(hash_count):
+        yield (first + i * second) % bit_count
+
+class ReferenceIndex:
+    # Diskte kalan, sıralı ve mmap ile okunan referans wordlist dizini.
+    # <yol>: sıralı, tekrarsız, satır başına bir kelime (UTF-8 bayt sırası = kod noktası sırası)
+    # <yol>.bloom: isteğe bağlı Bloom filtresi, <yol>.json: kaynak ve sayım bilgisi.
+    # Dosyalar salt okunur eşlendiği için süreçler arasında kopyalanmadan, sayfa önbelleği
+    # üzerinden paylaşılır; pickle edildiğinde sadece yol taşınır.
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.queries = 0
+        self._open()
+    
+    def _open(self):
+        self._file = open(self.path, 'rb')
+        self.size = os.path.getsize(self.path)
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        
+        self._bloom = None
+        bloom_path = self.path + '.bloom'
+        if os.path.exists(bloom_path):
+            self._bloom_file = open(bloom_path, 'rb')
+            self._bloom = mmap.mmap(self._bloom_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self._hash_count, self._bit_count = BLOOM_HEADER.unpack_from(self._bloom)
+            if magic != BLOOM_MAGIC:
+                raise ValueError(f"{bloom_path} geçerli bir Bloom filtresi değil")
+    
+    @classmethod
+    def build(cls, sources: List[str], path: str, memory_limit_mb: float = 256,
+              temp_dir: Optional[str] = None, bloom_bits_per_item: float = 10) -> 'ReferenceIndex':
+        # Kaynaklar dış sıralama ile tekrarsız sıralanır; bellek kullanımı sınırlıdır
+        sorter = ExternalSorter(memory_limit_mb, temp_dir)
+        for source in sources:
+            sorter.add(iter_source_lines(source))
+        count = write_lines(sorter.iter_sorted(), path)
+        
+        if bloom_bits_per_item > 0 and count:
+            cls._build_bloom(path, count, bloom_bits_per_item)
+        elif os.path.exists(path + '.bloom'):
+            os.remove(path + '.bloom')
+        
+        with open(path + '.json', 'w', encoding='utf-8') as f:
+            json.dump({
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'sources': [os.path.abspath(source) for source in sources],
+                'count': count,
+                'bytes': os.path.getsize(path),
+                'bloom_bits_per_item': bloom_bits_per_item if count else 0,
+            }, f, indent=2, ensure_ascii=False)
+        return cls(path)
+    
+    @staticmethod
+    def _build_bloom(path: str, count: int, bits_per_item: float):
+        bit_count = max(64, int(count * bits_per_item))
+        hash_count = max(1, round(bits_per_item * math.log(2)))
+        byte_count = BLOOM_HEADER.size + (bit_count + 7) // 8
+        
+        # Bit dizisi de dosyaya eşlenerek doldurulur, büyük listelerde RAM'e alınmaz
+        bloom_path = path + '.bloom'
+        with open(bloom_path, 'wb') as f:
+            f.truncate(byte_count)
+        with open(bloom_path, 'r+b') as f:
+            bits = mmap.mmap(f.fileno(), byte_count)
+            BLOOM_HEADER.pack_into(bits, 0, BLOOM_MAGIC, hash_count, bit_count)
+            offset = BLOOM_HEADER.size
+            for word in iter_file_lines(path):
+                for position in _bloom_positions(word.encode('utf-8'), hash_count, bit_count):
+                    bits[offset + (position >> 3)] |= 1 << (position & 7)
+            bits.flush()
+            bits.close()
+    
+    def __contains__(self, word: str) -> bool:
+        self.queries += 1
+        key = word.encode('utf-8')
+        if self._bloom is not None and not self._bloom_contains(key):
+            return False
+        found = self._search(key)
+        self.hits += found
+        return found
+    
+    def _bloom_contains(self, key: bytes) -> bool:
+        bits = self._bloom
+        offset = BLOOM_HEADER.size
+        for position in _bloom_positions(key, self._hash_count, self._bit_count):
+            if not bits[offset + (position >> 3)] & (1 << (position & 7)):
+                return False
+        return True
+    
+    def _search(self, key: bytes) -> bool:
+        # Satır sınırlarına hizalanan ikili arama: [low, high) her zaman satır başlarıdır
+        data = self._data
+        low, high = 0, self.size
+        while low < high:
+            middle = (low + high) // 2
+            newline = data.rfind(b'\n', low, middle)
+            start = newline + 1 if newline >= 0 else low
+            end = data.find(b'\n', start)
+            if end == -1:
+                end = self.size
+            line = data[start:end]
+            if line == key:
+                return True
+            if line < key:
+                low = end + 1
+            else:
+                high = start
+        return False
+    
+    def exclude(self, words: Iterable[str]) -> Iterator[str]:
+        # Daha önce denenmiş adayları eler
+        for word in words:
+            if word not in self:
+                yield word
+    
+    def prioritize(self, words: Iterable[str], temp_dir: Optional[str] = None) -> Iterator[str]:
+        # Bilinen gerçek şifreler hemen verilir, diğerleri geçici dosyada bekletilip sonra
+        # aynı sırayla eklenir (iki grubun kendi içindeki sırası korunur, bellek sınırlı kalır)
+        with tempfile.TemporaryFile('w+', encoding='utf-8', dir=temp_dir) as deferred:
+            for word in words:
+                if word in self:
+                    yield word
+                else:
+                    deferred.write(word + '\n')
+            deferred.seek(0)
+            for line in deferred:
+                yield line.rstrip('\n')
+    
+    def apply(self, words: Iterable[str], mode: str, temp_dir: Optional[str] = None) -> Iterator[str]:
+        if mode == 'exclude':
+            return self.exclude(words)
+        if mode == 'prioritize':
+            return self.prioritize(words, temp_dir)
+        raise ValueError(f"Bilinmeyen referans modu: {mode}")
+    
+    def close(self):
+        if self.size:
+            self._data.close()
+        self._file.close()
+        if self._bloom is not None:
+            self._bloom.close()
+            self._bloom_file.close()
+    
+    def __getstate__(self):
+        return {'path': self.path}
+    
+    def __setstate__(self, state):
+        self.path = state['path']
+        self.hits = 0
+        self.queries = 0
+        self._open()
@@ -0,0 +1,275 @@
+import re
+import string
+from functools import partial
+from itertools import product
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from models.user_info import UserInfo
+
+MASK_CHARSETS = {
+    'd': string.digits,
+    'l': string.ascii_lowercase,
+    'u': string.ascii_uppercase,
+}
+DATE_FIELDS = ('year', 'yy', 'dd', 'mm', 'ddmm', 'mmdd', 'ddmmyy', 'ddmmyyyy', 'yyyymmdd', 'lucky')
+# Bu boyutun altındaki maskeler bağlama sırasında önceden açılır
+PRECOMPUTE_LIMIT = 100_000
+
+class RuleSyntaxError(ValueError):
+    pass
+
+class RuleBudgetError(RuntimeError):
+    pass
+
+def parse_date(value: str) -> Optional[Tuple[str, str, str]]:
+    # GG/AA/YYYY, GG.AA.YYYY, GG-AA-YYYY veya YYYY-AA-GG -> (gün, ay, yıl)
+    parts = [part for part in re.split(r'[/.\-\s]+', value.strip()) if part]
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return None
+    if len(parts[0]) == 4:
+        year, month, day = parts
+    else:
+        day, month, year = parts
+    if len(year) == 2:
+        year = ('19' if int(year) > 30 else '20') + year
+    return day.zfill(2), month.zfill(2), year
+
+def date_tokens(user_info: UserInfo) -> Dict[str, Tuple[str, ...]]:
+    tokens = {}
+    parsed = parse_date(user_info.birth_date) if user_info.birth_date else None
+    year = user_info.birth_year.strip() if user_info.birth_year else (parsed[2] if parsed else None)
+    
+    if year:
+        tokens['year'] = (year,)
+        tokens['yy'] = (year[-2:],)
+    if parsed:
+        day, month, full_year = parsed
+        tokens.update({
+            'dd': (day,), 'mm': (month,),
+            'ddmm': (day + month,), 'mmdd': (month + day,),
+            'ddmmyy': (day + month + full_year[-2:],),
+            'ddmmyyyy': (day + month + full_year,),
+            'yyyymmdd': (full_year + month + day,),
+        })
+    if user_info.lucky_numbers:
+        lucky = tuple(dict.fromkeys(
+            number.strip() for number in user_info.lucky_numbers.split(',') if number.strip()
+        ))
+        if lucky:
+            tokens['lucky'] = lucky
+    return tokens
+
+def _toggle_at(word: str, position: int) -> str:
+    if position >= len(word):
+        return word
+    return word[:position] + word[position].swapcase() + word[position + 1:]
+
+def _apply_function(name: str, arg, word: str) -> str:
+    # Süreç havuzuna gönderilebilmesi için fonksiyonlar isimle saklanır (lambda yok)
+    if name == ':':
+        return word
+    if name == 'l':
+        return word.lower()
+    if name == 'u':
+        return word.upper()
+    if name == 'c':
+        return word.capitalize()
+    if name == 'C':
+        return word[:1].lower() + word[1:].upper()
+    if name == 't':
+        return word.swapcase()
+    if name == 'r':
+        return word[::-1]
+    if name == 'd':
+        return word + word
+    if name == '[':
+        return word[1:]
+    if name == ']':
+        return word[:-1]
+    if name == 'T':
+        return _toggle_at(word, arg)
+    if name == 's':
+        return word.replace(arg[0], arg[1])
+    raise RuleSyntaxError(f"Bilinmeyen fonksiyon '{name}'")
+
+SIMPLE_FUNCTIONS = (':', 'l', 'u', 'c', 'C', 't', 'r', 'd', '[', ']')
+
+# Kompakt kural/maske dili. Her satır bir kuraldır, fonksiyonlar boşlukla ayrılır ve
+# sırayla uygulanır:
+#   :  değiştirme yok          l / u / c / C / t  büyük-küçük harf dönüşümleri
+#   TN N. karakteri çevir      r  ters çevir      d  çoğalt      [ / ]  ilk/son karakteri sil
+#   sXY X'i Y yap              $maske  sona ekle  ^maske  başa ekle
+# Maskelerde ?d ?l ?u ?s ?a karakter kümeleri, {year} {yy} {dd} {mm} {ddmm} {mmdd} {ddmmyy}
+# {ddmmyyyy} {yyyymmdd} {lucky} profil alanları ve düz karakterler kullanılabilir (?? = ?).
+class RuleSet:
+    
+    def __init__(self, text: str, special_chars: str = '!@#$%*&'):
+        self.text = text
+        self.special_chars = special_chars
+        self.rules = []
+        for line_number, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if line and not line.startswith('#'):
+                self.rules.append(self._parse_rule(line, line_number))
+    
+    @classmethod
+    def from_file(cls, path: str, special_chars: str = '!@#$%*&') -> 'RuleSet':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(f.read(), special_chars)
+    
+    def _parse_rule(self, line: str, line_number: int) -> List[tuple]:
+        steps = []
+        for token in line.split():
+            if token in SIMPLE_FUNCTIONS:
+                steps.append(('func', (token, None)))
+            elif re.fullmatch(r'T\d+', token):
+                steps.append(('func', ('T', int(token[1:]))))
+            elif token[0] == 's' and len(token) == 3:
+                steps.append(('func', ('s', token[1:])))
+            elif token[0] in '$^' and len(token) > 1:
+                steps.append(('append' if token[0] == '$' else 'prepend',
+                              self._parse_mask(token[1:], line_number)))
+            else:
+                raise RuleSyntaxError(f"Kural satırı {line_number}: bilinmeyen fonksiyon '{token}'")
+        return steps
+    
+    def _parse_mask(self, mask: str, line_number: int) -> List[tuple]:
+        # Maske elemanları: ('set', karakterler) veya ('field', alan_adı)
+        elements = []
+        i = 0
+        while i < len(mask):
+            char = mask[i]
+            if char == '?' and i + 1 < len(mask):
+                code = mask[i + 1]
+                if code in MASK_CHARSETS:
+                    elements.append(('set', MASK_CHARSETS[code]))
+                elif code == 's':
+                    elements.append(('set', self.special_chars))
+                elif code == 'a':
+                    elements.append(('set', string.ascii_letters + string.digits + self.special_chars))
+                elif code == '?':
+                    elements.append(('set', '?'))
+                else:
+                    raise RuleSyntaxError(f"Kural satırı {line_number}: bilinmeyen maske '?{code}'")
+                i += 2
+            elif char == '{':
+                end = mask.find('}', i)
+                if end == -1:
+                    raise RuleSyntaxError(f"Kural satırı {line_number}: kapanmayan '{{'")
+                field_name = mask[i + 1:end]
+                if field_name not in DATE_FIELDS:
+                    raise RuleSyntaxError(f"Kural satırı {line_number}: bilinmeyen alan '{{{field_name}}}'")
+                elements.append(('field', field_name))
+                i = end + 1
+            else:
+                elements.append(('set', char))
+                i += 1
+        return elements
+    
+    def bind(self, user_info: UserInfo) -> 'BoundRuleSet':
+        return BoundRuleSet(self.rules, date_tokens(user_info))
+
+class BoundRuleSet:
+    
+    def __init__(self, rules: List[List[tuple]], fields: Dict[str, Tuple[str, ...]]):
+        # Profil alanları maskelere yerleştirilir; değeri olmayan alan içeren kurallar düşer
+        self.rules = []
+        for steps in rules:
+            compiled = []
+            multiplicity = 1
+            for kind, payload in steps:
+                if kind == 'func':
+                    compiled.append((kind, payload))
+                    continue
+                options = [
+                    tuple(payload_value) if element_kind == 'set' else fields.get(payload_value, ())
+                    for element_kind, payload_value in payload
+                ]
+                size = 1
+                for option in options:
+                    size *= len(option)
+                if size == 0:
+                    multiplicity = 0
+                    break
+                multiplicity *= size
+                expanded = [''.join(parts) for parts in product(*options)] \
+                    if size <= PRECOMPUTE_LIMIT else options
+                compiled.append((kind, (size <= PRECOMPUTE_LIMIT, expanded)))
+            if multiplicity:
+                self.rules.append((compiled, multiplicity))
+        
+        self.multiplicity = sum(multiplicity for _, multiplicity in self.rules)
+        self.sample_total = 0
+        self.sample_budget = 0
+    
+    def keyspace(self, word_count: int) -> int:
+        return word_count * self.multiplicity
+    
+    def enforce_budget(self, word_count: int, position_count: int, budget: int,
+                       mode: str = 'refuse') -> int:
+        # Anahtar uzayı üretimden önce hesaplanır; bütçe aşılırsa reddedilir veya örneklenir.
+        # position_count: örnekleme konumları için kelime indeks aralığı (kurala girmeyen
+        # kelimeler de yer kaplar, bu yüzden üretilen aday sayısı bütçeyi aşmaz)
+        keyspace = self.keyspace(word_count)
+        if budget and keyspace > budget:
+            if mode != 'sample':
+                raise RuleBudgetError(
+                    f"Kural anahtar uzayı ({keyspace:,}) bütçeyi ({budget:,}) aşıyor"
+                )
+            self.sample_total = self.keyspace(position_count)
+            self.sample_budget = budget
+        return keyspace
+    
+    def apply(self, word: str, word_index: int = 0) -> Iterator[str]:
+        for _, candidates in self.segments(word, word_index):
+            yield from candidates()
+    
+    def segments(self, word: str, word_index: int = 0) -> List[Tuple[int, Callable[[], Iterator[str]]]]:
+        # Kural başına (aday sayısı, üreteç); sayılar üretim yapılmadan hesaplanır, böylece
+        # dağıtık parçalamada bir düğüm sadece kendi aralığına düşen kuralları uygular
+        segments = []
+        position = word_index * self.multiplicity
+        for compiled, multiplicity in self.rules:
+            if self.sample_budget:
+                count = self._sample_count(position, multiplicity)
+                candidates = partial(self._sampled, self._apply_rule(word, compiled), position)
+            else:
+                count = multiplicity
+                candidates = partial(self._apply_rule, word, compiled)
+            segments.append((count, candidates))
+            position += multiplicity
+        return segments
+    
+    def _sample_count(self, position: int, multiplicity: int) -> int:
+        # _sampled'in [position, position + multiplicity) aralığında seçtiği konum sayısı
+        total, budget = self.sample_total, self.sample_budget
+        return (position + multiplicity) * budget // total - position * budget // total
+    
+    def _sampled(self, candidates: Iterator[str], position: int) -> Iterator[str]:
+        # Konuma bağlı eşit aralıklı örnekleme: durumsuzdur, paralel parçalarda da aynı sonucu verir
+        total, budget = self.sample_total, self.sample_budget
+        for offset, candidate in enumerate(candidates):
+            current = position + offset
+            if (current + 1) * budget // total > current * budget // total:
+                yield candidate
+    
+    def _apply_rule(self, word: str, compiled: List[tuple]) -> Iterator[str]:
+        words = [word]
+        for kind, payload in compiled:
+            if kind == 'func':
+                name, arg = payload
+                words = [_apply_function(name, arg, current) for current in words]
+                continue
+            precomputed, values = payload
+            if not precomputed:
+                words = self._lazy_affix(words, values, append=(kind == 'append'))
+            elif kind == 'append':
+                words = [current + affix for current in words for affix in values]
+            else:
+                words = [affix + current for current in words for affix in values]
+        yield from words
+    
+    def _lazy_affix(self, words, options, append: bool) -> Iterator[str]:
+        for current in words:
+            for parts in product(*options):
+                affix = ''.join(parts)
+                yield current + affix if append else affix + current
@@ -0,0 +1,406 @@
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from typing import Callable, Iterator, List, Optional
+from urllib.parse import parse_qs, urlsplit
+from colorama import Fore
+from models.user_info import UserInfo, UserInfoCollector
+from models.wordlist_processor import WordlistProcessor
+
+MAX_REQUEST_BYTES = 1024 * 1024
+JOB_STATES = ('queued', 'base_words', 'enhancing', 'expanding', 'done', 'failed')
+
+# CPU havuzundaki her süreç işlemciyi (derlenmiş filtre, kurallar, leet tabloları) başlangıçta
+# bir kez alır; işler arasında sıcak kalır, her işte yeniden pickle edilmez. Üretilen partiler
+# tüm işlerin paylaştığı sonuç kuyruğuyla (iş id'si, kelimeler) olarak ana sürece gönderilir
+_worker_processor: Optional[WordlistProcessor] = None
+_worker_results = None
+
+def _init_cpu_worker(processor: WordlistProcessor, results):
+    global _worker_processor, _worker_results
+    _worker_processor = processor
+    _worker_results = results
+
+def _stream_job_wordlist(job_id: str, base_words: List[str], enhanced_words: List[str],
+                         user_info: UserInfo, chunk_lines: int) -> int:
+    # Akış modundaki hat: adaylar üretildikçe temizlenir, tekrarları elenir ve chunk_lines'lık
+    # partiler halinde gönderilir; liste süreçte birikmez. (iş id'si, None) üretimin bittiğini
+    # bildirir ve hata durumunda da gönderilir
+    processor = _worker_processor
+    try:
+        variations = processor.iter_variations(base_words, user_info)
+        words = processor.iter_unique(processor.iter_clean(
+            processor.iter_candidates(base_words, variations, enhanced_words)
+        ))
+        words = iter(processor.apply_reference(words))
+        count = 0
+        for batch in iter(lambda: list(islice(words, chunk_lines)), []):
+            _worker_results.put((job_id, batch))
+            count += len(batch)
+        return count
+    finally:
+        _worker_results.put((job_id, None))
+
+def parse_address(address: str):
+    # "unix:/yol/soket" veya "host:port" (sadece port da olabilir)
+    if address.startswith('unix:'):
+        return 'unix', address[5:]
+    host, _, port = address.rpartition(':')
+    return 'tcp', (host or '127.0.0.1', int(port))
+
+class Job:
+    
+    def __init__(self, job_id: str, profile_id: str, user_info: UserInfo):
+        self.id = job_id
+        self.profile_id = profile_id
+        self.user_info = user_info
+        self.status = 'queued'
+        # Kelimeler CPU aşaması ürettikçe eklenir; bekleyen yanıtlar her partide uyandırılır
+        self.words: List[str] = []
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.done = threading.Event()
+        # CPU sürecinin gönderdiği son partinin de eklendiğini bildirir
+        self.streamed = threading.Event()
+        self._progress = threading.Condition()
+    
+    def to_dict(self) -> dict:
+        result = {'id': self.id, 'profile_id': self.profile_id, 'status': self.status}
+        if self.started is not None:
+            result['queued_seconds'] = round(self.started - self.created, 3)
+        if self.finished is not None:
+            result['seconds'] = round(self.finished - (self.started or self.created), 3)
+        if self.words or self.status == 'done':
+            result['words'] = len(self.words)
+        if self.error is not None:
+            result['error'] = self.error
+        return result
+    
+    def add_words(self, words: List[str]):
+        with self._progress:
+            self.words.extend(words)
+            self._progress.notify_all()
+    
+    def finish(self, status: str, error: Optional[str] = None):
+        with self._progress:
+            self.status = status
+            self.error = error
+            self.finished = time.time()
+            self.done.set()
+            self._progress.notify_all()
+    
+    def wait_for_words(self):
+        # İlk parti gelene veya iş bitene kadar bekler
+        with self._progress:
+            self._progress.wait_for(lambda: self.words or self.done.is_set())
+    
+    def iter_words(self, size: int) -> Iterator[List[str]]:
+        # Üretilmiş kelimeler en fazla size'lık partiler halinde verilir; iş bitene kadar
+        # yenileri beklenir
+        sent = 0
+        while True:
+            with self._progress:
+                self._progress.wait_for(lambda: len(self.words) > sent or self.done.is_set())
+                words = self.words[sent:sent + size]
+            if not words:
+                return
+            sent += len(words)
+            yield words
+
+class WordlistService:
+    # Uzun süre çalışan yerel servis: model istemcisi ve işlemci (kurallar, filtre) bir kez
+    # kurulur ve tüm işlerde kullanılır. İşler sınırlı bir kuyruğa alınır; AI aşaması ortak bir
+    # eşzamanlılık bütçesiyle, CPU aşaması kalıcı bir süreç havuzunda çalışır
+    
+    def __init__(self, generator, processor: WordlistProcessor, job_workers: int = 4,
+                 ai_concurrency: int = 4, cpu_workers: int = 1, max_queue: int = 100,
+                 max_finished: int = 200, chunk_lines: int = 10000, debug: bool = False,
+                 generate_base_words: Optional[Callable[[UserInfo], List[str]]] = None,
+                 enhance_wordlist: Optional[Callable[[List[str]], List[str]]] = None):
+        self.generator = generator
+        # AI adımları etkileşimli akışla aynı yapılandırmayı (paralel geliştirme, uyarlamalı
+        # istemler) kullanabilsin diye çağrılabilir olarak verilebilir
+        self.generate_base_words = generate_base_words or generator.generate_base_words
+        self.enhance_wordlist = enhance_wordlist or generator.enhance_wordlist
+        self.processor = processor
+        self.job_workers = max(1, job_workers)
+        self.cpu_workers = max(1, cpu_workers)
+        self.max_finished = max(1, max_finished)
+        self.chunk_lines = max(1, chunk_lines)
+        self.debug = debug
+        self.collector = UserInfoCollector()
+        self.jobs = OrderedDict()
+        self.counts = {'submitted': 0, 'succeeded': 0, 'failed': 0, 'rejected': 0}
+        self._queue = queue.Queue(maxsize=max(1, max_queue))
+        self._ai_budget = threading.Semaphore(max(1, ai_concurrency))
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._threads = []
+        self._cpu_pool = None
+        self._results = None
+        self._server = None
+        self.started = time.time()
+    
+    def start(self):
+        self._results = multiprocessing.Queue()
+        self._cpu_pool = ProcessPoolExecutor(max_workers=self.cpu_workers, initializer=_init_cpu_worker,
+                                             initargs=(self.processor, self._results))
+        dispatcher = threading.Thread(target=self._dispatch_results, name="result-dispatcher", daemon=True)
+        dispatcher.start()
+        for index in range(self.job_workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def serve_forever(self, address: str):
+        kind, target = parse_address(address)
+        if kind == 'unix':
+            if os.path.exists(target):
+                os.remove(target)
+            self._server = UnixHTTPServer(target, ServiceRequestHandler)
+        else:
+            self._server = ThreadingHTTPServer(target, ServiceRequestHandler)
+        self._server.service = self
+        self.start()
+        print(f"{Fore.GREEN}🌐 Servis dinleniyor: {address} "
+              f"(iş: {self.job_workers}, CPU: {self.cpu_workers}, kuyruk: {self._queue.maxsize})")
+        try:
+            self._server.serve_forever()
+        finally:
+            self.shutdown()
+            if kind == 'unix' and os.path.exists(target):
+                os.remove(target)
+    
+    def shutdown(self):
+        if self._server is not None:
+            self._server.server_close()
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:
+                break
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+        if self._results is not None:
+            self._results.put(None)
+    
+    def submit(self, record: dict) -> Job:
+        number = next(self._ids)
+        profile_id, user_info = self.collector.profile_from_record(record, number)
+        job = Job(f"job-{number:06d}", profile_id, user_info)
+        with self._lock:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self.counts['rejected'] += 1
+                raise
+            self.counts['submitted'] += 1
+            self.jobs[job.id] = job
+            self._evict_finished()
+        return job
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self.jobs.get(job_id)
+    
+    def health(self) -> dict:
+        with self._lock:
+            states = {state: 0 for state in JOB_STATES}
+            for job in self.jobs.values():
+                states[job.status] += 1
+            return {
+                'status': 'ok',
+                'model': getattr(self.generator, 'model_name', None),
+                'uptime_seconds': round(time.time() - self.started, 1),
+                'queue_size': self._queue.qsize(),
+                'queue_limit': self._queue.maxsize,
+                'jobs': states,
+                **self.counts,
+            }
+    
+    def _evict_finished(self):
+        # Bitmiş işlerin sonuçları bellekte tutulur; sınır aşılınca en eskiler silinir
+        finished = [job_id for job_id, job in self.jobs.items() if job.done.is_set()]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
+    
+    def _worker(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            job.started = time.time()
+            try:
+                self._run_job(job)
+                job.finish('done')
+            except Exception as e:
+                job.finish('failed', str(e))
+            with self._lock:
+                self.counts['succeeded' if job.status == 'done' else 'failed'] += 1
+            color = Fore.GREEN if job.status == 'done' else Fore.RED
+            print(f"{color}{'✓' if job.status == 'done' else '✗'} {job.id} ({job.profile_id}): "
+                  f"{len(job.words) if job.status == 'done' else job.error}")
+    
+    def _run_job(self, job: Job):
+        job.status = 'base_words'
+        with self._ai_budget:
+            base_words = self.generate_base_words(job.user_info)
+        job.status = 'enhancing'
+        with self._ai_budget:
+            enhanced_words = self.enhance_wordlist(base_words)
+        job.status = 'expanding'
+        future = self._cpu_pool.submit(_stream_job_wordlist, job.id, base_words, enhanced_words,
+                                       job.user_info, self.chunk_lines)
+        # Partiler dağıtıcı üzerinden işe eklenir; süreç çökerse bitiş işareti hiç gelmez
+        while not job.streamed.wait(1):
+            if future.done() and future.exception() is not None:
+                break
+        future.result()
+    
+    def _dispatch_results(self):
+        # CPU süreçlerinden gelen partileri ilgili işe ekler; shutdown None ile durdurur
+        while True:
+            item = self._results.get()
+            if item is None:
+                return
+            job_id, words = item
+            job = self.get(job_id)
+            if job is None:
+                continue
+            if words is None:
+                job.streamed.set()
+            else:
+                job.add_words(words)
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    # POST /jobs             -> bir profil (JSON nesnesi) veya profil listesi kuyruğa alınır (202)
+    # GET  /jobs/<id>        -> iş durumu
+    # GET  /jobs/<id>/wordlist[?wait=0] -> kelimeler üretildikçe chunked olarak akıtılır
+    #                                     (wait=0: iş bitmediyse beklemeden durum döner)
+    # POST /generate         -> tek profil gönderilir, sonuç üretildikçe aynı yanıtta akıtılır
+    # GET  /health           -> kuyruk ve iş sayıları
+    protocol_version = 'HTTP/1.1'
+    server_version = 'WordlistService/1.0'
+    
+    @property
+    def service(self) -> WordlistService:
+        return self.server.service
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        if parts == ['health']:
+            self._send_json(200, self.service.health())
+        elif len(parts) in (2, 3) and parts[0] == 'jobs':
+            job = self.service.get(parts[1])
+            if job is None:
+                self._send_json(404, {'error': f"İş bulunamadı: {parts[1]}"})
+            elif len(parts) == 2:
+                self._send_json(200, job.to_dict())
+            elif parts[2] == 'wordlist':
+                wait = parse_qs(url.query).get('wait', ['1'])[0] != '0'
+                self._send_job_wordlist(job, wait)
+            else:
+                self._send_json(404, {'error': 'Bilinmeyen adres'})
+        else:
+            self._send_json(404, {'error': 'Bilinmeyen adres'})
+    
+    def do_POST(self):
+        path = urlsplit(self.path).path.rstrip('/')
+        if path not in ('/jobs', '/generate'):
+            self._send_json(404, {'error': 'Bilinmeyen adres'})
+            return
+        payload = self._read_json()
+        if payload is None:
+            return
+        records = payload if isinstance(payload, list) else [payload]
+        if not records or not all(isinstance(record, dict) for record in records) or \
+                (path == '/generate' and len(records) != 1):
+            self._send_json(400, {'error': 'Profil JSON nesnesi (veya /jobs için nesne listesi) bekleniyor'})
+            return
+        
+        jobs = []
+        for record in records:
+            try:
+                jobs.append(self.service.submit(record))
+            except queue.Full:
+                self._send_json(503, {'error': 'İş kuyruğu dolu', 'accepted': [job.to_dict() for job in jobs]})
+                return
+        if path == '/generate':
+            self._send_job_wordlist(jobs[0], wait=True)
+        else:
+            self._send_json(202, {'jobs': [job.to_dict() for job in jobs]})
+    
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_REQUEST_BYTES:
+            self._send_json(413, {'error': 'İstek çok büyük'})
+            return None
+        try:
+            return json.loads(self.rfile.read(length).decode('utf-8') or 'null')
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            self._send_json(400, {'error': f"Geçersiz JSON: {e}"})
+            return None
+    
+    def _send_job_wordlist(self, job: Job, wait: bool):
+        if wait:
+            job.wait_for_words()
+        elif not job.done.is_set():
+            self._send_json(202, job.to_dict())
+            return
+        if job.status == 'failed':
+            self._send_json(500, job.to_dict())
+            return
+        
+        # Yanıt ilk parti üretilince başlar; kelimeler CPU aşaması ürettikçe STREAM_BUFFER_LINES
+        # satırlık parçalar halinde chunked aktarımla gönderilir. Toplam sayı sadece iş
+        # bittiyse başlıkta verilir
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('X-Job-Id', job.id)
+        if job.done.is_set():
+            self.send_header('X-Word-Count', str(len(job.words)))
+        self.end_headers()
+        try:
+            for words in job.iter_words(self.service.chunk_lines):
+                data = ('\n'.join(words) + '\n').encode('utf-8')
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+            if job.status == 'failed':
+                # Yanıt başladıktan sonra hata kodu gönderilemez; son parça yazılmadan bağlantı
+                # kapatılır ve istemci yanıtın eksik kaldığını görür
+                self.close_connection = True
+                return
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+    
+    def _send_json(self, status: int, payload: dict):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def address_string(self) -> str:
+        # Unix soketlerinde istemci adresi boş gelir
+        return self.client_address[0] if self.client_address else 'unix'
+    
+    def log_message(self, format, *args):
+        if self.service.debug:
+            print(f"{Fore.CYAN}🌐 {self.address_string()} {format % args}")
@@ -0,0 +1,7 @@
+from typing import Tuple
+
+def shard_range(total: int, shard: Tuple[int, int]) -> Tuple[int, int]:
+    # (0 tabanlı parça, parça sayısı) için [başlangıç, bitiş) konum aralığı; aralıklar
+    # ardışık ve ayrıktır, boyutları en fazla bir farklıdır
+    index, count = shard
+    return total * index // count, total * (index + 1) // count
@@ -1,6 +1,8 @@
 
-from dataclasses import dataclass
-from typing import List, Optional
+import csv
+import json
+from dataclasses import dataclass, fields
+from typing import List, Optional, Tuple
 from colorama import Fore
 
 @dataclass
@@ -84,4 +86,30 @@ class UserInfoCollector:
         )
     
     def get_non_empty_fields(self, user_info: UserInfo) -> dict:
-        return {k: v for k, v in user_info.__dict__.items() if v is not None and v.strip()}
\ No newline at end of file
+        return {k: v for k, v in user_info.__dict__.items() if v is not None and v.strip()}
+    
+    def load_profiles(self, path: str) -> List[Tuple[str, UserInfo]]:
+        # JSONL veya CSV dosyasından (profil_id, UserInfo) çiftleri okunur.
+        # 'id' alanı varsa profil adı olarak kullanılır, bilinmeyen alanlar yok sayılır.
+        if path.lower().endswith('.csv'):
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                records = list(csv.DictReader(f))
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                records = [json.loads(line) for line in f if line.strip()]
+        
+        profiles = [self.profile_from_record(record, index) for index, record in enumerate(records, 1)]
+        
+        print(f"{Fore.GREEN}✓ {len(profiles)} profil yüklendi: {path}")
+        return profiles
+    
+    def profile_from_record(self, record: dict, index: int = 1) -> Tuple[str, UserInfo]:
+        # Tek bir JSON/CSV kaydından (profil_id, UserInfo); bilinmeyen alanlar yok sayılır
+        field_names = {field.name for field in fields(UserInfo)}
+        values = {}
+        for key, value in record.items():
+            if key in field_names and value is not None:
+                value = str(value).strip()
+                values[key] = value or None
+        profile_id = str(record.get('id') or '').strip() or f"profile_{index:04d}"
+        return profile_id, UserInfo(**values)
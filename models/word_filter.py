@@ -0,0 +1,59 @@
+import re
+import string
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+DEFAULT_ALLOWED_CHARS = string.ascii_letters + string.digits + '@#$%&*!._-'
+
+@dataclass
+class PasswordPolicy:
+    min_length: int = 3
+    max_length: int = 50
+    allowed_chars: str = DEFAULT_ALLOWED_CHARS
+    require_digit: bool = False
+    require_lower: bool = False
+    require_upper: bool = False
+    require_special: bool = False
+    exclude_pattern: Optional[str] = None
+
+class WordFilter:
+
+    def __init__(self, policy: Optional[PasswordPolicy] = None):
+        self.policy = policy or PasswordPolicy()
+        self.pattern = self._compile(self.policy)
+        self._fullmatch = self.pattern.fullmatch
+
+    def _compile(self, policy: PasswordPolicy) -> re.Pattern:
+        # Uzunluk, karakter seti, zorunlu karakter sınıfları ve dışlama kalıpları
+        # tek bir derlenmiş ifadede birleştirilir; her aday tek geçişte değerlendirilir
+        allowed = ''.join(dict.fromkeys(policy.allowed_chars))
+        specials = ''.join(char for char in allowed if not char.isalnum())
+
+        lookaheads = []
+        if policy.require_digit:
+            lookaheads.append(r'(?=.*[0-9])')
+        if policy.require_lower:
+            lookaheads.append(r'(?=.*[a-z])')
+        if policy.require_upper:
+            lookaheads.append(r'(?=.*[A-Z])')
+        if policy.require_special:
+            if not specials:
+                raise ValueError("Özel karakter zorunlu ama izin verilen karakterlerde özel karakter yok")
+            lookaheads.append(f'(?=.*[{re.escape(specials)}])')
+        if policy.exclude_pattern:
+            lookaheads.append(f'(?!.*(?:{policy.exclude_pattern}))')
+
+        charset = f'[{re.escape(allowed)}]'
+        quantifier = f'{{{max(policy.min_length, 0)},{policy.max_length}}}'
+        return re.compile(''.join(lookaheads) + charset + quantifier, re.DOTALL)
+
+    def matches(self, word: str) -> bool:
+        return self._fullmatch(word) is not None
+
+    def filter(self, words: Iterable[str]) -> Iterator[str]:
+        fullmatch = self._fullmatch
+        for word in words:
+            if word and isinstance(word, str):
+                word = word.strip()
+                if fullmatch(word):
+                    yield word
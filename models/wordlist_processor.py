@@ -1,74 +1,394 @@
 
 
-from typing import List, Set
+from functools import partial
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
 from colorama import Fore
 from models.user_info import UserInfo
+from models.candidate_trie import CandidateTrie, iter_store_sorted, new_candidate_store
+from models.combinator import Combinator
+from models.leet_engine import DEFAULT_LEET_MAP, LeetEngine
+from models.reference_index import ReferenceIndex
+from models.rule_engine import BoundRuleSet, RuleSet
+from models.sharding import shard_range
+from models.word_filter import PasswordPolicy, WordFilter
+from models.wordlist_writer import write_wordlist
 import re
+import time
+import zlib
 
 class WordlistProcessor:
     
-    def __init__(self):
+    def __init__(self, policy: Optional[PasswordPolicy] = None, leet_map: Optional[dict] = None,
+                 leet_combinations: bool = False, leet_max_per_word: int = 256,
+                 rules: Optional[RuleSet] = None, rule_budget: int = 0,
+                 rule_budget_mode: str = 'refuse', combinator: Optional[Combinator] = None,
+                 reference_index: Optional[ReferenceIndex] = None, reference_mode: str = 'exclude',
+                 shard: Tuple[int, int] = (0, 1), dedup_store: str = 'set'):
+        self.word_filter = WordFilter(policy)
         self.common_numbers = ['1', '12', '123', '1234', '2023', '2024', '2025', '01', '00', '21', '22', '23']
         self.special_chars = ['!', '@', '#', '$', '%', '*', '&']
-        self.leet_map = {
-            'a': '@', 'e': '3', 'i': '1', 'o': '0', 's': '$', 't': '7', 'g': '6', 'l': '1'
+        self.leet_map = dict(leet_map or DEFAULT_LEET_MAP)
+        self.leet_combinations = leet_combinations
+        self.leet_engine = LeetEngine(self.leet_map, leet_max_per_word)
+        # Kural seti verilirse sabit sayı/özel karakter ekleri yerine kurallar uygulanır
+        self.rules = rules
+        self.rule_budget = rule_budget
+        self.rule_budget_mode = rule_budget_mode
+        # Profil alanları arası çapraz birleşimler (evcil hayvan + yıl, şehir + tarih, ...)
+        self.combinator = combinator
+        # Referans dizini: daha önce denenmiş adayları ele veya bilinen şifreleri öne al
+        self.reference_index = reference_index
+        self.reference_mode = reference_mode
+        # Dağıtık parçalama (0 tabanlı parça, parça sayısı): her düğüm numaralandırmanın
+        # sadece kendine düşen konum aralığını genişletir, koordinatör gerekmez
+        self.shard_index, self.shard_count = shard
+        # Tekrar eleme deposu: 'set' veya bellekte kompakt 'trie' (çıktı sıralı olur)
+        self.dedup_store = dedup_store
+        self.last_expansion_stats = {}
+    
+    def config_fingerprint(self) -> dict:
+        # Varyasyon çıktısını etkileyen ayarlar (kontrol noktası parmak izi için)
+        return {
+            'common_numbers': self.common_numbers,
+            'special_chars': self.special_chars,
+            'leet_map': self.leet_map,
+            'leet_combinations': self.leet_combinations,
+            'leet_max_per_word': self.leet_engine.max_per_word,
+            'rules': self.rules.text if self.rules else None,
+            'rule_budget': [self.rule_budget, self.rule_budget_mode],
+            'combinator': [self.combinator.separators, self.combinator.casings, self.combinator.budget]
+            if self.combinator else None,
+            'shard': [self.shard_index, self.shard_count],
         }
     
-    def create_variations(self, base_words: List[str], user_info: UserInfo) -> List[str]:
+    def owns(self, word: str) -> bool:
+        # Hazır girdi listeleri (temel/AI kelimeleri, ad-soyad/e-posta/telefon kümeleri)
+        # genişletme gerektirmez; bunlar kelimenin kararlı CRC32'sine göre bölünür
+        if self.shard_count == 1:
+            return True
+        return zlib.crc32(word.encode('utf-8')) % self.shard_count == self.shard_index
+    
+    def iter_owned(self, words: Iterable[str]) -> Iterable[str]:
+        if self.shard_count == 1:
+            return words
+        return (word for word in words if self.owns(word))
+    
+    def iter_candidates(self, base_words: Iterable[str], variations: Iterable[str],
+                        enhanced_words: Iterable[str]) -> Iterator[str]:
+        # Temizlemeye giden ham akış; varyasyonlar zaten parçaya göre üretildiği için
+        # sadece girdi listeleri bölünür
+        return chain(self.iter_owned(base_words), variations, self.iter_owned(enhanced_words))
+    
+    def create_variations(self, base_words: List[str], user_info: UserInfo,
+                          workers: int = 1, full_expansion: bool = False) -> List[str]:
         print(f"{Fore.YELLOW}🔄 Kelime varyasyonları oluşturuluyor...")
         
-        variations = set()
-        for word in base_words:
-            if word and len(word) >= 2:
-                variations.add(word.lower())
-                variations.add(word.upper())
-                variations.add(word.capitalize())
+        affixes = self._prepare_affixes(base_words, user_info, full_expansion)
+        
+        if self.leet_combinations:
+            leet_words = [
+                word.lower() for index, word in enumerate(base_words)
+                if word and len(word) >= 4 and (full_expansion or index < 12)
+            ]
+            keyspace = self.leet_engine.estimate_keyspace(leet_words)
+            print(f"{Fore.CYAN}🔢 Leet anahtar uzayı: {keyspace:,} varyant "
+                  f"(kelime başına en fazla {self.leet_engine.max_per_word})")
+        
+        # Bu düğüme hiç konum düşmeyen kelimeler işlere alınmaz
+        jobs = [job for job in self._iter_word_jobs(base_words, affixes, full_expansion)
+                if job[3] != job[4]]
+        
+        # Sıralı dict: tekrarlar elenir, ilk görülme sırası korunur (paralel ve tek
+        # süreçli yol aynı çıktıyı üretir). Trie deposunda çıktı sıralıdır
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        if workers > 1 and len(jobs) > workers:
+            variations, worker_cpu_time, chunk_count = self._expand_parallel(
+                jobs, affixes, workers, full_expansion
+            )
+        else:
+            workers = 1
+            variations = self._new_variation_store()
+            self._collect(variations, self._expand_chunk(jobs, affixes, full_expansion))
+            worker_cpu_time = 0.0
+            chunk_count = 1
+        # Ana süreç (birleştirme dahil) ve işçi süreçlerin toplam CPU süresi
+        cpu_time = time.process_time() - cpu_started + worker_cpu_time
+        wall_time = time.perf_counter() - started
+        
+        self._collect(variations, self._iter_profile_variations(user_info))
+        
+        # CPU kullanımı, genişletme boyunca ortalama meşgul çekirdek sayısıdır; hızlanma
+        # değildir (tek süreçli yolla karşılaştırma için benchmarks/bench_variations.py)
+        self.last_expansion_stats = {
+            'workers': workers,
+            'chunks': chunk_count,
+            'wall_time': wall_time,
+            'cpu_time': cpu_time,
+            'cpu_utilisation': cpu_time / wall_time if wall_time > 0 else 1.0,
+        }
+        
+        result = list(variations)
+        print(f"{Fore.GREEN}✓ {len(result)} varyasyon oluşturuldu")
+        return result
+    
+    def _new_variation_store(self):
+        return CandidateTrie() if self.dedup_store == 'trie' else {}
+    
+    @staticmethod
+    def _collect(store, words: Iterable[str]):
+        if isinstance(store, CandidateTrie):
+            store.update(words)
+        else:
+            store.update(dict.fromkeys(words))
+    
+    def _expand_chunk(self, jobs: List[tuple], affixes, full_expansion: bool = False) -> List[str]:
+        result = []
+        for index, word, duplicate, start, stop in jobs:
+            result.extend(self._iter_word_variations(
+                word, index, affixes, full_expansion, duplicate, start, stop
+            ))
+        return result
+    
+    def _expand_chunk_timed(self, jobs: List[tuple], affixes,
+                            full_expansion: bool = False) -> Tuple[List[str], float]:
+        cpu_started = time.process_time()
+        result = list(dict.fromkeys(self._expand_chunk(jobs, affixes, full_expansion)))
+        return result, time.process_time() - cpu_started
+    
+    def _expand_parallel(self, jobs: List[tuple], affixes, workers: int,
+                         full_expansion: bool = False) -> Tuple[Iterable[str], float, int]:
+        chunk_size = max(1, -(-len(jobs) // (workers * 4)))
+        chunks = [jobs[start:start + chunk_size] for start in range(0, len(jobs), chunk_size)]
+        
+        # multiprocessing yüklemesi başlangıcı yavaşlatır; sadece paralel yolda içe aktarılır
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        variations = self._new_variation_store()
+        # Parçalar bitiş sırasıyla birleştirilir, böylece ana süreçteki birleştirme işçilerle
+        # örtüşür. Sıralı dict deposunda ilk görülme sırası için erken biten parçalar önceki
+        # parçalar gelene kadar bekletilir; trie deposu sıralı olduğundan hemen birleştirir
+        ordered = not isinstance(variations, CandidateTrie)
+        waiting = {}
+        next_chunk = 0
+        cpu_time = 0.0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._expand_chunk_timed, chunk, affixes, full_expansion): number
+                for number, chunk in enumerate(chunks)
+            }
+            for future in as_completed(futures):
+                # Sonuç future'dan ayrılır; birleştirilen parçalar bellekte tutulmaz
+                number = futures.pop(future)
+                chunk_result, chunk_cpu_time = future.result()
+                cpu_time += chunk_cpu_time
+                if not ordered:
+                    self._collect(variations, chunk_result)
+                    continue
+                waiting[number] = chunk_result
+                while next_chunk in waiting:
+                    self._collect(variations, waiting.pop(next_chunk))
+                    next_chunk += 1
+        
+        return variations, cpu_time, len(chunks)
+    
+    def iter_variations(self, base_words: Iterable[str], user_info: UserInfo,
+                        full_expansion: bool = False, include_base_words: bool = False) -> Iterator[str]:
+        # Akış modu: varyasyonlar tek tek üretilir, tüm liste bellekte tutulmaz.
+        # Tekrarlar sadece aynı temel kelimenin varyasyonları arasında elenir.
+        # base_words bir üreteç olabilir (akışlı AI yanıtı); include_base_words ile her
+        # kelime kendi varyasyonlarından hemen önce verilir
+        if not hasattr(base_words, '__len__') and \
+                (self.shard_count > 1 or self.rules is not None and self.rule_budget):
+            # Kural bütçesi ve parça aralıkları tüm anahtar uzayını üretimden önce bilmeyi
+            # gerektirir; akış listeye alınır, aksi halde ikisi de sessizce yanlış hesaplanırdı
+            base_words = list(base_words)
+        affixes = self._prepare_affixes(base_words, user_info, full_expansion)
+        
+        for index, word, duplicate, start, stop in self._iter_word_jobs(base_words, affixes, full_expansion):
+            seen = set()
+            if include_base_words and self.owns(word):
+                seen.add(word)
+                yield word
+            for variation in self._iter_word_variations(
+                    word, index, affixes, full_expansion, duplicate, start, stop):
+                if variation not in seen:
+                    seen.add(variation)
+                    yield variation
+        
+        yield from self._iter_profile_variations(user_info)
+    
+    def _prepare_affixes(self, base_words: Iterable[str], user_info: UserInfo,
+                         full_expansion: bool = False):
+        if self.rules is None:
+            # Profil sayıları kopya listeye eklenir; aynı işlemci birden fazla profilde
+            # kullanıldığında doğum yılları ve şanslı sayılar birbirine karışmaz
+            return self._collect_numbers(user_info)
         
+        bound = self.rules.bind(user_info)
+        if not hasattr(base_words, '__len__'):
+            # Uzunluğu bilinmeyen akışta anahtar uzayı önceden hesaplanamaz
+            print(f"{Fore.CYAN}🔢 Kural çarpanı: kelime başına {bound.multiplicity:,} aday")
+            return bound
+        
+        considered = base_words if full_expansion else base_words[:15]
+        eligible = sum(1 for word in considered if word and len(word) >= 3)
+        keyspace = bound.enforce_budget(eligible, len(considered), self.rule_budget,
+                                        self.rule_budget_mode)
+        print(f"{Fore.CYAN}🔢 Kural anahtar uzayı: {keyspace:,} aday "
+              f"({len(bound.rules)} kural, {eligible} kelime)")
+        if bound.sample_budget:
+            print(f"{Fore.YELLOW}⚠️  Bütçe aşıldı, {bound.sample_budget:,} adaylık örnekleme yapılacak")
+        return bound
+    
+    def _collect_numbers(self, user_info: UserInfo) -> List[str]:
+        numbers = list(self.common_numbers)
         if user_info.birth_year:
-            self.common_numbers.extend([user_info.birth_year, user_info.birth_year[-2:]])
+            numbers.extend([user_info.birth_year, user_info.birth_year[-2:]])
         if user_info.lucky_numbers:
-            numbers = [num.strip() for num in user_info.lucky_numbers.split(',')]
-            self.common_numbers.extend(numbers)
-        
-        for word in base_words[:15]:
-            if word and len(word) >= 3:
-                for num in self.common_numbers:
-                    variations.add(f"{word}{num}")
-                    variations.add(f"{num}{word}")
-        
-        for word in base_words[:10]:
-            if word and len(word) >= 3:
-                for char in self.special_chars:
-                    variations.add(f"{word}{char}")
-                    if len(word) >= 4:
-                        variations.add(f"{char}{word}")
-        
-        for word in base_words[:12]:
-            if word and len(word) >= 4:
-                leet_word = self._to_leet_speak(word.lower())
-                if leet_word != word.lower():
-                    variations.add(leet_word)
-                    variations.add(f"{leet_word}123")
-                    variations.add(f"{leet_word}2024")
+            numbers.extend(num.strip() for num in user_info.lucky_numbers.split(','))
+        return list(dict.fromkeys(num for num in numbers if num))
+    
+    def _iter_word_jobs(self, base_words: Iterable[str], affixes,
+                        full_expansion: bool = False) -> Iterator[tuple]:
+        # (indeks, kelime, kopya türü, başlangıç, bitiş): kelimenin varyasyon konumlarından bu
+        # düğüme düşen [başlangıç, bitiş) aralığı. Tüm kelimelerin konumları uç uca tek bir
+        # numaralandırma oluşturur ve düğümler bunun ardışık aralıklarını alır. Sayılar üretim
+        # yapılmadan hesaplanır; tek düğümde aralık sınırsızdır ve akış tembel kalır
+        words = self._iter_marked_words(base_words)
+        if self.shard_count == 1:
+            for index, word, duplicate in words:
+                yield index, word, duplicate, 0, None
+            return
+        
+        words = list(words)
+        counts = [
+            sum(count for count, _ in self._word_segments(word, index, affixes, full_expansion, duplicate))
+            for index, word, duplicate in words
+        ]
+        start, stop = shard_range(sum(counts), (self.shard_index, self.shard_count))
+        offset = 0
+        for (index, word, duplicate), count in zip(words, counts):
+            yield (index, word, duplicate,
+                   min(max(start - offset, 0), count), min(max(stop - offset, 0), count))
+            offset += count
+    
+    @staticmethod
+    def _iter_marked_words(base_words: Iterable[str]) -> Iterator[Tuple[int, str, Optional[str]]]:
+        # Birden fazla yoldan çıkan aday, en düşük numaralandırma konumundaki yola aittir.
+        # Tekrar gelen temel kelimede ilk geçenle ortak parçalar atlanır: 'exact' birebir aynı
+        # kelime, 'case' harf biçimleri aynı kelime (Ahmet / AHMET). Kontrol genişletme gerektirmez
+        exact, forms = set(), set()
+        for index, word in enumerate(base_words):
+            duplicate = None
+            if word:
+                key = (word.lower(), word.upper(), word.capitalize(), len(word))
+                duplicate = 'exact' if word in exact else 'case' if key in forms else None
+                exact.add(word)
+                forms.add(key)
+            yield index, word, duplicate
+    
+    def _word_segments(self, word: str, index: int, affixes, full_expansion: bool = False,
+                       duplicate: Optional[str] = None) -> List[Tuple[int, Callable[[], Iterator[str]]]]:
+        # Kelimenin varyasyonları üretim sırasıyla (aday sayısı, üreteç) parçaları olarak
+        if not word or len(word) < 2:
+            return []
+        
+        segments = []
+        if duplicate is None:
+            segments.append((3, partial(iter, (word.lower(), word.upper(), word.capitalize()))))
+        
+        if isinstance(affixes, BoundRuleSet):
+            # Örneklemede seçilen konumlar kelime indeksine bağlıdır; kopya kelime başka adaylar seçer
+            if len(word) >= 3 and (full_expansion or index < 15) and \
+                    (duplicate != 'exact' or affixes.sample_budget):
+                segments.extend(affixes.segments(word, index))
+        elif duplicate != 'exact':
+            segments.append((self._count_legacy_affixes(word, index, affixes, full_expansion),
+                             partial(self._iter_legacy_affixes, word, index, affixes, full_expansion)))
+        
+        if len(word) >= 4 and (full_expansion or index < 12) and duplicate is None:
+            segments.append((3 * self._count_leet_words(word.lower()),
+                             partial(self._iter_leet_candidates, word.lower())))
+        return segments
+    
+    def _iter_word_variations(self, word: str, index: int, affixes, full_expansion: bool = False,
+                              duplicate: Optional[str] = None, start: int = 0,
+                              stop: Optional[int] = None) -> Iterator[str]:
+        # Sadece [start, stop) konum aralığı üretilir; aralık dışındaki parçalara hiç girilmez
+        position = 0
+        for count, candidates in self._word_segments(word, index, affixes, full_expansion, duplicate):
+            if stop is not None and position >= stop:
+                break
+            if position + count > start:
+                yield from islice(candidates(), max(start - position, 0),
+                                  None if stop is None else stop - position)
+            position += count
+    
+    def _count_legacy_affixes(self, word: str, index: int, numbers: List[str],
+                              full_expansion: bool = False) -> int:
+        count = 0
+        if len(word) >= 3 and (full_expansion or index < 15):
+            count += 2 * len(numbers)
+        if len(word) >= 3 and (full_expansion or index < 10):
+            count += len(self.special_chars) * (2 if len(word) >= 4 else 1)
+        return count
+    
+    def _iter_legacy_affixes(self, word: str, index: int, numbers: List[str],
+                             full_expansion: bool = False) -> Iterator[str]:
+        if len(word) >= 3 and (full_expansion or index < 15):
+            for num in numbers:
+                yield f"{word}{num}"
+                yield f"{num}{word}"
+        
+        if len(word) >= 3 and (full_expansion or index < 10):
+            for char in self.special_chars:
+                yield f"{word}{char}"
+                if len(word) >= 4:
+                    yield f"{char}{word}"
+    
+    def _iter_profile_variations(self, user_info: UserInfo) -> Iterator[str]:
+        # Küme sırası PYTHONHASHSEED'e bağlı olduğundan küçük profil kümeleri kelime bazında,
+        # kombinasyonlar ise konum aralığıyla parçalara bölünür
         if user_info.name and user_info.surname:
-            name_combos = self._create_name_combinations(user_info.name, user_info.surname)
-            variations.update(name_combos)
+            yield from self.iter_owned(self._create_name_combinations(user_info.name, user_info.surname))
         if user_info.email:
-            email_vars = self._create_email_variations(user_info.email)
-            variations.update(email_vars)
+            yield from self.iter_owned(self._create_email_variations(user_info.email))
         if user_info.phone:
-            phone_vars = self._create_phone_variations(user_info.phone)
-            variations.update(phone_vars)
-        
-        result = list(variations)
-        print(f"{Fore.GREEN}✓ {len(result)} varyasyon oluşturuldu")
-        return result
+            yield from self.iter_owned(self._create_phone_variations(user_info.phone))
+        if self.combinator:
+            yield from self._iter_combinations(user_info)
+    
+    def _iter_combinations(self, user_info: UserInfo) -> Iterator[str]:
+        keyspace = self.combinator.keyspace(user_info)
+        print(f"{Fore.CYAN}🔗 Kombinasyon anahtar uzayı: {keyspace:,} aday")
+        if self.combinator.budget and keyspace > self.combinator.budget:
+            print(f"{Fore.YELLOW}⚠️  Bütçe aşıldı, {self.combinator.budget:,} adaylık "
+                  f"katmanlı örnekleme yapılacak")
+        yield from self.combinator.iter_candidates(user_info, (self.shard_index, self.shard_count))
+    
+    def _iter_leet_candidates(self, word: str) -> Iterator[str]:
+        for leet_word in self._iter_leet_words(word):
+            yield leet_word
+            yield f"{leet_word}123"
+            yield f"{leet_word}2024"
+    
+    def _iter_leet_words(self, word: str) -> Iterator[str]:
+        if self.leet_combinations:
+            yield from self.leet_engine.iter_variants(word)
+            return
+        leet_word = self._to_leet_speak(word)
+        if leet_word != word:
+            yield leet_word
+    
+    def _count_leet_words(self, word: str) -> int:
+        if self.leet_combinations:
+            return self.leet_engine.variant_count(word)
+        return int(self._to_leet_speak(word) != word)
     
     def _to_leet_speak(self, word: str) -> str:
-        leet_word = word
-        for normal, leet in self.leet_map.items():
-            leet_word = leet_word.replace(normal, leet)
-        return leet_word
+        return self.leet_engine.to_full_leet(word)
     
     def _create_name_combinations(self, name: str, surname: str) -> Set[str]:
         combinations = set()
@@ -116,31 +436,60 @@ class WordlistProcessor:
         
         return variations
     
-    def clean_and_filter(self, wordlist: List[str]) -> List[str]:
+    def clean_and_filter(self, wordlist: Iterable[str]) -> List[str]:
         print(f"{Fore.YELLOW}🧹 Wordlist temizleniyor...")
         
-        cleaned = set()
-        
-        for word in wordlist:
-            if word and isinstance(word, str):
-                word = word.strip()
-                if len(word) >= 3 and len(word) <= 50:
-                    if re.match(r'^[a-zA-Z0-9@#$%&*!._-]+$', word):
-                        cleaned.add(word)
+        # Politikaya uymayan adaylar tekrar elemeden önce düşürülür
+        cleaned = new_candidate_store(self.dedup_store)
+        cleaned.update(self.word_filter.filter(wordlist))
         
-        result = sorted(list(cleaned))
+        result = list(iter_store_sorted(cleaned))
+        if self.reference_index is not None:
+            result = list(self.apply_reference(result))
         print(f"{Fore.GREEN}✓ {len(result)} temiz kelime hazırlandı")
         return result
     
-    def save_wordlist(self, wordlist: List[str], filename: str) -> int:
+    def iter_clean(self, words: Iterable[str]) -> Iterator[str]:
+        # clean_and_filter ile aynı kurallar, ama sıralama ve global tekrar eleme yok.
+        # Referans dizini akışta sıralamadan sonra apply_reference ile uygulanır
+        return self.word_filter.filter(words)
+    
+    def iter_unique(self, words: Iterable[str]) -> Iterator[str]:
+        # Akış modunda temel kelimeler arası tekrar eleme; ilk görülme sırası korunur. Görülen
+        # adaylar her zaman kompakt trie'de tutulur (set + str'ye göre kelime başına birkaç kat az bellek)
+        seen = CandidateTrie()
+        add = seen.add
+        return (word for word in words if add(word))
+    
+    def apply_reference(self, words: Iterable[str]) -> Iterator[str]:
+        if self.reference_index is None:
+            return iter(words)
+        return self.reference_index.apply(words, self.reference_mode)
+    
+    def save_wordlist(self, wordlist: List[str], filename: str, compression: str = 'none',
+                      shards: int = 1, shard_mode: str = 'hash') -> int:
+        return self.save_wordlist_stream(
+            wordlist, filename, compression=compression, shards=shards,
+            shard_mode=shard_mode, total=len(wordlist)
+        )
+    
+    def save_wordlist_stream(self, words: Iterable[str], filename: str, buffer_lines: int = 10000,
+                             compression: str = 'none', shards: int = 1, shard_mode: str = 'hash',
+                             total: Optional[int] = None) -> int:
+        # Sadece G/Ç hataları burada raporlanır; aday üretimindeki hatalar (bütçe, önbellek
+        # eksiği vb.) çağırana iletilir. İki durumda da yazıcı yarım dosyayı siler
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                for word in wordlist:
-                    f.write(f"{word}\n")
-            
-            print(f"\n{Fore.GREEN}✅ Wordlist kaydedildi: {filename}")
-            print(f"{Fore.CYAN}📊 Toplam kelime sayısı: {len(wordlist)}")
-            return len(wordlist)
-        except Exception as e:
+            count, files = write_wordlist(
+                words, filename, compression=compression, shards=shards,
+                shard_mode=shard_mode, total=total, buffer_lines=buffer_lines
+            )
+        except OSError as e:
             print(f"{Fore.RED}❌ Dosya kaydetme hatası: {e}")
-            return 0
\ No newline at end of file
+            return 0
+        
+        if len(files) > 1:
+            print(f"\n{Fore.GREEN}✅ Wordlist {len(files) - 1} parçaya kaydedildi: {files[-1]}")
+        else:
+            print(f"\n{Fore.GREEN}✅ Wordlist kaydedildi: {files[0]}")
+        print(f"{Fore.CYAN}📊 Toplam kelime sayısı: {count}")
+        return count
@@ -0,0 +1,182 @@
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import zlib
+from datetime import datetime
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+
+COMPRESSION_EXTENSIONS = {'none': '', 'gzip': '.gz', 'xz': '.xz', 'zstd': '.zst'}
+SHARD_MODES = ('hash', 'range')
+
+def output_path(filename: str, compression: str = 'none') -> str:
+    extension = COMPRESSION_EXTENSIONS[compression]
+    return filename if not extension or filename.endswith(extension) else filename + extension
+
+def open_binary_output(filename: str, compression: str = 'none') -> BinaryIO:
+    if compression == 'none':
+        return open(filename, 'wb', buffering=1024 * 1024)
+    if compression == 'gzip':
+        return gzip.open(filename, 'wb', compresslevel=6)
+    if compression == 'xz':
+        return lzma.open(filename, 'wb', preset=6)
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd sıkıştırma için 'zstandard' paketi gerekli: pip install zstandard")
+        return zstandard.ZstdCompressor(level=10).stream_writer(open(filename, 'wb'))
+    raise ValueError(f"Bilinmeyen sıkıştırma türü: {compression}")
+
+def file_sha256(filename: str) -> str:
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class WordlistWriter:
+    
+    def __init__(self, filename: str, compression: str = 'none', buffer_lines: int = 10000):
+        self.filename = output_path(filename, compression)
+        self.compression = compression
+        self.buffer_lines = buffer_lines
+        self.count = 0
+        self._batch = []
+        self._handle = open_binary_output(self.filename, compression)
+    
+    def write(self, word: str):
+        self._batch.append(word)
+        if len(self._batch) >= self.buffer_lines:
+            self._flush()
+    
+    def write_many(self, words: Iterable[str]):
+        for word in words:
+            self.write(word)
+    
+    def _flush(self):
+        if self._batch:
+            self._handle.write(('\n'.join(self._batch) + '\n').encode('utf-8'))
+            self.count += len(self._batch)
+            self._batch.clear()
+    
+    def close(self):
+        if self._handle is not None:
+            self._flush()
+            self._handle.close()
+            self._handle = None
+    
+    def abort(self):
+        # Yarım kalan dosya silinir; eksik bir wordlist tamamlanmış gibi görünmez
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            except OSError:
+                pass
+            self._handle = None
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+class ShardedWriter:
+    
+    def __init__(self, filename: str, shards: int, mode: str = 'hash', compression: str = 'none',
+                 total: Optional[int] = None, buffer_lines: int = 10000):
+        if mode not in SHARD_MODES:
+            raise ValueError(f"Bilinmeyen parçalama türü: {mode}")
+        if mode == 'range' and total is None:
+            raise ValueError("Aralık bazlı parçalama için toplam kelime sayısı bilinmeli")
+        
+        self.filename = filename
+        self.shards = shards
+        self.mode = mode
+        self.compression = compression
+        self.total = total
+        self.count = 0
+        
+        # Parça numarası gövdeye eklenir, dosya uzantısı ve sıkıştırma uzantısı sonda kalır:
+        # out.txt.gz -> out.part01of03.txt.gz
+        compression_extension = COMPRESSION_EXTENSIONS[compression]
+        if compression_extension and filename.endswith(compression_extension):
+            filename = filename[:-len(compression_extension)]
+        root, extension = os.path.splitext(filename)
+        self.writers = [
+            WordlistWriter(f"{root}.part{index + 1:02d}of{shards:02d}{extension or '.txt'}",
+                           compression, buffer_lines)
+            for index in range(shards)
+        ]
+        self.manifest_path = f"{root}.manifest.json"
+    
+    def write(self, word: str):
+        if self.mode == 'hash':
+            # Kararlı hash: aynı kelime her makinede aynı parçaya düşer
+            index = zlib.crc32(word.encode('utf-8')) % self.shards
+        else:
+            # Aralık: sıralı girdi ardışık, eşit büyüklükte bloklara bölünür
+            index = min(self.count * self.shards // max(self.total, 1), self.shards - 1)
+        self.writers[index].write(word)
+        self.count += 1
+    
+    def write_many(self, words: Iterable[str]):
+        for word in words:
+            self.write(word)
+    
+    def close(self):
+        for writer in self.writers:
+            writer.close()
+        self._write_manifest()
+    
+    def _write_manifest(self):
+        manifest = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'source': os.path.basename(self.filename),
+            'mode': self.mode,
+            'compression': self.compression,
+            'total': self.count,
+            'shards': [
+                {
+                    'file': os.path.basename(writer.filename),
+                    'count': writer.count,
+                    'bytes': os.path.getsize(writer.filename),
+                    'sha256': file_sha256(writer.filename),
+                }
+                for writer in self.writers
+            ],
+        }
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+    
+    def abort(self):
+        for writer in self.writers:
+            writer.abort()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+def write_wordlist(words: Iterable[str], filename: str, compression: str = 'none',
+                   shards: int = 1, shard_mode: str = 'hash', total: Optional[int] = None,
+                   buffer_lines: int = 10000) -> Tuple[int, List[str]]:
+    # (kelime sayısı, yazılan dosyalar) döner; parçalı modda son dosya manifesttir
+    if shards > 1:
+        with ShardedWriter(filename, shards, shard_mode, compression, total, buffer_lines) as writer:
+            writer.write_many(words)
+        return writer.count, [shard.filename for shard in writer.writers] + [writer.manifest_path]
+    
+    with WordlistWriter(filename, compression, buffer_lines) as writer:
+        writer.write_many(words)
+    return writer.count, [writer.filename]
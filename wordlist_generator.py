@@ -1,10 +1,13 @@
 
 
+import argparse
+import importlib.util
+import json
 import os
 import sys
-import warnings
-import logging
-from typing import List, Optional
+from itertools import chain
+from typing import Iterable, List, Optional, Tuple
+from dataclasses import asdict
 from datetime import datetime
 from colorama import init, Fore, Style
 from dotenv import load_dotenv
@@ -14,11 +17,28 @@ from dotenv import load_dotenv
 # Kendi modellerimizi import et
 from models.user_info import UserInfoCollector, UserInfo
 from models.gemini_model import GeminiWordlistGenerator
+from models.local_generator import LocalWordlistGenerator
+from models.response_cache import ResponseCache
+from models.candidate_trie import DEDUP_STORES
+from models.external_sort import ExternalSorter, iter_file_lines
+from models.hash_verifier import HASH_TYPES, HashVerifier, load_hashes
+from models.ranker import MarkovRanker
+from models.reference_index import REFERENCE_MODES, ReferenceIndex
+from models.metrics import RunMetrics
+from models.wordlist_writer import COMPRESSION_EXTENSIONS, SHARD_MODES, output_path
 from models.wordlist_processor import WordlistProcessor
+from models.word_filter import DEFAULT_ALLOWED_CHARS, PasswordPolicy
+from models.checkpoint import CheckpointStore, fingerprint
+from models.combinator import Combinator
+from models.leet_engine import parse_leet_map
+from models.rule_engine import RuleSet
 
 class WordlistCreator:
     
-    def __init__(self):
+    def __init__(self, offline: Optional[bool] = None, merge_into: Optional[str] = None,
+                 local: Optional[bool] = None, resume: bool = False,
+                 verify_hashes: Optional[str] = None, hash_type: str = 'auto',
+                 shard: Tuple[int, int] = (0, 1)):
       
         init(autoreset=True)
         
@@ -28,19 +48,157 @@ class WordlistCreator:
         # Konfigürasyon
         self.gemini_api_key = os.getenv('GEMINI_API_KEY')
         self.gemini_model = os.getenv('GEMINI_MODEL', 'gemini-pro')
+        # Üretim ayarları modele generation_config olarak gönderilir (boşsa model varsayılanı)
+        self.generation_config = {}
+        if os.getenv('GEMINI_TEMPERATURE'):
+            self.generation_config['temperature'] = float(os.getenv('GEMINI_TEMPERATURE'))
+        if os.getenv('GEMINI_MAX_OUTPUT_TOKENS'):
+            self.generation_config['max_output_tokens'] = int(os.getenv('GEMINI_MAX_OUTPUT_TOKENS'))
+        # Uyarlamalı istemler: her çağrının yeni/geçerli kelime verimi izlenir, mevcut kelimeler
+        # özetlenerek tekrar istenmez, verim eşiğin altına düşünce çağrılar durur
+        self.adaptive_prompting = os.getenv('ADAPTIVE_PROMPTING', 'False').lower() == 'true'
+        self.adaptive_max_calls = int(os.getenv('ADAPTIVE_MAX_CALLS', '4'))
+        self.adaptive_min_new_words = int(os.getenv('ADAPTIVE_MIN_NEW_WORDS', '10'))
         self.min_word_length = int(os.getenv('MIN_WORD_LENGTH', '3'))
         self.max_word_length = int(os.getenv('MAX_WORD_LENGTH', '50'))
+        self.password_policy = PasswordPolicy(
+            min_length=self.min_word_length,
+            max_length=self.max_word_length,
+            allowed_chars=os.getenv('POLICY_ALLOWED_CHARS') or DEFAULT_ALLOWED_CHARS,
+            require_digit=os.getenv('POLICY_REQUIRE_DIGIT', 'False').lower() == 'true',
+            require_lower=os.getenv('POLICY_REQUIRE_LOWER', 'False').lower() == 'true',
+            require_upper=os.getenv('POLICY_REQUIRE_UPPER', 'False').lower() == 'true',
+            require_special=os.getenv('POLICY_REQUIRE_SPECIAL', 'False').lower() == 'true',
+            exclude_pattern=os.getenv('POLICY_EXCLUDE_PATTERN') or None,
+        )
         self.default_output_file = os.getenv('DEFAULT_OUTPUT_FILE', 'custom_wordlist.txt')
+        self.output_compression = os.getenv('OUTPUT_COMPRESSION', 'none').lower()
+        self.output_shards = int(os.getenv('OUTPUT_SHARDS', '1'))
+        self.output_shard_mode = os.getenv('OUTPUT_SHARD_MODE', 'hash').lower()
+        if self.output_compression not in COMPRESSION_EXTENSIONS:
+            self.output_compression = 'none'
+        if self.output_shard_mode not in SHARD_MODES:
+            self.output_shard_mode = 'hash'
         self.debug_mode = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
+        self.profile_stages = os.getenv('PROFILE_STAGES', 'False').lower() == 'true'
+        self.profile_dir = os.getenv('PROFILE_DIR', 'profiles')
+        self.metrics_file = os.getenv('METRICS_FILE') or None
+        self.streaming_mode = os.getenv('STREAMING_MODE', 'False').lower() == 'true'
+        self.stream_buffer_lines = int(os.getenv('STREAM_BUFFER_LINES', '10000'))
+        self.stream_ai_responses = os.getenv('STREAM_AI_RESPONSES', 'False').lower() == 'true'
+        self.external_sort = os.getenv('EXTERNAL_SORT', 'False').lower() == 'true'
+        self.sort_memory_mb = float(os.getenv('SORT_MEMORY_MB', '256'))
+        self.sort_temp_dir = os.getenv('SORT_TEMP_DIR') or None
+        # Tekrar eleme deposu: set (hızlı) veya trie (kelime başına birkaç kat az bellek)
+        self.dedup_store = os.getenv('DEDUP_STORE', 'set').lower()
+        if self.dedup_store not in DEDUP_STORES:
+            self.dedup_store = 'set'
+        self.merge_into = merge_into
+        self.rank_output = os.getenv('RANK_OUTPUT', 'False').lower() == 'true'
+        self.rank_reference_wordlist = os.getenv('RANK_REFERENCE_WORDLIST') or None
+        self.rank_markov_order = int(os.getenv('RANK_MARKOV_ORDER', '3'))
+        self.rank_top_k = int(os.getenv('RANK_TOP_K', '0'))
+        self.rules_file = os.getenv('RULES_FILE') or None
+        self.reference_index_path = os.getenv('REFERENCE_INDEX') or None
+        self.reference_mode = os.getenv('REFERENCE_MODE', 'exclude').lower()
+        if self.reference_mode not in REFERENCE_MODES:
+            self.reference_mode = 'exclude'
+        self.reference_boost = float(os.getenv('REFERENCE_BOOST', '12'))
+        self.reference_bloom_bits = float(os.getenv('REFERENCE_BLOOM_BITS', '10'))
+        self.combinator_enabled = os.getenv('COMBINATOR_ENABLED', 'False').lower() == 'true'
+        self.combinator_max_candidates = int(os.getenv('COMBINATOR_MAX_CANDIDATES', '50000'))
+        # Ayraçsız birleşim her zaman dahildir; değer tek karakterlik ayraçların listesidir
+        self.combinator_separators = ('',) + tuple(os.getenv('COMBINATOR_SEPARATORS', '._-'))
+        self.variation_workers = int(os.getenv('VARIATION_WORKERS', '1')) or (os.cpu_count() or 1)
+        self.ai_parallel_enhance = os.getenv('AI_PARALLEL_ENHANCE', 'False').lower() == 'true'
+        self.ai_concurrency = int(os.getenv('AI_CONCURRENCY', '4'))
+        self.ai_chunk_size = int(os.getenv('AI_CHUNK_SIZE', '15'))
+        self.ai_max_retries = int(os.getenv('AI_MAX_RETRIES', '5'))
+        self.ai_cache_enabled = os.getenv('AI_CACHE_ENABLED', 'True').lower() == 'true'
+        self.ai_cache_path = os.getenv('AI_CACHE_PATH', '.wordlist_cache/responses.sqlite3')
+        self.ai_cache_max_mb = float(os.getenv('AI_CACHE_MAX_MB', '100'))
+        self.ai_cache_ttl_hours = float(os.getenv('AI_CACHE_TTL_HOURS', '168'))
+        self.batch_profile_workers = int(os.getenv('BATCH_PROFILE_WORKERS', '4'))
+        self.service_address = os.getenv('SERVICE_ADDRESS', '127.0.0.1:8765')
+        self.service_job_workers = int(os.getenv('SERVICE_JOB_WORKERS', '4'))
+        self.service_max_queue = int(os.getenv('SERVICE_MAX_QUEUE', '100'))
+        self.service_max_finished = int(os.getenv('SERVICE_MAX_FINISHED_JOBS', '200'))
+        if offline is None:
+            offline = os.getenv('AI_OFFLINE', 'False').lower() == 'true'
+        self.offline = offline
+        # Yerel mod: temel kelimeler AI olmadan profil alanlarından üretilir (API anahtarı gerekmez)
+        if local is None:
+            local = os.getenv('LOCAL_MODE', 'False').lower() == 'true'
+        self.local = local
+        # Kontrol noktaları: tamamlanan aşamalar diske yazılır, yeniden çalıştırmada girdisi
+        # değişmeyen aşamalar (ve ücretli AI çağrıları) atlanır
+        self.resume = resume
+        self.checkpoint_enabled = resume or os.getenv('CHECKPOINT_ENABLED', 'False').lower() == 'true'
+        self.checkpoint_dir = os.getenv('CHECKPOINT_DIR', '.wordlist_checkpoints')
+        self.delta_output = os.getenv('DELTA_OUTPUT', 'True').lower() == 'true'
+        # Hash doğrulama: adaylar wordlist yazılmadan doğrudan hash'lenip hedeflerle karşılaştırılır
+        self.verify_hashes_file = verify_hashes
+        self.hash_type = hash_type
+        self.hash_targets = {}
+        self.hash_verify_workers = int(os.getenv('HASH_VERIFY_WORKERS', '0')) or (os.cpu_count() or 1)
+        self.hash_batch_size = int(os.getenv('HASH_BATCH_SIZE', '20000'))
+        self.hash_stop_when_done = os.getenv('HASH_STOP_WHEN_DONE', 'True').lower() == 'true'
+        self.hash_potfile = os.getenv('HASH_POTFILE') or None
         
         # Sınıfları başlat
         self.user_collector = UserInfoCollector()
-        self.processor = WordlistProcessor()
+        self.processor = WordlistProcessor(
+            self.password_policy,
+            leet_map=parse_leet_map(os.getenv('LEET_MAP', '')) or None,
+            leet_combinations=os.getenv('LEET_COMBINATIONS', 'False').lower() == 'true',
+            leet_max_per_word=int(os.getenv('LEET_MAX_PER_WORD', '256')),
+            rules=RuleSet.from_file(self.rules_file) if self.rules_file else None,
+            rule_budget=int(os.getenv('RULE_MAX_CANDIDATES', '0')),
+            rule_budget_mode=os.getenv('RULE_BUDGET_MODE', 'refuse').lower(),
+            combinator=Combinator(self.combinator_separators, budget=self.combinator_max_candidates)
+            if self.combinator_enabled else None,
+            reference_index=self._open_reference_index(),
+            reference_mode=self.reference_mode,
+            shard=shard,
+            dedup_store=self.dedup_store,
+        )
         self.gemini_generator = None
+        self.response_cache = None
+        self.checkpoints = CheckpointStore(self.checkpoint_dir) if self.checkpoint_enabled else None
+        self.metrics = RunMetrics(self.metrics_file, profile=self.profile_stages,
+                                  profile_dir=self.profile_dir)
         
-        # API key kontrolü
-        self._check_api_key()
+        if self.processor.shard_count > 1 and self.rank_top_k:
+            print(f"{Fore.YELLOW}⚠️  RANK_TOP_K her parçada ayrı uygulanır; parçaların birleşimi "
+                  f"global top-K değildir.")
         
+        # API key kontrolü (çevrimdışı modda sadece önbellek, yerel modda AI kullanılmaz)
+        if not self.offline and not self.local:
+            self._check_api_key()
+        
+    def _open_reference_index(self) -> Optional[ReferenceIndex]:
+        if not self.reference_index_path:
+            return None
+        if not os.path.exists(self.reference_index_path):
+            print(f"{Fore.YELLOW}⚠️  Referans dizini bulunamadı: {self.reference_index_path} "
+                  f"(--build-index ile oluşturun)")
+            return None
+        return ReferenceIndex(self.reference_index_path)
+    
+    def build_reference_index(self, index_path: str, sources: List[str]):
+        missing = [source for source in sources if not os.path.exists(source)]
+        if not sources or missing:
+            print(f"{Fore.RED}❌ Kaynak dosya bulunamadı: {', '.join(missing) or '-'}")
+            return
+        print(f"{Fore.YELLOW}🗂️  Referans dizini oluşturuluyor: {index_path} ({len(sources)} kaynak)")
+        index = ReferenceIndex.build(sources, index_path, self.sort_memory_mb, self.sort_temp_dir,
+                                     bloom_bits_per_item=self.reference_bloom_bits)
+        with open(index_path + '.json', 'r', encoding='utf-8') as f:
+            count = json.load(f)['count']
+        index.close()
+        bloom = f"{self.reference_bloom_bits:g} bit/kelime" if self.reference_bloom_bits > 0 else 'yok'
+        print(f"{Fore.GREEN}✓ {count:,} tekil kelime dizinlendi (Bloom filtresi: {bloom})")
+    
     def _check_api_key(self):
         if not self.gemini_api_key or self.gemini_api_key == 'your_gemini_api_key_here':
             print(f"{Fore.RED}❌ HATA: Gemini API anahtarı bulunamadı!")
@@ -54,7 +212,7 @@ class WordlistCreator:
 {Fore.YELLOW}    🚀  WORDLIST GENERATOR 🚀
 {Fore.CYAN}{'='*60}
 {Fore.GREEN}✨ AI Destekli Kişiselleştirilmiş Wordlist Oluşturucu
-{Fore.MAGENTA}🤖 Gemini AI Model: {self.gemini_model}
+{Fore.MAGENTA}🤖 Gemini AI Model: {'yerel mod (AI yok)' if self.local else self.gemini_model}
 {Fore.BLUE}📅 Tarih: {datetime.now().strftime('%d/%m/%Y %H:%M')}
 {Fore.CYAN}{'='*60}
         """
@@ -63,10 +221,37 @@ class WordlistCreator:
     def _print_configuration(self):
         if self.debug_mode:
             print(f"\n{Fore.YELLOW}🔧 MEVCUT KONFIGÜRASYON:")
-            print(f"{Fore.WHITE}├─ Gemini Model: {self.gemini_model}")
+            print(f"{Fore.WHITE}├─ Gemini Model: {self.gemini_model} ({self.generation_config or 'varsayılan ayarlar'})")
+            print(f"{Fore.WHITE}├─ Uyarlamalı İstemler: {self.adaptive_prompting} "
+                  f"(en fazla {self.adaptive_max_calls} çağrı, eşik: {self.adaptive_min_new_words} yeni kelime)")
             print(f"{Fore.WHITE}├─ Min Kelime Uzunluğu: {self.min_word_length}")
             print(f"{Fore.WHITE}├─ Max Kelime Uzunluğu: {self.max_word_length}")
+            print(f"{Fore.WHITE}├─ Şifre Politikası: {self.processor.word_filter.pattern.pattern}")
             print(f"{Fore.WHITE}├─ Varsayılan Çıktı: {self.default_output_file}")
+            print(f"{Fore.WHITE}├─ Çıktı Formatı: {self.output_compression} "
+                  f"({self.output_shards} parça, {self.output_shard_mode})")
+            print(f"{Fore.WHITE}├─ Akış Modu: {self.streaming_mode} (AI akışı: {self.stream_ai_responses})")
+            print(f"{Fore.WHITE}├─ Dış Sıralama: {self.external_sort} ({self.sort_memory_mb:g} MB)")
+            print(f"{Fore.WHITE}├─ Olasılık Sıralaması: {self.rank_output} (top-K: {self.rank_top_k or 'tümü'})")
+            print(f"{Fore.WHITE}├─ Leet Kombinasyonları: {self.processor.leet_combinations} "
+                  f"(kelime başına en fazla {self.processor.leet_engine.max_per_word})")
+            print(f"{Fore.WHITE}├─ Kural Dosyası: {self.rules_file or '-'}")
+            print(f"{Fore.WHITE}├─ Referans Dizini: {self.reference_index_path or '-'} ({self.reference_mode})")
+            print(f"{Fore.WHITE}├─ Profil Kombinasyonları: {self.combinator_enabled} "
+                  f"(bütçe: {self.combinator_max_candidates or 'sınırsız'})")
+            print(f"{Fore.WHITE}├─ Varyasyon Süreç Sayısı: {self.variation_workers}")
+            print(f"{Fore.WHITE}├─ Parça: {self.processor.shard_index + 1}/{self.processor.shard_count}")
+            print(f"{Fore.WHITE}├─ Paralel AI Geliştirme: {self.ai_parallel_enhance} "
+                  f"(eşzamanlılık: {self.ai_concurrency}, parça: {self.ai_chunk_size})")
+            print(f"{Fore.WHITE}├─ AI Önbelleği: {self.ai_cache_enabled} ({self.ai_cache_path})")
+            print(f"{Fore.WHITE}├─ Çevrimdışı Mod: {self.offline}")
+            print(f"{Fore.WHITE}├─ Yerel Mod: {self.local}")
+            print(f"{Fore.WHITE}├─ Servis: {self.service_address} (iş: {self.service_job_workers}, "
+                  f"kuyruk: {self.service_max_queue})")
+            print(f"{Fore.WHITE}├─ Hash Doğrulama: {self.verify_hashes_file or '-'} ({self.hash_type}, "
+                  f"{self.hash_verify_workers} işçi, parti: {self.hash_batch_size})")
+            print(f"{Fore.WHITE}├─ Metrik Dosyası: {self.metrics_file or '-'}")
+            print(f"{Fore.WHITE}├─ Aşama Profilleme: {self.profile_stages} ({self.profile_dir})")
             print(f"{Fore.WHITE}└─ Debug Mode: {self.debug_mode}")
     
     def create_wordlist(self):
@@ -75,38 +260,105 @@ class WordlistCreator:
             self._print_banner()
             self._print_configuration()
             
+            # Hash dosyası profil sorularından önce okunur; hatalı dosyada boşuna bilgi istenmez
+            if self.verify_hashes_file and not self._load_hash_targets():
+                return
+            
             # Kullanıcı bilgilerini topla
             print(f"\n{Fore.YELLOW}📋 ADIM 1: Kullanıcı Bilgileri Toplama")
-            user_info = self.user_collector.collect_info()
+            with self.metrics.stage('collect_info') as stage:
+                user_info = self._collect_user_info()
+                stage['items_out'] = len(self.user_collector.get_non_empty_fields(user_info))
             
             # Toplanan bilgileri göster
             self._show_collected_info(user_info)
             
             # Gemini AI'ı başlat
             print(f"\n{Fore.YELLOW}🤖 ADIM 2: AI Bağlantısı Kurma")
-            self.gemini_generator = GeminiWordlistGenerator(self.gemini_api_key, self.gemini_model)
+            with self.metrics.stage('setup_ai'):
+                self.gemini_generator = self._create_generator()
+            
+            base_fingerprint = fingerprint('base_words', self.gemini_generator.model_name,
+                                           getattr(self.gemini_generator, 'generation_config', None),
+                                           asdict(user_info), self._adaptive_settings())
+            base_checkpointed = self.checkpoints is not None and \
+                self.checkpoints.has('base_words', base_fingerprint)
+            
+            if self.streaming_mode and self.stream_ai_responses and not base_checkpointed \
+                    and not self.verify_hashes_file and not self._adaptive_enabled():
+                if self.rank_output:
+                    # Sıralama güçlendirmeleri tüm temel kelimeleri baştan bilmeyi gerektirir
+                    print(f"{Fore.YELLOW}⚠️  Olasılık sıralaması açıkken AI akışı kullanılamaz, "
+                          f"tam yanıt beklenecek.")
+                elif self.processor.rules is not None and self.processor.rule_budget:
+                    # Kural bütçesi anahtar uzayı üretimden önce hesaplanarak uygulanır
+                    print(f"{Fore.YELLOW}⚠️  RULE_MAX_CANDIDATES açıkken AI akışı kullanılamaz, "
+                          f"tam yanıt beklenecek.")
+                elif self.processor.shard_count > 1:
+                    # Parça aralıkları tüm temel kelimelerin konum sayısından hesaplanır
+                    print(f"{Fore.YELLOW}⚠️  --shard açıkken AI akışı kullanılamaz, tam yanıt beklenecek.")
+                else:
+                    self._create_wordlist_ai_streaming(user_info, base_fingerprint)
+                    return
             
             # AI ile temel kelimeler oluştur
             print(f"\n{Fore.YELLOW}🧠 ADIM 3: AI ile Temel Kelimeler Oluşturma")
-            base_words = self.gemini_generator.generate_base_words(user_info)
+            with self.metrics.stage('generate_base_words', ai_source=self.gemini_generator) as stage:
+                base_words = self._checkpointed(
+                    'base_words', base_fingerprint,
+                    lambda: self._generate_base_words(user_info)
+                )
+                stage['items_out'] = len(base_words)
+                self._record_adaptive_stats(stage, 'base_words')
             
             if self.debug_mode and base_words:
                 print(f"{Fore.CYAN}🔍 İlk 10 temel kelime: {base_words[:10]}")
             
+            if self.verify_hashes_file:
+                self._verify_hashes(user_info, base_words)
+                return
+            
+            if self.streaming_mode:
+                self._create_wordlist_streaming(user_info, base_words)
+                return
+            
             # Kelime varyasyonları oluştur
             print(f"\n{Fore.YELLOW}🔄 ADIM 4: Kelime Varyasyonları Oluşturma")
-            variations = self.processor.create_variations(base_words, user_info)
+            with self.metrics.stage('create_variations') as stage:
+                variations = self._checkpointed(
+                    'variations',
+                    fingerprint('variations', base_words, asdict(user_info),
+                                self.processor.config_fingerprint()),
+                    lambda: self.processor.create_variations(
+                        base_words, user_info, workers=self.variation_workers
+                    )
+                )
+                stage['items_in'] = len(base_words)
+                stage['items_out'] = len(variations)
             
             # AI ile wordlist'i geliştir
             print(f"\n{Fore.YELLOW}🚀 ADIM 5: AI ile Wordlist Geliştirme")
-            enhanced_words = self.gemini_generator.enhance_wordlist(base_words)
+            with self.metrics.stage('enhance_wordlist', ai_source=self.gemini_generator) as stage:
+                enhanced_words = self._checkpointed_enhance(base_words)
+                stage['items_in'] = len(base_words)
+                stage['items_out'] = len(enhanced_words)
+                self._record_adaptive_stats(stage, 'enhanced_words')
             
             # Tüm kelimeleri birleştir
-            all_words = base_words + variations + enhanced_words
+            all_words = list(self.processor.iter_candidates(base_words, variations, enhanced_words))
             
             # Temizle ve filtrele
             print(f"\n{Fore.YELLOW}🧹 ADIM 6: Wordlist Temizleme ve Filtreleme")
-            final_wordlist = self.processor.clean_and_filter(all_words)
+            with self.metrics.stage('clean_and_filter') as stage:
+                final_wordlist = self.processor.clean_and_filter(all_words)
+                
+                if self.rank_output:
+                    ranker = self._create_ranker(user_info, base_words, enhanced_words)
+                    final_wordlist = list(ranker.rank(
+                        final_wordlist, self.rank_top_k, self.sort_memory_mb, self.sort_temp_dir
+                    ))
+                stage['items_in'] = len(all_words)
+                stage['items_out'] = len(final_wordlist)
             
             # Sonuçları göster
             self._show_statistics(base_words, variations, enhanced_words, final_wordlist)
@@ -114,11 +366,392 @@ class WordlistCreator:
             # Dosyaya kaydet
             print(f"\n{Fore.YELLOW}💾 ADIM 7: Wordlist Kaydetme")
             output_file = self._get_output_filename()
-            saved_count = self.processor.save_wordlist(final_wordlist, output_file)
+            with self.metrics.stage('save_wordlist') as stage:
+                saved_count = self.processor.save_wordlist(
+                    final_wordlist, output_file, compression=self.output_compression,
+                    shards=self.output_shards, shard_mode=self.output_shard_mode
+                )
+                stage['items_in'] = len(final_wordlist)
+                stage['items_out'] = saved_count
             
             if saved_count > 0:
-                self._show_completion_message(output_file, saved_count)
+                self._finish_output(output_file, saved_count)
+        
+        except KeyboardInterrupt:
+            print(f"\n{Fore.YELLOW}⚠️  İşlem kullanıcı tarafından iptal edildi.")
+            self._print_resume_hint()
+        except Exception as e:
+            print(f"\n{Fore.RED}❌ Beklenmeyen hata: {e}")
+            self._print_resume_hint()
+            if self.debug_mode:
+                import traceback
+                traceback.print_exc()
+        finally:
+            self._finish_metrics()
+    
+    def _collect_user_info(self) -> UserInfo:
+        if self.resume and self.checkpoints is not None:
+            user_info = self.checkpoints.load_user_info()
+            if user_info is not None:
+                print(f"{Fore.CYAN}♻️  Önceki oturumun profil bilgileri yüklendi ({self.checkpoint_dir})")
+                return user_info
+            print(f"{Fore.YELLOW}⚠️  Devam edilecek oturum bulunamadı, bilgiler yeniden toplanacak.")
+        user_info = self.user_collector.collect_info()
+        if self.checkpoints is not None:
+            self.checkpoints.save_user_info(user_info)
+        return user_info
+    
+    def _checkpointed(self, stage_name: str, stage_fingerprint: str, compute,
+                      complete=bool) -> List[str]:
+        # Girdi parmak izi aynıysa aşama kontrol noktasından yüklenir; değilse hesaplanıp
+        # (tamamlandıysa) kaydedilir. Boş/başarısız sonuçlar kaydedilmez, sonraki çalışmada yeniden denenir
+        if self.checkpoints is not None:
+            words = self.checkpoints.load_words(stage_name, stage_fingerprint)
+            if words is not None:
+                print(f"{Fore.CYAN}♻️  {stage_name}: kontrol noktasından yüklendi ({len(words)} kelime)")
+                return words
+        words = compute()
+        if self.checkpoints is not None and complete(words):
+            self.checkpoints.save_words(stage_name, stage_fingerprint, words)
+        return words
+    
+    def _checkpointed_enhance(self, base_words: List[str]) -> List[str]:
+        # Başarısız parça varsa kaydedilmez; yeniden çalıştırmada başarılı parçalar AI önbelleğinden gelir
+        return self._checkpointed(
+            'enhanced_words',
+            fingerprint('enhanced_words', base_words, self.gemini_generator.model_name,
+                        getattr(self.gemini_generator, 'generation_config', None),
+                        self.ai_parallel_enhance, self.ai_chunk_size, self._adaptive_settings()),
+            lambda: self._enhance_wordlist(base_words),
+            complete=lambda words: bool(words) and
+            not self.gemini_generator.last_enhance_stats.get('failed_chunks'),
+        )
+    
+    def _print_resume_hint(self):
+        if self.checkpoints is not None:
+            print(f"{Fore.CYAN}♻️  Tamamlanan aşamalar kaydedildi; --resume ile kaldığınız yerden devam edin.")
+    
+    def _finish_output(self, output_file: str, saved_count: int):
+        self._show_completion_message(output_file, saved_count)
+        self._merge_into_existing(output_file)
+        self._write_delta(output_file)
+    
+    def _write_delta(self, output_file: str):
+        if self.checkpoints is None or not self.delta_output:
+            return
+        if self.output_compression != 'none' or self.output_shards > 1:
+            print(f"{Fore.YELLOW}⚠️  Delta dosyası sadece tek parça düz metin çıktıda üretilebilir, atlanıyor.")
+            return
+        root, extension = os.path.splitext(output_file)
+        delta_file = f"{root}.delta{extension or '.txt'}"
+        total, added, had_previous = self.checkpoints.write_delta(
+            output_file, delta_file, self.sort_memory_mb, self.sort_temp_dir
+        )
+        if had_previous:
+            print(f"{Fore.GREEN}🆕 Önceki çalışmaya göre {added:,} yeni aday: {delta_file}")
+        else:
+            print(f"{Fore.CYAN}🆕 İlk çalışma, delta için temel alındı ({total:,} aday): {delta_file}")
+    
+    def _finish_metrics(self):
+        summary = self.metrics.finish()
+        if self.metrics_file:
+            print(f"{Fore.CYAN}📈 Çalışma metrikleri: {self.metrics_file} "
+                  f"({summary['stages']} aşama, {summary['wall_seconds']:.2f} sn)")
+    
+    def _create_generator(self):
+        if self.local:
+            print(f"{Fore.CYAN}🧩 Yerel mod: AI kullanılmayacak")
+            return LocalWordlistGenerator()
+        self.response_cache = self._create_response_cache()
+        return GeminiWordlistGenerator(self.gemini_api_key, self.gemini_model, cache=self.response_cache,
+                                       generation_config=self.generation_config)
+    
+    def _create_response_cache(self) -> Optional[ResponseCache]:
+        if not self.ai_cache_enabled and not self.offline:
+            return None
+        return ResponseCache(
+            self.ai_cache_path,
+            max_bytes=int(self.ai_cache_max_mb * 1024 * 1024),
+            ttl_seconds=self.ai_cache_ttl_hours * 3600,
+            offline=self.offline,
+        )
+    
+    def _adaptive_enabled(self) -> bool:
+        # Yerel modda model çağrısı yoktur
+        return self.adaptive_prompting and not self.local
+    
+    def _adaptive_settings(self) -> Optional[list]:
+        # Uyarlamalı sonuç filtreye bağlıdır (geçersiz satırlar yeni sayılmaz)
+        if not self._adaptive_enabled():
+            return None
+        return [self.adaptive_max_calls, self.adaptive_min_new_words,
+                self.processor.word_filter.pattern.pattern]
+    
+    def _generate_base_words(self, user_info: UserInfo) -> List[str]:
+        if self._adaptive_enabled():
+            return self.gemini_generator.generate_base_words_adaptive(
+                user_info, self.processor.word_filter.matches,
+                max_calls=self.adaptive_max_calls, min_new_words=self.adaptive_min_new_words,
+            )
+        return self.gemini_generator.generate_base_words(user_info)
+    
+    def _record_adaptive_stats(self, stage: dict, name: str):
+        adaptive = getattr(self.gemini_generator, 'last_adaptive_stats', {}).get(name)
+        if adaptive:
+            stage['ai_new_per_call'] = round(adaptive['new_per_call'], 2)
+            stage['ai_new_per_1k_tokens'] = round(adaptive['new_per_1k_tokens'], 2)
+    
+    def _enhance_wordlist(self, base_words: List[str]) -> List[str]:
+        if self._adaptive_enabled():
+            return self.gemini_generator.enhance_wordlist_adaptive(
+                base_words, self.processor.word_filter.matches,
+                max_calls=self.adaptive_max_calls, min_new_words=self.adaptive_min_new_words,
+                chunk_size=self.ai_chunk_size,
+            )
+        if self.ai_parallel_enhance:
+            return self.gemini_generator.enhance_wordlist_concurrent(
+                base_words,
+                chunk_size=self.ai_chunk_size,
+                concurrency=self.ai_concurrency,
+                max_retries=self.ai_max_retries,
+            )
+        return self.gemini_generator.enhance_wordlist(base_words)
+    
+    def _create_wordlist_streaming(self, user_info: UserInfo, base_words: List[str]):
+        # Akış modunda tüm temel kelimeler sınırsız genişletilir ve doğrudan diske yazılır
+        print(f"\n{Fore.YELLOW}🚀 ADIM 4: AI ile Wordlist Geliştirme")
+        with self.metrics.stage('enhance_wordlist', ai_source=self.gemini_generator) as stage:
+            enhanced_words = self._checkpointed_enhance(base_words)
+            stage['items_in'] = len(base_words)
+            stage['items_out'] = len(enhanced_words)
+            self._record_adaptive_stats(stage, 'enhanced_words')
+        
+        print(f"\n{Fore.YELLOW}💾 ADIM 5: Çıktı Dosyası Seçimi")
+        output_file = self._get_output_filename()
+        
+        print(f"\n{Fore.YELLOW}🌊 ADIM 6-7: Varyasyon, Filtreleme ve Kaydetme (Akış Modu)")
+        with self.metrics.stage('stream_pipeline') as stage:
+            variations = self.processor.iter_variations(base_words, user_info, full_expansion=True)
+            ranker = self._create_ranker(user_info, base_words, enhanced_words) \
+                if self.rank_output else None
+            saved_count = self._run_stream_pipeline(
+                self.processor.iter_candidates(base_words, variations, enhanced_words),
+                output_file, stage, ranker
+            )
+        
+        if saved_count > 0:
+            self._finish_output(output_file, saved_count)
+    
+    def _create_wordlist_ai_streaming(self, user_info: UserInfo, base_fingerprint: str):
+        # AI yanıtı satır satır gelirken her temel kelime hemen genişletilip filtrelenir ve
+        # yazılır; ağ beklemesi ile yerel işlem örtüşür. Geliştirme isteği, tüm temel
+        # kelimeler geldikten sonra akışın sonuna eklenir
+        print(f"\n{Fore.YELLOW}💾 ADIM 3: Çıktı Dosyası Seçimi")
+        output_file = self._get_output_filename()
+        
+        base_words = []
+        
+        def streamed_base_words():
+            for word in self.gemini_generator.iter_base_words(user_info):
+                base_words.append(word)
+                yield word
+        
+        def enhanced_words():
+            print(f"\n{Fore.YELLOW}🚀 AI ile Wordlist Geliştirme")
+            # Temel kelimeler akış tamamlanınca kaydedilir (yarıda kesilen akış kaydedilmez)
+            if self.checkpoints is not None and base_words and \
+                    'error' not in self.gemini_generator.last_stream_stats:
+                self.checkpoints.save_words('base_words', base_fingerprint, base_words)
+            with self.metrics.stage('enhance_wordlist', ai_source=self.gemini_generator) as stage:
+                words = self._checkpointed_enhance(base_words)
+                stage['items_in'] = len(base_words)
+                stage['items_out'] = len(words)
+            yield from self.processor.iter_owned(words)
+        
+        print(f"\n{Fore.YELLOW}🌊 ADIM 4-7: AI Akışı, Varyasyon, Filtreleme ve Kaydetme")
+        with self.metrics.stage('stream_pipeline', ai_source=self.gemini_generator) as stage:
+            variations = self.processor.iter_variations(
+                streamed_base_words(), user_info, full_expansion=True, include_base_words=True
+            )
+            saved_count = self._run_stream_pipeline(
+                chain(variations, enhanced_words()), output_file, stage
+            )
+            stage['base_words'] = len(base_words)
+            stage['first_line_seconds'] = self.gemini_generator.last_stream_stats.get('first_line_seconds')
+        
+        if saved_count > 0:
+            self._finish_output(output_file, saved_count)
+    
+    def _load_hash_targets(self) -> bool:
+        if not os.path.exists(self.verify_hashes_file):
+            print(f"{Fore.RED}❌ Hash dosyası bulunamadı: {self.verify_hashes_file}")
+            return False
+        self.hash_targets = load_hashes(self.verify_hashes_file, self.hash_type)
+        if not self.hash_targets:
+            print(f"{Fore.RED}❌ {self.verify_hashes_file} içinde geçerli {self.hash_type} hash bulunamadı")
+            return False
+        summary = ', '.join(f"{name}: {len(digests)}" for name, digests in self.hash_targets.items())
+        print(f"{Fore.CYAN}🔐 Hedef hash'ler yüklendi ({summary})")
+        return True
+    
+    def _verify_hashes(self, user_info: UserInfo, base_words: List[str]):
+        # Akış modundaki aday üretimi aynen kullanılır, ancak çıktı dosyası yerine adaylar
+        # partiler halinde süreç havuzunda hash'lenir; kırılanlar anında raporlanır
+        print(f"\n{Fore.YELLOW}🚀 ADIM 4: AI ile Wordlist Geliştirme")
+        with self.metrics.stage('enhance_wordlist', ai_source=self.gemini_generator) as stage:
+            enhanced_words = self._checkpointed_enhance(base_words)
+            stage['items_in'] = len(base_words)
+            stage['items_out'] = len(enhanced_words)
+            self._record_adaptive_stats(stage, 'enhanced_words')
+        
+        print(f"\n{Fore.YELLOW}🔓 ADIM 5-6: Varyasyon, Filtreleme ve Hash Doğrulama "
+              f"({self.hash_verify_workers} işçi)")
+        potfile = open(self.hash_potfile, 'a', encoding='utf-8') if self.hash_potfile else None
+        
+        def on_crack(hash_type, digest, word):
+            print(f"{Fore.GREEN}🔓 [{hash_type}] {digest}:{word}")
+            if potfile is not None:
+                potfile.write(f"{digest}:{word}\n")
+                potfile.flush()
+        
+        verifier = HashVerifier(self.hash_targets, workers=self.hash_verify_workers,
+                                batch_size=self.hash_batch_size,
+                                stop_when_done=self.hash_stop_when_done)
+        try:
+            with self.metrics.stage('verify_hashes') as stage:
+                variations = self.processor.iter_variations(base_words, user_info, full_expansion=True)
+                candidates = self.processor.iter_clean(
+                    self.processor.iter_candidates(base_words, variations, enhanced_words)
+                )
+                if self.reference_mode == 'exclude':
+                    candidates = self.processor.apply_reference(candidates)
+                stats = verifier.run(candidates, on_crack)
+                stage['items_in'] = stats['tested']
+                stage['items_out'] = stats['cracked']
+        finally:
+            if potfile is not None:
+                potfile.close()
+        
+        print(f"\n{Fore.CYAN}📊 HASH DOĞRULAMA SONUÇLARI")
+        print(f"{Fore.CYAN}{'='*50}")
+        print(f"{Fore.WHITE}Denenen aday: {stats['tested']:,}")
+        print(f"{Fore.WHITE}Kırılan hash: {stats['cracked']:,} / {stats['total']:,}")
+        print(f"{Fore.WHITE}Hız: {stats['rate']:,.0f} aday/sn ({stats['seconds']:.2f} sn)")
+        if stats['stopped_early']:
+            print(f"{Fore.GREEN}✓ Tüm hash'ler kırıldı, aday üretimi erken durduruldu.")
+        if self.hash_potfile and stats['cracked']:
+            print(f"{Fore.GREEN}✓ Kırılan hash'ler kaydedildi: {self.hash_potfile}")
+    
+    def _run_stream_pipeline(self, words: Iterable[str], output_file: str, stage: dict,
+                             ranker: Optional[MarkovRanker] = None) -> int:
+        stage['items_in'] = 0
+        
+        def counted(words):
+            for word in words:
+                stage['items_in'] += 1
+                yield word
+        
+        candidates = self.processor.iter_clean(counted(words))
+        if self.reference_mode == 'exclude':
+            # Denenmiş adaylar sıralama/top-K seçiminden önce elenir
+            candidates = self.processor.apply_reference(candidates)
+        if ranker is not None:
+            # Olasılık sıralaması global tekrar elemeyi de içerir
+            candidates = ranker.rank(
+                candidates, self.rank_top_k, self.sort_memory_mb, self.sort_temp_dir
+            )
+        elif self.external_sort:
+            # Global sıralama ve tekrar eleme, RAM bütçesini aşan kısımlar geçici dosyalara taşınır
+            sorter = ExternalSorter(self.sort_memory_mb, self.sort_temp_dir, self.dedup_store)
+            sorter.add(candidates)
+            candidates = sorter.iter_sorted()
+        else:
+            # Sırasız akışta da çıktı normal moddaki gibi tekrarsızdır
+            candidates = self.processor.iter_unique(candidates)
+        if ranker is None and self.reference_mode == 'prioritize':
+            # Sıralamadan sonra uygulanır: bilinen şifreler çıktının başına alınır
+            # (olasılık sıralamasında bunun yerine skor ödülü kullanılır)
+            candidates = self.processor.apply_reference(candidates)
+        shard_mode = self.output_shard_mode
+        if self.output_shards > 1 and shard_mode == 'range':
+            # Akış modunda toplam sayı önceden bilinmediği için aralık bazlı parçalama yapılamaz
+            print(f"{Fore.YELLOW}⚠️  Akış modunda aralık parçalama desteklenmiyor, hash kullanılacak.")
+            shard_mode = 'hash'
+        saved_count = self.processor.save_wordlist_stream(
+            candidates, output_file, buffer_lines=self.stream_buffer_lines,
+            compression=self.output_compression, shards=self.output_shards, shard_mode=shard_mode
+        )
+        stage['items_out'] = saved_count
+        return saved_count
+    
+    def _create_ranker(self, user_info: UserInfo, base_words: List[str],
+                       enhanced_words: List[str]) -> MarkovRanker:
+        print(f"{Fore.YELLOW}📈 Adaylar olasılığa göre sıralanıyor...")
+        ranker = MarkovRanker(order=self.rank_markov_order)
+        if self.rank_reference_wordlist and os.path.exists(self.rank_reference_wordlist):
+            trained = ranker.train_file(self.rank_reference_wordlist)
+            print(f"{Fore.CYAN}🔍 Markov modeli {trained} referans kelimeyle eğitildi")
+        else:
+            # Referans liste yoksa model AI kelimeleriyle eğitilir
+            ranker.train(base_words + enhanced_words)
+        ranker.set_boosts(base_words, user_info)
+        if self.processor.reference_index is not None and self.reference_mode == 'prioritize':
+            ranker.set_reference(self.processor.reference_index, self.reference_boost)
+        return ranker
+    
+    def _merge_into_existing(self, output_file: str):
+        if not self.merge_into:
+            return
+        if self.output_compression != 'none' or self.output_shards > 1:
+            print(f"{Fore.YELLOW}⚠️  Birleştirme sadece tek parça düz metin çıktıda yapılabilir, atlanıyor.")
+            return
+        
+        print(f"{Fore.YELLOW}🔗 Mevcut wordlist ile birleştiriliyor: {self.merge_into}")
+        sorter = ExternalSorter(self.sort_memory_mb, self.sort_temp_dir, self.dedup_store)
+        total, added = sorter.merge_into(self.merge_into, iter_file_lines(output_file))
+        print(f"{Fore.GREEN}✓ {added} yeni kelime eklendi, toplam {total} kelime ({self.merge_into})")
+    
+    def run_batch(self, profile_path: str, output_dir: str, merged_output: Optional[str] = None):
+        try:
+            self._print_banner()
+            self._print_configuration()
+            
+            print(f"\n{Fore.YELLOW}📋 ADIM 1: Profil Dosyasını Okuma")
+            # Toplu mod süreç havuzu (multiprocessing) gerektirir; sadece bu modda yüklenir
+            from models.batch_runner import BatchRunner
+            profiles = self.user_collector.load_profiles(profile_path)
+            if not profiles:
+                print(f"{Fore.YELLOW}⚠️  Dosyada profil bulunamadı.")
+                return
+            
+            print(f"\n{Fore.YELLOW}🤖 ADIM 2: AI Bağlantısı Kurma")
+            self.gemini_generator = self._create_generator()
+            
+            print(f"\n{Fore.YELLOW}📦 ADIM 3-7: Profillerin Toplu İşlenmesi")
+            runner = BatchRunner(
+                self.gemini_generator, output_dir,
+                ai_concurrency=self.ai_concurrency,
+                cpu_workers=self.variation_workers,
+                profile_workers=self.batch_profile_workers,
+                merged_output=merged_output,
+                sort_memory_mb=self.sort_memory_mb,
+                processor=self.processor,
+                generate_base_words=self._generate_base_words,
+                enhance_wordlist=self._enhance_wordlist,
+                compression=self.output_compression,
+                shards=self.output_shards,
+                shard_mode=self.output_shard_mode,
+            )
+            summary = runner.run(profiles)
             
+            print(f"\n{Fore.CYAN}📊 TOPLU İŞLEM İSTATİSTİKLERİ:")
+            print(f"{Fore.WHITE}├─ Profil: {summary['profiles']}")
+            print(f"{Fore.WHITE}├─ Başarılı / Başarısız: {summary['succeeded']} / {summary['failed']}")
+            print(f"{Fore.WHITE}├─ Toplam Kelime: {summary['words']:,}")
+            if 'merged_words' in summary:
+                print(f"{Fore.WHITE}├─ Birleşik Liste: {summary['merged_words']:,} ({output_path(merged_output, self.output_compression)})")
+            print(f"{Fore.GREEN}└─ Çıktı Dizini: {output_dir}")
+        
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}⚠️  İşlem kullanıcı tarafından iptal edildi.")
         except Exception as e:
@@ -127,6 +760,43 @@ class WordlistCreator:
                 import traceback
                 traceback.print_exc()
     
+    def serve(self, address: Optional[str] = None):
+        address = address or self.service_address
+        try:
+            self._print_banner()
+            self._print_configuration()
+            
+            # Servis HTTP sunucusu ve süreç havuzu gerektirir; sadece bu modda yüklenir
+            from models.service import WordlistService
+            
+            print(f"\n{Fore.YELLOW}🤖 AI Bağlantısı Kurma")
+            self.gemini_generator = self._create_generator()
+            if hasattr(self.gemini_generator, '_ensure_model'):
+                # Model istemcisi ilk işten önce kurulur ve servis boyunca sıcak kalır
+                self.gemini_generator._ensure_model()
+            
+            service = WordlistService(
+                self.gemini_generator, self.processor,
+                job_workers=self.service_job_workers,
+                ai_concurrency=self.ai_concurrency,
+                cpu_workers=self.variation_workers,
+                max_queue=self.service_max_queue,
+                max_finished=self.service_max_finished,
+                chunk_lines=self.stream_buffer_lines,
+                debug=self.debug_mode,
+                generate_base_words=self._generate_base_words,
+                enhance_wordlist=self._enhance_wordlist,
+            )
+            service.serve_forever(address)
+        
+        except KeyboardInterrupt:
+            print(f"\n{Fore.YELLOW}⚠️  Servis durduruldu.")
+        except Exception as e:
+            print(f"\n{Fore.RED}❌ Servis hatası: {e}")
+            if self.debug_mode:
+                import traceback
+                traceback.print_exc()
+    
     def _show_collected_info(self, user_info: UserInfo):
         non_empty = self.user_collector.get_non_empty_fields(user_info)
         
@@ -147,6 +817,45 @@ class WordlistCreator:
         print(f"{Fore.WHITE}├─ AI Geliştirmeler: {len(enhanced_words)}")
         print(f"{Fore.WHITE}├─ Toplam Ham: {len(base_words) + len(variations) + len(enhanced_words)}")
         print(f"{Fore.GREEN}└─ Final Temiz Wordlist: {len(final_wordlist)}")
+        
+        expansion = self.processor.last_expansion_stats
+        if expansion:
+            print(f"\n{Fore.CYAN}⚡ VARYASYON PERFORMANSI:")
+            print(f"{Fore.WHITE}├─ Süreç / Parça: {expansion['workers']} / {expansion['chunks']}")
+            print(f"{Fore.WHITE}├─ Geçen Süre: {expansion['wall_time']:.3f} sn")
+            print(f"{Fore.WHITE}├─ Toplam CPU Süresi: {expansion['cpu_time']:.3f} sn")
+            print(f"{Fore.GREEN}└─ CPU Kullanımı (CPU/Geçen): {expansion['cpu_utilisation']:.2f} çekirdek")
+        
+        enhance = self.gemini_generator.last_enhance_stats if self.gemini_generator else {}
+        if enhance:
+            print(f"\n{Fore.CYAN}🤖 AI GELİŞTİRME:")
+            print(f"{Fore.WHITE}├─ Parça Sayısı: {enhance['chunks']}")
+            print(f"{Fore.WHITE}├─ Başarısız Parça: {enhance['failed_chunks']}")
+            print(f"{Fore.GREEN}└─ Tekrar Denemeler: {enhance['retries']}")
+        
+        adaptive = getattr(self.gemini_generator, 'last_adaptive_stats', None) or {}
+        if adaptive:
+            print(f"\n{Fore.CYAN}🎯 AI VERİMİ (yeni ve geçerli kelime):")
+            for name, label in (('base_words', 'Temel Kelimeler'), ('enhanced_words', 'Geliştirme')):
+                if name in adaptive:
+                    stats = adaptive[name]
+                    per_call = ', '.join(str(call['new']) for call in stats['per_call'])
+                    print(f"{Fore.WHITE}├─ {label}: {stats['calls']} çağrı ({per_call}), "
+                          f"{stats['new_per_call']:.1f}/çağrı, {stats['new_per_1k_tokens']:.0f}/1k token")
+            total_new = sum(stats['new_words'] for stats in adaptive.values())
+            total_tokens = sum(stats['output_tokens'] for stats in adaptive.values())
+            print(f"{Fore.GREEN}└─ Toplam: {total_new} yeni kelime, {total_tokens:,} çıktı token")
+        
+        reference = self.processor.reference_index
+        if reference is not None:
+            print(f"\n{Fore.CYAN}🗂️  REFERANS DİZİNİ ({self.reference_mode}):")
+            print(f"{Fore.WHITE}├─ Sorgu: {reference.queries:,}")
+            print(f"{Fore.GREEN}└─ Eşleşme: {reference.hits:,}")
+        
+        if self.response_cache is not None:
+            print(f"\n{Fore.CYAN}🗄️  AI ÖNBELLEĞİ:")
+            print(f"{Fore.WHITE}├─ İsabet: {self.response_cache.hits}")
+            print(f"{Fore.GREEN}└─ Iskalama: {self.response_cache.misses}")
     
     def _get_output_filename(self) -> str:
         print(f"\n{Fore.CYAN}💾 Dosya Kaydetme Seçenekleri:")
@@ -156,17 +865,41 @@ class WordlistCreator:
         
         choice = input(f"{Fore.YELLOW}Seçiminiz (1-3): ").strip()
         
+        filename = self.default_output_file
         if choice == "2":
             custom_name = input(f"{Fore.WHITE}Dosya adı (.txt otomatik eklenecek): ").strip()
             if custom_name:
                 if not custom_name.endswith('.txt'):
                     custom_name += '.txt'
-                return custom_name
+                filename = custom_name
         elif choice == "3":
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            return f"wordlist_{timestamp}.txt"
+            filename = f"wordlist_{timestamp}.txt"
+        
+        self._choose_output_format()
+        return output_path(filename, self.output_compression)
+    
+    def _choose_output_format(self):
+        formats = ['none', 'gzip', 'xz', 'zstd']
+        print(f"\n{Fore.CYAN}📦 Çıktı Formatı (varsayılan: {self.output_compression}):")
+        print(f"{Fore.WHITE}1. Düz metin")
+        print(f"{Fore.WHITE}2. gzip (.gz)")
+        print(f"{Fore.WHITE}3. xz (.xz)")
+        print(f"{Fore.WHITE}4. zstd (.zst)")
+        
+        choice = input(f"{Fore.YELLOW}Seçiminiz (1-4): ").strip()
+        if choice in ('1', '2', '3', '4'):
+            self.output_compression = formats[int(choice) - 1]
         
-        return self.default_output_file
+        shards = input(f"{Fore.WHITE}Parça sayısı (varsayılan: {self.output_shards}): ").strip()
+        if shards.isdigit() and int(shards) > 0:
+            self.output_shards = int(shards)
+        
+        if self.output_shards > 1:
+            mode = input(f"{Fore.WHITE}Parçalama türü - hash/range "
+                         f"(varsayılan: {self.output_shard_mode}): ").strip().lower()
+            if mode in SHARD_MODES:
+                self.output_shard_mode = mode
     
     def _show_completion_message(self, filename: str, word_count: int):
         completion_message = f"""
@@ -181,20 +914,71 @@ class WordlistCreator:
         """
         print(completion_message)
 
+def parse_shard(value: str) -> Tuple[int, int]:
+    # "i/N" (1 tabanlı) -> (0 tabanlı parça, parça sayısı)
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"parça 'i/N' biçiminde olmalı: {value}")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"parça numarası 1 ile {count} arasında olmalı: {value}")
+    return index - 1, count
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="AI destekli kişiselleştirilmiş wordlist oluşturucu")
+    parser.add_argument('--offline', action='store_true', default=None,
+                        help="Sadece AI önbelleğini kullan, önbellekte olmayan istekte dur")
+    parser.add_argument('--local', action='store_true', default=None,
+                        help="AI kullanmadan temel kelimeleri profil alanlarından üret")
+    parser.add_argument('--resume', action='store_true',
+                        help="Son oturumun profil bilgileri ve tamamlanan aşamalarıyla devam et")
+    parser.add_argument('--batch', metavar='DOSYA',
+                        help="Profilleri JSONL/CSV dosyasından oku (etkileşimsiz toplu mod)")
+    parser.add_argument('--output-dir', default='wordlists',
+                        help="Toplu modda profil wordlist'lerinin yazılacağı dizin")
+    parser.add_argument('--merged', metavar='DOSYA',
+                        help="Toplu modda tüm profillerin birleşik wordlist dosyası")
+    parser.add_argument('--serve', metavar='ADRES', nargs='?', const='',
+                        help="Yerel HTTP servisi olarak çalış (host:port veya unix:/yol/soket; "
+                             "boşsa SERVICE_ADDRESS)")
+    parser.add_argument('--build-index', metavar='DIZIN',
+                        help="--index-sources dosyalarından mmap ile okunan referans dizini oluştur")
+    parser.add_argument('--index-sources', metavar='DOSYA', nargs='+', default=[],
+                        help="Referans dizinine eklenecek wordlist dosyaları (ör. eski çıktılar, sızıntı listeleri)")
+    parser.add_argument('--verify-hashes', metavar='DOSYA',
+                        help="Wordlist yazmadan adayları bu dosyadaki hash'lere karşı doğrula")
+    parser.add_argument('--hash-type', choices=('auto',) + HASH_TYPES, default='auto',
+                        help="Hash türü (auto: uzunluğa göre; 32 karakter hem MD5 hem NTLM denenir)")
+    parser.add_argument('--shard', metavar='i/N', type=parse_shard, default=(0, 1),
+                        help="Varyasyon anahtar uzayının N parçasından i. parçasını üret (1 tabanlı; "
+                             "parçaların birleşimi tek düğüm çıktısına eşittir)")
+    parser.add_argument('--merge-into', metavar='DOSYA',
+                        help="Çıktıyı mevcut sıralı wordlist dosyasıyla belleğe almadan birleştir")
+    return parser.parse_args(argv)
+
 def main():
+    args = parse_args()
     try:
-        # Gerekli paketlerin yüklü olup olmadığını kontrol et
+        # Gerekli paketlerin yüklü olup olmadığını kontrol et (içe aktarmadan; SDK'nın
+        # yüklenmesi saniyeler sürebilir ve yerel modda hiç gerekmez)
+        load_dotenv()
+        local = args.local if args.local is not None else \
+            os.getenv('LOCAL_MODE', 'False').lower() == 'true'
+        # Dizin oluşturma AI kullanmaz; API anahtarı ve SDK gerekmez
+        local = local or bool(args.build_index)
         required_packages = {
             'colorama': 'colorama',
             'python-dotenv': 'dotenv',
-            'google-generativeai': 'google.generativeai'
         }
+        if not local:
+            required_packages['google-generativeai'] = 'google.generativeai'
         missing_packages = []
         
         for package_name, import_name in required_packages.items():
             try:
-                __import__(import_name)
-            except ImportError:
+                if importlib.util.find_spec(import_name) is None:
+                    missing_packages.append(package_name)
+            except ModuleNotFoundError:
                 missing_packages.append(package_name)
         
         if missing_packages:
@@ -203,8 +987,17 @@ def main():
             return
         
         # Ana uygulamayı başlat
-        creator = WordlistCreator()
-        creator.create_wordlist()
+        creator = WordlistCreator(offline=args.offline, merge_into=args.merge_into, local=local,
+                                  resume=args.resume, verify_hashes=args.verify_hashes,
+                                  hash_type=args.hash_type, shard=args.shard)
+        if args.build_index:
+            creator.build_reference_index(args.build_index, args.index_sources)
+        elif args.serve is not None:
+            creator.serve(args.serve or None)
+        elif args.batch:
+            creator.run_batch(args.batch, args.output_dir, args.merged)
+        else:
+            creator.create_wordlist()
         
     except Exception as e:
         print(f"{Fore.RED}❌ Program başlatma hatası: {e}")